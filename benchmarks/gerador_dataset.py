@@ -0,0 +1,305 @@
+"""Gerador de datasets sintéticos no formato exato do CSV de jogadores FIFA.
+
+Produz as mesmas colunas, na mesma ordem e com os mesmos formatos do CSV do
+Kaggle usado pela aplicação (``tests/.../datasets/mock_data.csv``), incluindo
+a coluna de índice sem nome. As distribuições imitam as do FIFA 23:
+
+- cerca de 27 jogadores por clube, até 650 clubes;
+- até 160 nacionalidades, com poucas concentrando a maioria dos jogadores;
+- overall em torno de 66, com valor de mercado, salário e cláusula de
+  rescisão crescendo exponencialmente com ele;
+- alguns jogadores sem clube, sem data de contratação e sem cláusula.
+
+A geração é vetorizada e gravada em blocos, de modo que 5 milhões de linhas
+cabem em pouca memória. A mesma semente gera sempre o mesmo arquivo.
+
+Uso:
+    python benchmarks/gerador_dataset.py fifa_1m.csv --linhas 1000000
+"""
+import argparse
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+COLUNAS_CSV = [
+    'ID', 'Name', 'Age', 'Photo', 'Nationality', 'Flag', 'Overall',
+    'Potential', 'Club', 'Club Logo', 'Value(£)', 'Wage(£)', 'Special',
+    'Preferred Foot', 'International Reputation', 'Weak Foot', 'Skill Moves',
+    'Work Rate', 'Body Type', 'Real Face', 'Position', 'Joined',
+    'Loaned From', 'Contract Valid Until', 'Height(cm.)', 'Weight(lbs.)',
+    'Release Clause(£)', 'Kit Number', 'Best Overall Rating', 'Year_Joined',
+]
+"""Colunas do CSV do FIFA 23, após a coluna de índice sem nome."""
+
+CLUBES_FIFA = 650
+NACIONALIDADES_FIFA = 160
+JOGADORES_POR_CLUBE = 27
+LINHAS_POR_BLOCO = 100_000
+
+PAISES = [
+    ('England', 'gb-eng'), ('Germany', 'de'), ('Spain', 'es'),
+    ('France', 'fr'), ('Argentina', 'ar'), ('Brazil', 'br'),
+    ('Japan', 'jp'), ('Netherlands', 'nl'), ('Italy', 'it'),
+    ('United States', 'us'), ('Poland', 'pl'), ('Portugal', 'pt'),
+    ('Republic of Ireland', 'ie'), ('Sweden', 'se'), ('China PR', 'cn'),
+    ('Norway', 'no'), ('Saudi Arabia', 'sa'), ('Korea Republic', 'kr'),
+    ('Colombia', 'co'), ('Denmark', 'dk'), ('Scotland', 'gb-sct'),
+    ('Belgium', 'be'), ('Austria', 'at'), ('Mexico', 'mx'),
+    ('Switzerland', 'ch'), ('Turkey', 'tr'), ('Australia', 'au'),
+    ('Chile', 'cl'), ('Uruguay', 'uy'), ('Romania', 'ro'),
+    ('Croatia', 'hr'), ('Serbia', 'rs'), ('Nigeria', 'ng'),
+    ('Senegal', 'sn'), ('Ghana', 'gh'), ('Morocco', 'ma'),
+    ('Ivory Coast', 'ci'), ('Cameroon', 'cm'), ('Wales', 'gb-wls'),
+    ('Czech Republic', 'cz'), ('Ukraine', 'ua'), ('Greece', 'gr'),
+    ('Paraguay', 'py'), ('Ecuador', 'ec'), ('Venezuela', 've'),
+    ('Peru', 'pe'), ('Canada', 'ca'), ('Russia', 'ru'),
+    ('Slovakia', 'sk'), ('Hungary', 'hu'),
+]
+"""Nacionalidades mais frequentes, com o código usado na URL da bandeira."""
+
+CIDADES = [
+    'Manchester', 'Liverpool', 'London', 'Birmingham', 'Leeds', 'Madrid',
+    'Barcelona', 'Sevilla', 'Valencia', 'Bilbao', 'Milano', 'Torino',
+    'Roma', 'Napoli', 'Firenze', 'Genova', 'München', 'Dortmund', 'Berlin',
+    'Hamburg', 'Köln', 'Stuttgart', 'Paris', 'Lyon', 'Marseille', 'Lille',
+    'Nantes', 'Nice', 'Lisboa', 'Porto', 'Braga', 'Amsterdam', 'Rotterdam',
+    'Eindhoven', 'Glasgow', 'Edinburgh', 'Dublin', 'Cork', 'Brugge',
+    'Antwerpen', 'Wien', 'Salzburg', 'Zürich', 'Basel', 'Istanbul',
+    'Ankara', 'Athens', 'Warszawa', 'Kraków', 'Praha', 'København',
+    'Stockholm', 'Göteborg', 'Oslo', 'Bergen', 'Helsinki', 'Kyiv',
+    'Moskva', 'Beograd', 'Zagreb', 'Bucuresti', 'Budapest', 'Sofia',
+    'Buenos Aires', 'Rosario', 'Córdoba', 'São Paulo', 'Rio de Janeiro',
+    'Porto Alegre', 'Belo Horizonte', 'Santiago', 'Montevideo', 'Bogotá',
+    'Medellín', 'Lima', 'Quito', 'Asunción', 'Caracas', 'Ciudad de México',
+    'Guadalajara', 'Monterrey', 'Los Angeles', 'New York', 'Seattle',
+    'Toronto', 'Vancouver', 'Tokyo', 'Osaka', 'Yokohama', 'Seoul', 'Busan',
+    'Beijing', 'Shanghai', 'Guangzhou', 'Riyadh', 'Jeddah', 'Sydney',
+    'Melbourne', 'Brisbane', 'Cairo', 'Casablanca', 'Lagos', 'Accra',
+    'Dakar', 'Abidjan', 'Johannesburg', 'Cape Town', 'Tunis', 'Algiers',
+    'Doha', 'Dubai', 'Tehran', 'Tashkent', 'Almaty', 'Baku', 'Tbilisi',
+    'Yerevan', 'Minsk', 'Vilnius', 'Riga', 'Tallinn', 'Ljubljana',
+    'Bratislava', 'Cluj', 'Plovdiv', 'Thessaloniki', 'Izmir', 'Trabzon',
+    'Bursa', 'Konya', 'Malmö', 'Aarhus', 'Odense', 'Tromsø',
+]
+SUFIXOS_CLUBE = ['FC', 'United', 'City', 'Athletic', 'SC', 'CF']
+
+INICIAIS = list('ABCDEFGHIJKLMNOPRSTVWY')
+SOBRENOMES = [
+    'Silva', 'Santos', 'Müller', 'Schmidt', 'García', 'Fernández',
+    'Rodríguez', 'González', 'Martínez', 'López', 'Rossi', 'Bianchi',
+    'Smith', 'Jones', 'Williams', 'Brown', 'Taylor', 'Martin', 'Bernard',
+    'Dubois', 'Kowalski', 'Nowak', 'Jansen', 'de Jong', 'Pereira',
+    'Costa', 'Oliveira', 'Sato', 'Suzuki', 'Kim', 'Lee', 'Park', 'Wang',
+    'Li', 'Zhang', 'Andersen', 'Nielsen', 'Hansen', 'Johansson',
+    'Karlsson', 'Yılmaz', 'Kaya', 'Popescu', 'Horvat', 'Novak',
+    'Petrović', 'Ivanov', 'Kovalenko', 'Mensah', 'Diallo', 'Traoré',
+    'Koné', 'Okafor', 'Haddad', 'Acuña', 'Goretzka', 'Fernandes',
+]
+
+POSICOES = [
+    'GK', 'CB', 'LCB', 'RCB', 'LB', 'RB', 'CDM', 'LDM', 'RDM', 'CM', 'LCM',
+    'RCM', 'CAM', 'LM', 'RM', 'LW', 'RW', 'ST', 'LS', 'RS', 'CF', 'SUB',
+    'RES',
+]
+RITMOS = ['High', 'Medium', 'Low']
+CORPOS = ['Normal (170-185)', 'Lean (170-185)', 'Stocky (170-185)',
+          'Normal (185+)', 'Lean (185+)', 'Normal (170-)', 'Unique']
+
+
+def _pesos_zipf(quantidade: int, expoente: float = 1.1) -> np.ndarray:
+    pesos = 1.0 / np.arange(1, quantidade + 1) ** expoente
+    return pesos / pesos.sum()
+
+
+def _nacionalidades(quantidade: int) -> pd.DataFrame:
+    nomes = [nome for nome, _ in PAISES]
+    codigos = [codigo for _, codigo in PAISES]
+    for extra in range(len(PAISES), quantidade):
+        nomes.append(f'Nation {extra + 1}')
+        codigos.append(f'n{extra + 1}')
+    return pd.DataFrame({
+        'Nationality': nomes[:quantidade],
+        'Flag': [f'https://cdn.sofifa.net/flags/{codigo}.png'
+                 for codigo in codigos[:quantidade]],
+    })
+
+
+def _clubes(quantidade: int) -> pd.DataFrame:
+    nomes = [
+        f'{cidade} {sufixo}'
+        for sufixo in SUFIXOS_CLUBE for cidade in CIDADES
+    ]
+    while len(nomes) < quantidade:
+        nomes.append(f'Club {len(nomes) + 1}')
+    return pd.DataFrame({
+        'Club': nomes[:quantidade],
+        'Club Logo': [f'https://cdn.sofifa.net/teams/{codigo}/30.png'
+                      for codigo in range(1, quantidade + 1)],
+    })
+
+
+def gerar_bloco(
+        rng: np.random.Generator,
+        inicio: int,
+        linhas: int,
+        clubes: pd.DataFrame,
+        nacionalidades: pd.DataFrame) -> pd.DataFrame:
+    """Gera ``linhas`` jogadores a partir da linha ``inicio``.
+
+    Args:
+        rng (np.random.Generator): Gerador de números aleatórios.
+        inicio (int): Posição da primeira linha, usada no índice e nos IDs.
+        linhas (int): Quantidade de jogadores do bloco.
+        clubes (pd.DataFrame): Clubes e seus escudos.
+        nacionalidades (pd.DataFrame): Nacionalidades e suas bandeiras.
+
+    Returns:
+        pd.DataFrame: Bloco com as colunas de COLUNAS_CSV.
+    """
+    ids = 100_000 + inicio + np.arange(linhas)
+    idade = rng.integers(16, 41, linhas)
+    overall = np.clip(np.rint(rng.normal(66, 7, linhas)), 43, 94).astype(int)
+    potential = np.maximum(
+        overall, overall + np.clip(28 - idade, 0, None)
+        * rng.integers(0, 2, linhas))
+
+    indice_nacao = rng.choice(
+        len(nacionalidades), linhas, p=_pesos_zipf(len(nacionalidades)))
+    indice_clube = rng.integers(0, len(clubes), linhas)
+    sem_clube = rng.random(linhas) < 0.01
+    club = clubes['Club'].to_numpy()[indice_clube].astype(object)
+    club_logo = clubes['Club Logo'].to_numpy()[indice_clube].astype(object)
+    club[sem_clube] = np.nan
+
+    value = np.round(np.exp((overall - 40) * 0.2 + 8.5), -3)
+    value[sem_clube] = 0.0
+    wage = np.maximum(np.round(value / 600, -2), 500.0)
+    wage[sem_clube] = 0.0
+    release = np.round(value * rng.uniform(1.5, 2.1, linhas), -3)
+    release[sem_clube | (rng.random(linhas) < 0.05)] = np.nan
+
+    ano_joined = rng.integers(2008, 2023, linhas)
+    joined = pd.to_datetime(pd.DataFrame({
+        'year': ano_joined,
+        'month': rng.integers(1, 13, linhas),
+        'day': rng.integers(1, 29, linhas),
+    })).dt.strftime('%Y-%m-%d').to_numpy(dtype=object)
+    emprestado = rng.random(linhas) < 0.04
+    joined[emprestado | sem_clube] = np.nan
+    loaned_from = np.full(linhas, 'None', dtype=object)
+    loaned_from[emprestado] = clubes['Club'].to_numpy()[
+        rng.integers(0, len(clubes), int(emprestado.sum()))]
+
+    contrato = (ano_joined + rng.integers(1, 6, linhas)).clip(2023, 2032)
+    contrato = contrato.astype(float)
+    contrato[sem_clube] = np.nan
+
+    altura = np.round(rng.normal(181, 7, linhas)).clip(155, 206)
+    peso = np.round((altura - 100) * rng.uniform(0.8, 1.0, linhas)
+                    * 2.20462, 3)
+
+    nomes = (np.array(INICIAIS, dtype=object)[
+        rng.integers(0, len(INICIAIS), linhas)] + '. '
+        + np.array(SOBRENOMES, dtype=object)[
+            rng.integers(0, len(SOBRENOMES), linhas)])
+    fotos = [
+        f'https://cdn.sofifa.net/players/{i // 1000:03d}/{i % 1000:03d}/23_60.png'
+        for i in ids
+    ]
+    ritmo = np.array(RITMOS, dtype=object)
+
+    df = pd.DataFrame({
+        'ID': ids,
+        'Name': nomes,
+        'Age': idade,
+        'Photo': fotos,
+        'Nationality': nacionalidades['Nationality'].to_numpy()[indice_nacao],
+        'Flag': nacionalidades['Flag'].to_numpy()[indice_nacao],
+        'Overall': overall,
+        'Potential': potential,
+        'Club': club,
+        'Club Logo': club_logo,
+        'Value(£)': value,
+        'Wage(£)': wage,
+        'Special': overall * 26 + rng.integers(-150, 150, linhas),
+        'Preferred Foot': np.where(
+            rng.random(linhas) < 0.76, 'Right', 'Left'),
+        'International Reputation': np.clip(
+            (overall - 60) // 8, 1, 5).astype(float),
+        'Weak Foot': rng.integers(1, 6, linhas).astype(float),
+        'Skill Moves': rng.integers(1, 6, linhas).astype(float),
+        'Work Rate': (ritmo[rng.integers(0, 3, linhas)] + '/ '
+                      + ritmo[rng.integers(0, 3, linhas)]),
+        'Body Type': np.array(CORPOS, dtype=object)[
+            rng.integers(0, len(CORPOS), linhas)],
+        'Real Face': np.where(overall >= 80, 'Yes', 'No'),
+        'Position': np.array(POSICOES, dtype=object)[
+            rng.integers(0, len(POSICOES), linhas)],
+        'Joined': joined,
+        'Loaned From': loaned_from,
+        'Contract Valid Until': contrato,
+        'Height(cm.)': altura,
+        'Weight(lbs.)': peso,
+        'Release Clause(£)': release,
+        'Kit Number': rng.integers(1, 100, linhas).astype(float),
+        'Best Overall Rating': 0.0,
+        'Year_Joined': ano_joined,
+    }, index=pd.RangeIndex(inicio, inicio + linhas))
+    return df[COLUNAS_CSV]
+
+
+def gerar_csv(
+        path: Path,
+        linhas: int,
+        seed: int = 23,
+        clubes: Optional[int] = None,
+        nacionalidades: int = NACIONALIDADES_FIFA) -> Path:
+    """Grava um CSV sintético de jogadores.
+
+    Args:
+        path (Path): Arquivo de destino.
+        linhas (int): Quantidade de jogadores, de 1 mil a 5 milhões.
+        seed (int): Semente do gerador; a mesma semente gera o mesmo
+            arquivo.
+        clubes (Optional[int]): Quantidade de clubes; None usa cerca de
+            27 jogadores por clube, até 650 clubes.
+        nacionalidades (int): Quantidade de nacionalidades.
+
+    Returns:
+        Path: O caminho do arquivo gravado.
+    """
+    if clubes is None:
+        clubes = min(CLUBES_FIFA, max(1, linhas // JOGADORES_POR_CLUBE))
+    tabela_clubes = _clubes(clubes)
+    tabela_nacoes = _nacionalidades(nacionalidades)
+    rng = np.random.default_rng(seed)
+
+    with open(path, 'w', encoding='utf-8', newline='') as arquivo:
+        for inicio in range(0, linhas, LINHAS_POR_BLOCO):
+            bloco = gerar_bloco(
+                rng, inicio, min(LINHAS_POR_BLOCO, linhas - inicio),
+                tabela_clubes, tabela_nacoes)
+            bloco.to_csv(arquivo, header=inicio == 0)
+    return Path(path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('destino', type=Path)
+    parser.add_argument('--linhas', type=int, default=17_000)
+    parser.add_argument('--seed', type=int, default=23)
+    parser.add_argument('--clubes', type=int, default=None)
+    parser.add_argument(
+        '--nacionalidades', type=int, default=NACIONALIDADES_FIFA)
+    args = parser.parse_args()
+
+    gerar_csv(
+        args.destino, args.linhas, args.seed, args.clubes,
+        args.nacionalidades)
+    print(f'{args.linhas} jogadores gravados em {args.destino}')
+
+
+if __name__ == '__main__':
+    main()
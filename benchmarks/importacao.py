@@ -0,0 +1,161 @@
+"""Benchmark do tempo de importação dos módulos usados na partida da app.
+
+Cada módulo é importado em um interpretador novo com ``python -X importtime``,
+depois do ``streamlit``, que a aplicação sempre carrega. Vale o menor tempo
+acumulado entre as repetições. O script termina com código 1 quando algum
+módulo passa do seu orçamento ou quando um módulo da partida carrega a pilha
+de dados (pandas, numpy, pyarrow), que deve ficar para as páginas que
+mostram dados.
+
+Uso:
+    python benchmarks/importacao.py --repeticoes 5 --json importacao.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ORCAMENTO_MS: Dict[str, float] = {
+    'streamlit_fifa_py_estudo.app.inicializacao': 100,
+    'streamlit_fifa_py_estudo.app.utils.profiling': 100,
+    'streamlit_fifa_py_estudo.app.features.features_presenter': 2_000,
+}
+"""Tempo acumulado máximo, em milissegundos, de cada módulo medido."""
+
+MODULOS_PARTIDA = (
+    'streamlit_fifa_py_estudo.app.inicializacao',
+    'streamlit_fifa_py_estudo.app.utils.profiling',
+)
+"""Módulos importados pelo main.py, que não podem carregar a pilha de dados."""
+
+PILHA_DADOS = ('pandas', 'numpy', 'pyarrow', 'py_return_success_or_error')
+
+
+@dataclass(frozen=True)
+class MedidaImportacao:
+    """Tempo de importação de um módulo.
+
+    Attributes:
+        modulo (str): Nome do módulo.
+        acumulado_ms (float): Tempo acumulado, com os módulos que ele importa.
+        orcamento_ms (float): Tempo máximo permitido.
+        mais_lentos (List[Tuple[str, float]]): Módulos importados com maior
+            tempo próprio, em milissegundos.
+        pilha_dados (List[str]): Módulos da pilha de dados carregados.
+    """
+    modulo: str
+    acumulado_ms: float
+    orcamento_ms: float
+    mais_lentos: List[Tuple[str, float]]
+    pilha_dados: List[str]
+
+
+def importar(modulo: str) -> Tuple[Dict[str, Tuple[float, float]], List[str]]:
+    """Importa o módulo em um interpretador novo.
+
+    Args:
+        modulo (str): Nome do módulo.
+
+    Returns:
+        Tuple[Dict[str, Tuple[float, float]], List[str]]: Tempos próprio e
+            acumulado, em milissegundos, de cada módulo importado depois do
+            streamlit, e a lista dos módulos carregados ao final.
+    """
+    codigo = (
+        'import streamlit, sys\n'
+        'print("--", flush=True, file=sys.stderr)\n'
+        f'import {modulo}\n'
+        'print(",".join(sys.modules))\n')
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        capture_output=True, text=True, check=True)
+
+    tempos = {}
+    linhas = processo.stderr.split('--\n', 1)[-1].splitlines()
+    for linha in linhas:
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, acumulado, nome = linha[len('import time:'):].split('|')
+        tempos[nome.strip()] = (int(proprio) / 1000, int(acumulado) / 1000)
+    return tempos, processo.stdout.strip().split(',')
+
+
+def medir(modulo: str, repeticoes: int) -> MedidaImportacao:
+    """Mede o tempo de importação de um módulo.
+
+    Args:
+        modulo (str): Nome do módulo.
+        repeticoes (int): Quantidade de importações; vale a mais rápida.
+
+    Returns:
+        MedidaImportacao: Tempo e módulos carregados na importação mais
+            rápida.
+    """
+    tempos, carregados = min(
+        (importar(modulo) for _ in range(repeticoes)),
+        key=lambda resultado: resultado[0][modulo][1])
+    mais_lentos = sorted(
+        ((nome, proprio) for nome, (proprio, _) in tempos.items()),
+        key=lambda item: item[1], reverse=True)[:5]
+    return MedidaImportacao(
+        modulo=modulo,
+        acumulado_ms=tempos[modulo][1],
+        orcamento_ms=ORCAMENTO_MS[modulo],
+        mais_lentos=mais_lentos,
+        pilha_dados=[nome for nome in PILHA_DADOS if nome in carregados],
+    )
+
+
+def problemas(medida: MedidaImportacao) -> List[str]:
+    """Lista os limites violados por uma medida.
+
+    Args:
+        medida (MedidaImportacao): Medida de um módulo.
+
+    Returns:
+        List[str]: Uma mensagem por limite violado.
+    """
+    mensagens = []
+    if medida.acumulado_ms > medida.orcamento_ms:
+        mensagens.append(
+            f'{medida.modulo}: {medida.acumulado_ms:.1f} ms passa do '
+            f'orçamento de {medida.orcamento_ms:.0f} ms')
+    if medida.modulo in MODULOS_PARTIDA and medida.pilha_dados:
+        mensagens.append(
+            f'{medida.modulo}: carrega {", ".join(medida.pilha_dados)} na '
+            'partida')
+    return mensagens
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument(
+        '--json', type=Path, help='grava as medidas neste arquivo')
+    args = parser.parse_args()
+
+    medidas = [medir(modulo, args.repeticoes) for modulo in ORCAMENTO_MS]
+    print(f'{"módulo":<58}{"tempo (ms)":>11}{"orçamento":>11}')
+    for medida in medidas:
+        print(f'{medida.modulo:<58}{medida.acumulado_ms:>11.1f}'
+              f'{medida.orcamento_ms:>11.0f}')
+        for nome, proprio in medida.mais_lentos:
+            print(f'    {nome:<54}{proprio:>11.1f}')
+
+    if args.json is not None:
+        args.json.write_text(
+            json.dumps([asdict(medida) for medida in medidas], indent=2),
+            encoding='utf-8')
+
+    mensagens = [mensagem for medida in medidas
+                 for mensagem in problemas(medida)]
+    for mensagem in mensagens:
+        print(f'FALHA {mensagem}', file=sys.stderr)
+    sys.exit(1 if mensagens else 0)
+
+
+if __name__ == '__main__':
+    main()
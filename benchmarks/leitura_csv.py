@@ -0,0 +1,97 @@
+"""Benchmark de tempo de leitura do CSV com os motores 'c' e 'pyarrow'.
+
+Gera CSVs sintéticos com ``gerador_dataset`` em cada tamanho pedido e mede
+o LoadCsvPandasDatasource, sem cópia colunar, em três leituras:
+
+- completa, com todas as colunas;
+- projetada, apenas com nome, clube e overall;
+- filtrada por clube, que no motor 'c' é lida em blocos.
+
+O motor 'pyarrow' divide o texto entre as threads do pyarrow, de modo que o
+ganho depende da quantidade de núcleos livres da máquina.
+
+Uso:
+    python benchmarks/leitura_csv.py --linhas 17000 500000 5000000
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import pyarrow as pa
+from gerador_dataset import gerar_csv
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.datasource.load_csv_pandas_datasource import (
+    LoadCsvPandasDatasource, )
+from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError
+from streamlit_fifa_py_estudo.app.utils.parameters import LoadCsvParameters
+
+LEITURAS: Dict[str, Dict[str, object]] = {
+    'completa': {},
+    'projetada': {'columns': ('name', 'club', 'overall')},
+    'por clube': {'club': 'Manchester FC'},
+}
+
+
+def cronometrar(funcao: Callable[[], object], repeticoes: int) -> float:
+    """Retorna o menor tempo, em segundos, entre as repetições."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def executar(linhas: int, repeticoes: int) -> List[Tuple[str, float, float]]:
+    """Mede as leituras de um CSV com ``linhas`` jogadores.
+
+    Args:
+        linhas (int): Quantidade de jogadores.
+        repeticoes (int): Repetições de cada medida; vale a menor.
+
+    Returns:
+        List[Tuple[str, float, float]]: Nome de cada leitura e seus tempos,
+            em segundos, com os motores 'c' e 'pyarrow'.
+    """
+    datasource = LoadCsvPandasDatasource()
+    with tempfile.TemporaryDirectory() as pasta:
+        path = Path(pasta) / 'fifa.csv'
+        gerar_csv(path, linhas)
+
+        def ler(engine: str, extras: Dict[str, object]) -> Callable[[], object]:
+            parameters = LoadCsvParameters(
+                file_path=str(path),
+                error=LoadCsvFifaError(),
+                engine=engine,
+                **extras)
+            return lambda: datasource(parameters)
+
+        return [
+            (nome,
+             cronometrar(ler('c', extras), repeticoes),
+             cronometrar(ler('pyarrow', extras), repeticoes))
+            for nome, extras in LEITURAS.items()
+        ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--linhas', type=int, nargs='+', default=[17_000, 500_000, 5_000_000])
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f'núcleos: {os.cpu_count()}, threads do pyarrow: {pa.cpu_count()}')
+    print(f'{"linhas":>10}  {"leitura":<12}{"c (s)":>10}'
+          f'{"pyarrow (s)":>14}{"ganho":>8}')
+    for linhas in args.linhas:
+        for nome, tempo_c, tempo_pyarrow in executar(linhas, args.repeticoes):
+            print(f'{linhas:>10}  {nome:<12}{tempo_c:>10.3f}'
+                  f'{tempo_pyarrow:>14.3f}{tempo_c / tempo_pyarrow:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,109 @@
+"""Benchmark de memória por jogador das representações de FifaPlayer.
+
+Compara os bytes retidos por jogador em cada forma de manter os dados de
+um dataset carregado:
+
+- dataclass com ``__dict__`` mais o dicionário de ``to_dict()``, como a
+  leitura fazia antes da PlayerTable;
+- FifaPlayer atual, com ``__slots__`` e imutável;
+- PlayerTable colunar;
+- uma visão PlayerRow por jogador, sobre a PlayerTable.
+
+Os textos vêm do mesmo DataFrame em todos os casos e não entram na conta,
+de modo que a comparação mede apenas o custo de cada representação.
+
+Uso:
+    python benchmarks/memoria_jogadores.py --linhas 20000
+"""
+import argparse
+import tracemalloc
+from dataclasses import fields, make_dataclass
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import pandas as pd
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.fifa_player import (
+    FifaPlayer, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+
+MOCK_DATA_CSV = (Path(__file__).parents[1] / 'tests' / 'streamlit_fifa_py_estudo'
+                 / 'app' / 'datasets' / 'mock_data.csv')
+
+FifaPlayerLegado = make_dataclass(
+    'FifaPlayerLegado',
+    [(campo.name, campo.type) for campo in fields(FifaPlayer)])
+"""Equivalente ao FifaPlayer anterior: dataclass comum, com ``__dict__``."""
+
+
+def gerar_frame(linhas: int) -> pd.DataFrame:
+    """Repete as linhas do CSV de exemplo até a quantidade pedida."""
+    base = pd.read_csv(MOCK_DATA_CSV, index_col=0)
+    repeticoes = -(-linhas // len(base))
+    df = pd.concat([base] * repeticoes, ignore_index=True).iloc[:linhas]
+    df['ID'] = range(len(df))
+    return df
+
+
+def medir(construir: Callable[[], object]) -> int:
+    """Retorna os bytes alocados e retidos pelo resultado de ``construir``."""
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    resultado = construir()
+    retido = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+    del resultado
+    return retido
+
+
+def executar(linhas: int) -> List[Tuple[str, float]]:
+    """Mede cada representação para um dataset com ``linhas`` jogadores.
+
+    Args:
+        linhas (int): Quantidade de jogadores.
+
+    Returns:
+        List[Tuple[str, float]]: Nome de cada representação e os bytes
+            retidos por jogador.
+    """
+    df = gerar_frame(linhas)
+    players = [FifaPlayer.from_csv_row(row)
+               for row in df.to_dict(orient='records')]
+    nomes = [campo.name for campo in fields(FifaPlayer)]
+    table = PlayerTable.from_csv_frame(df)
+
+    def legado():
+        objetos = [
+            FifaPlayerLegado(*(getattr(player, nome) for nome in nomes))
+            for player in players
+        ]
+        return objetos, [FifaPlayer.to_dict(objeto) for objeto in objetos]
+
+    def slots():
+        return [
+            FifaPlayer(*(getattr(player, nome) for nome in nomes))
+            for player in players
+        ]
+
+    resultados = [
+        ('dataclass + to_dict (antes)', medir(legado)),
+        ('FifaPlayer com __slots__', medir(slots)),
+        ('PlayerTable', medir(lambda: PlayerTable.from_csv_frame(df))),
+        ('PlayerRow por jogador', medir(lambda: list(table.linhas()))),
+    ]
+    return [(nome, retido / linhas) for nome, retido in resultados]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f'{"representação":<30}{"bytes/jogador":>15}')
+    for nome, por_jogador in executar(args.linhas):
+        print(f'{nome:<30}{por_jogador:>15.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,240 @@
+"""Suíte de benchmarks dos caminhos de validação, leitura, filtro e páginas.
+
+Para cada tamanho pedido, gera um CSV sintético com ``gerador_dataset`` e
+mede cada etapa por onde um dataset passa na aplicação:
+
+- ``validate_fifa_csv`` sobre os bytes do upload;
+- ``LoadCsvPandasDatasource`` com os motores 'c' e 'pyarrow';
+- ``LerCsvFifaUseCase``, que soma à leitura os filtros e a ordenação;
+- ``FeaturesPresenter.salvar_csv_fifa``, que valida, grava o CSV e a cópia
+  colunar;
+- ``FeaturesPresenter.ler_csv_fifa`` com o cache vazio, que lê a cópia
+  colunar, e com o cache preenchido;
+- o preparo de dados das páginas: índices da tabela, elenco de um clube
+  (teams) e dados de um jogador (players).
+
+Cada etapa é executada uma vez para medir o tempo e outra, com o
+``tracemalloc`` ativo, para medir o pico de memória alocada pelo Python e
+pelo numpy. Memória alocada pelo próprio pyarrow não é vista pelo
+``tracemalloc``.
+
+O salvamento usa a pasta de datasets da aplicação, com o nome
+``_benchmark_<linhas>``; o arquivo e sua cópia colunar são removidos ao
+final de cada tamanho.
+
+Uso:
+    python benchmarks/suite.py --linhas 1000 17000 500000 --json saida.json
+"""
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pandas as pd
+from gerador_dataset import gerar_csv
+from py_return_success_or_error import SuccessReturn
+
+from streamlit_fifa_py_estudo.app.features.features_presenter import FeaturesPresenter
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.datasource.load_csv_pandas_datasource import (
+    LoadCsvPandasDatasource, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_index import (
+    PlayerIndex, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.usecase.ler_csv_fifa_usecase import (
+    LerCsvFifaUseCase, )
+from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.datasource.salvar_bytes_csv_fifa_datasource import (
+    validate_fifa_csv, )
+from streamlit_fifa_py_estudo.app.utils.catalogo import CATALOGO_DATASETS
+from streamlit_fifa_py_estudo.app.utils.consts import PASTA_DATASETS
+from streamlit_fifa_py_estudo.app.utils.dataset_cache import DATASET_CACHE
+from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError
+from streamlit_fifa_py_estudo.app.utils.parameters import LoadCsvParameters
+from streamlit_fifa_py_estudo.app.utils.sidecar import caminho_sidecar
+
+
+@dataclass(frozen=True)
+class Medida:
+    """Resultado de uma etapa.
+
+    Attributes:
+        linhas (int): Quantidade de jogadores do dataset.
+        etapa (str): Nome da etapa.
+        segundos (float): Tempo de execução.
+        pico_bytes (Optional[int]): Pico de memória alocada durante a etapa,
+            ou None se a memória não foi medida.
+    """
+    linhas: int
+    etapa: str
+    segundos: float
+    pico_bytes: Optional[int]
+
+
+def medir(
+        linhas: int,
+        etapa: str,
+        executar: Callable[[], object],
+        preparar: Callable[[], None] = lambda: None,
+        memoria: bool = True) -> Medida:
+    """Mede o tempo e o pico de memória de uma etapa.
+
+    Args:
+        linhas (int): Quantidade de jogadores do dataset.
+        etapa (str): Nome da etapa.
+        executar (Callable[[], object]): Código medido.
+        preparar (Callable[[], None]): Chamado antes de cada execução, fora
+            da medida, para recolocar o estado inicial da etapa.
+        memoria (bool): Se False, mede apenas o tempo.
+
+    Returns:
+        Medida: Tempo e pico de memória da etapa.
+    """
+    preparar()
+    inicio = time.perf_counter()
+    executar()
+    segundos = time.perf_counter() - inicio
+
+    pico = None
+    if memoria:
+        preparar()
+        tracemalloc.start()
+        base = tracemalloc.get_traced_memory()[0]
+        resultado = executar()
+        pico = tracemalloc.get_traced_memory()[1] - base
+        tracemalloc.stop()
+        del resultado
+    return Medida(linhas, etapa, segundos, pico)
+
+
+def executar(linhas: int, memoria: bool = True) -> List[Medida]:
+    """Mede todas as etapas para um dataset sintético com ``linhas`` jogadores.
+
+    Args:
+        linhas (int): Quantidade de jogadores.
+        memoria (bool): Se False, mede apenas o tempo.
+
+    Returns:
+        List[Medida]: Uma medida por etapa, na ordem em que a aplicação as
+            percorre.
+    """
+    presenter = FeaturesPresenter()
+    nome = f'_benchmark_{linhas}'
+    salvo = PASTA_DATASETS / f'{nome}.csv'
+
+    def esvaziar_cache() -> None:
+        # O salvamento carrega o arquivo e soma seus agregados em segundo
+        # plano; sem esperar, essa carga disputaria o processador com a
+        # leitura medida ou a encontraria pronta no cache
+        presenter.aguardar_segundo_plano()
+        DATASET_CACHE.clear()
+
+    def remover_salvo() -> None:
+        esvaziar_cache()
+        with suppress(OSError):
+            caminho_sidecar(salvo).unlink(missing_ok=True)
+        salvo.unlink(missing_ok=True)
+        CATALOGO_DATASETS.invalidar()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        csv = Path(pasta) / 'fifa.csv'
+        inicio = time.perf_counter()
+        gerar_csv(csv, linhas)
+        medidas = [Medida(linhas, 'gerar CSV', time.perf_counter() - inicio,
+                          None)]
+        bytes_csv = csv.read_bytes()
+
+        def ler(engine: str) -> Callable[[], object]:
+            parameters = LoadCsvParameters(
+                file_path=str(csv), error=LoadCsvFifaError(), engine=engine)
+            return lambda: LoadCsvPandasDatasource()(parameters)
+
+        def usecase() -> object:
+            data = LerCsvFifaUseCase(LoadCsvPandasDatasource())(
+                LoadCsvParameters(
+                    file_path=str(csv), error=LoadCsvFifaError()))
+            assert isinstance(data, SuccessReturn), data.result
+            return data.result
+
+        medidas += [
+            medir(linhas, 'validate_fifa_csv',
+                  lambda: validate_fifa_csv(bytes_csv), memoria=memoria),
+            medir(linhas, 'LoadCsvPandasDatasource c', ler('c'),
+                  memoria=memoria),
+            medir(linhas, 'LoadCsvPandasDatasource pyarrow', ler('pyarrow'),
+                  memoria=memoria),
+            medir(linhas, 'LerCsvFifaUseCase', usecase, memoria=memoria),
+        ]
+
+    try:
+        medidas.append(medir(
+            linhas, 'salvar_csv_fifa',
+            lambda: presenter.salvar_csv_fifa(nome, bytes_csv),
+            remover_salvo, memoria))
+        del bytes_csv
+        medidas += [
+            medir(linhas, 'ler_csv_fifa (cache vazio)',
+                  lambda: presenter.ler_csv_fifa(salvo),
+                  esvaziar_cache, memoria),
+            medir(linhas, 'ler_csv_fifa (cache cheio)',
+                  lambda: presenter.ler_csv_fifa(salvo), memoria=memoria),
+        ]
+
+        table = presenter.ler_csv_fifa(salvo)
+        index = table.indices
+        club = max(index.clubes,
+                   key=lambda clube: len(index.elenco(clube)))
+
+        def elenco() -> pd.DataFrame:
+            df = index.elenco(club).frame.set_index('name')
+            df['wage_formatted'] = df['wage'] / 1e3
+            return df
+
+        def jogador() -> dict:
+            nomes = pd.unique(index.elenco(club).coluna('name'))
+            return index.jogador(index.id_por_nome(club, nomes[0])).to_dict()
+
+        medidas += [
+            medir(linhas, 'páginas: índices', lambda: PlayerIndex(table),
+                  memoria=memoria),
+            medir(linhas, 'páginas: elenco (teams)', elenco,
+                  memoria=memoria),
+            medir(linhas, 'páginas: jogador (players)', jogador,
+                  memoria=memoria),
+        ]
+    finally:
+        remover_salvo()
+    return medidas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        '--linhas', type=int, nargs='+', default=[1_000, 17_000, 100_000])
+    parser.add_argument(
+        '--sem-memoria', action='store_true',
+        help='mede apenas o tempo, sem a segunda execução com tracemalloc')
+    parser.add_argument(
+        '--json', type=Path, help='grava as medidas neste arquivo')
+    args = parser.parse_args()
+
+    medidas: List[Medida] = []
+    print(f'{"linhas":>9}  {"etapa":<34}{"tempo (s)":>10}{"pico (MiB)":>12}')
+    for linhas in args.linhas:
+        for medida in executar(linhas, not args.sem_memoria):
+            medidas.append(medida)
+            pico = ('-' if medida.pico_bytes is None
+                    else f'{medida.pico_bytes / 2**20:.1f}')
+            print(f'{linhas:>9}  {medida.etapa:<34}'
+                  f'{medida.segundos:>10.3f}{pico:>12}')
+
+    if args.json is not None:
+        args.json.write_text(
+            json.dumps([asdict(medida) for medida in medidas], indent=2),
+            encoding='utf-8')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,8 @@
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from datetime import date
 from pathlib import Path
-from typing import List
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
 
 from py_return_success_or_error import (
     ErrorReturn,
@@ -8,92 +11,432 @@ from py_return_success_or_error import (
 
 from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.datasource.load_csv_pandas_datasource import (
     LoadCsvPandasDatasource, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
 from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.usecase.ler_csv_fifa_usecase import (
     LerCsvFifaUseCase, )
 from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.datasource.salvar_bytes_csv_fifa_datasource import (
     SalvarBytesCsvFifaDatasource, )
+from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.domain.models.save_csv_result import (
+    SaveCsvResult, )
 from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.domain.usecase.salvar_bytes_csv_fifa_usecase import (
     SalvarBytesCsvFifaUsecase, )
+from streamlit_fifa_py_estudo.app.utils.catalogo import CATALOGO_DATASETS
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    GRUPOS_RANKING,
+    LEITURA_MEMORY_MAP,
+    MOTOR_LEITURA_CSV,
+    PREFETCH_MAX_DATASETS,
+    TIMEOUT_LEITURA_S,
+    WORKERS_PREFETCH,
+    WORKERS_SEGUNDO_PLANO,
+)
+from streamlit_fifa_py_estudo.app.utils.dataset_cache import DATASET_CACHE
 from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError, SaveCsvFifaError
 from streamlit_fifa_py_estudo.app.utils.parameters import (
     LoadCsvParameters,
     SaveCsvParameters,
 )
-from streamlit_fifa_py_estudo.app.utils.types import (
-    LCFData,
-    LCFUsecase,
-    SCFData,
-    SCFUsecase,
-)
+from streamlit_fifa_py_estudo.app.utils.tracing import span
+from streamlit_fifa_py_estudo.app.utils.types import LCFUsecase, SCFUsecase
+
+_EXECUTOR = ThreadPoolExecutor(
+    max_workers=WORKERS_SEGUNDO_PLANO, thread_name_prefix='fifa-presenter')
+"""Threads compartilhadas pelas operações em segundo plano do presenter."""
+
+_EXECUTOR_PREFETCH = ThreadPoolExecutor(
+    max_workers=WORKERS_PREFETCH, thread_name_prefix='fifa-prefetch')
+"""Threads das cargas antecipadas, que não disputam as do _EXECUTOR."""
+
+_UNIAO_TEMPORADAS: Dict[
+    Tuple[str, ...], Tuple[Tuple[PlayerTable, ...], PlayerTable]] = {}
+"""Última união de temporadas e as tabelas que a formaram."""
+_LOCK_UNIAO = threading.Lock()
+
+_LEITURAS_EM_ANDAMENTO: Dict[Tuple[str, str], "Future[PlayerTable]"] = {}
+"""Cargas antecipadas na fila ou em curso, por arquivo e variante."""
+_LOCK_LEITURAS = threading.Lock()
+
+_AGREGADOS_EM_ANDAMENTO: Set["Future[None]"] = set()
+"""Somas de agregados agendadas para depois das cargas antecipadas."""
+_LOCK_AGREGADOS = threading.Lock()
+
+_CARGAS_POR_SESSAO: Dict[Hashable, List["Future[PlayerTable]"]] = {}
+"""Leituras ainda não concluídas do pedido mais recente de cada sessão."""
+_LOCK_CARGAS = threading.Lock()
+
+
+def _variante(
+        columns: Optional[Tuple[str, ...]],
+        club: Optional[str],
+        as_of: date) -> str:
+    # A data de referência decide quais contratos estão ativos, então cada
+    # dia ocupa sua própria entrada no cache
+    if columns is None and club is None:
+        return as_of.isoformat()
+    return repr((columns, club, as_of.isoformat()))
 
 
 class FeaturesPresenter:
     """Classe responsável pela instanciação e execução dos casos de uso.
     
     Esta classe atua como uma fachada para os diferentes casos de uso da aplicação,
-    gerenciando suas instâncias e chamadas de métodos.
+    gerenciando suas instâncias e chamadas de métodos. Os datasources e casos
+    de uso não guardam estado entre chamadas, então são criados uma única
+    vez e executados na thread de quem chama; a aplicação usa a instância
+    compartilhada FEATURES_PRESENTER.
 
     Attributes:
-        Não possui atributos próprios.
+        _ler_usecase (LCFUsecase): Caso de uso de leitura do CSV.
+        _salvar_usecase (SCFUsecase): Caso de uso de salvamento do CSV.
     """
 
-    def ler_csv_fifa(self, file_path: str) -> List[dict]:
+    def __init__(self) -> None:
+        self._ler_usecase: LCFUsecase = LerCsvFifaUseCase(
+            LoadCsvPandasDatasource(memory_map=LEITURA_MEMORY_MAP))
+        self._salvar_usecase: SCFUsecase = SalvarBytesCsvFifaUsecase(
+            SalvarBytesCsvFifaDatasource())
+
+    def ler_csv_fifa(
+            self,
+            file_path: str,
+            columns: Optional[Sequence[str]] = None,
+            club: Optional[str] = None,
+            timeout: Optional[float] = TIMEOUT_LEITURA_S) -> PlayerTable:
         """Executa o caso de uso de leitura de arquivo CSV do FIFA.
 
         Realiza a validação do caminho do arquivo e executa o caso de uso
-        para carregar os dados dos jogadores do FIFA.
+        para carregar os dados dos jogadores do FIFA. O resultado é
+        compartilhado entre as sessões pelo DATASET_CACHE, de modo que o
+        mesmo arquivo só é processado novamente quando seu conteúdo muda.
+        Chamadas simultâneas para o mesmo arquivo executam o caso de uso uma
+        única vez e recebem o mesmo resultado, ou o mesmo LoadCsvFifaError.
+        Leituras parciais, com projeção de colunas ou de um único clube,
+        ocupam entradas próprias no cache. Os contratos ativos são os da
+        data de hoje, que também faz parte da entrada, de modo que um
+        servidor que atravessa a virada do ano não mantém o filtro antigo.
 
         Args:
             file_path (str): Caminho completo para o arquivo CSV.
+            columns (Optional[Sequence[str]]): Colunas da PlayerTable a
+                carregar; None carrega todas.
+            club (Optional[str]): Carrega apenas os jogadores desse clube.
+            timeout (Optional[float]): Segundos de espera por uma carga
+                antecipada do mesmo dataset já em curso; None espera sem
+                limite.
 
         Returns:
-            List[dict]: Lista de dicionários contendo os dados dos jogadores.
+            PlayerTable: Tabela colunar e imutável com os dados dos jogadores.
 
         Raises:
             FileNotFoundError: Se o arquivo especificado não for encontrado.
             LoadCsvFifaError: Se ocorrer erro durante o carregamento do CSV.
+            TimeoutError: Se a carga antecipada não terminar no prazo.
 
         Example:
             ```python
             presenter = FeaturesPresenter()
             players = presenter.ler_csv_fifa("data/fifa23.csv")
+            elenco = presenter.ler_csv_fifa(
+                "data/fifa23.csv", columns=('name', 'age'), club='Sevilla FC')
             ```
         """
 
         path = Path(file_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Arquivo não encontrado: {file_path}")
+        with span('presenter.ler_csv_fifa', arquivo=path.name) as atual:
+            if not path.exists():
+                raise FileNotFoundError(
+                    f"Arquivo não encontrado: {file_path}")
+
+            if columns is not None:
+                columns = tuple(columns)
+            as_of = date.today()
+            variante = _variante(columns, club, as_of)
+            atual.registrar(variante=variante)
+
+            # Aguarda a carga antecipada do mesmo dataset se ela está em
+            # curso; se ainda está na fila, ela é cancelada e a leitura é
+            # feita aqui
+            with _LOCK_LEITURAS:
+                em_andamento = _LEITURAS_EM_ANDAMENTO.get(
+                    (str(path.resolve()), variante))
+            if em_andamento is not None and em_andamento.running():
+                table = em_andamento.result(timeout=timeout)
+            else:
+                if em_andamento is not None:
+                    em_andamento.cancel()
+                table = self._ler_do_cache(path, columns, club, as_of)
+
+            atual.registrar(rows=len(table))
+            return table
+
+    def ler_csv_fifa_async(
+            self,
+            file_path: str,
+            columns: Optional[Sequence[str]] = None,
+            club: Optional[str] = None,
+            sessao: Optional[Hashable] = None) -> "Future[PlayerTable]":
+        """Executa ``ler_csv_fifa`` em segundo plano.
+
+        Com ``sessao``, o pedido substitui o anterior da mesma sessão: as
+        leituras anteriores ainda na fila são canceladas e as que já estão em
+        curso terminam apenas para preencher o DATASET_CACHE, sem que a
+        sessão aguarde por elas.
+
+        Args:
+            file_path (str): Caminho completo para o arquivo CSV.
+            columns (Optional[Sequence[str]]): Colunas da PlayerTable a
+                carregar; None carrega todas.
+            club (Optional[str]): Carrega apenas os jogadores desse clube.
+            sessao (Optional[Hashable]): Identificador da sessão que pede a
+                leitura.
+
+        Returns:
+            Future[PlayerTable]: Resultado da leitura. ``result()`` levanta
+                as mesmas exceções de ``ler_csv_fifa``, ou CancelledError se
+                um pedido mais novo da sessão a cancelou; use
+                ``asyncio.wrap_future`` para aguardá-lo em código assíncrono.
+
+        Example:
+            ```python
+            presenter = FeaturesPresenter()
+            future = presenter.ler_csv_fifa_async(
+                "data/fifa23.csv", sessao=session_id)
+            players = future.result(timeout=TIMEOUT_LEITURA_S)
+            ```
+        """
+        future = _EXECUTOR.submit(self.ler_csv_fifa, file_path, columns, club)
+        if sessao is not None:
+            _substituir_cargas(sessao, [future])
+        return future
+
+    def ler_temporadas_async(
+            self,
+            file_paths: Sequence[str],
+            sessao: Optional[Hashable] = None) -> "Future[PlayerTable]":
+        """Carrega vários datasets em paralelo e os junta em uma tabela, em
+        segundo plano.
+
+        Cada arquivo passa pela mesma leitura de ``ler_csv_fifa``, com seu
+        próprio lugar no DATASET_CACHE, em threads do executor de segundo
+        plano. As tabelas são concatenadas na ordem recebida, com a coluna
+        ``season`` contendo o nome do arquivo sem extensão. Enquanto nenhum
+        dos arquivos mudar, a mesma tabela unida é devolvida, o que preserva
+        seus índices entre as execuções. Se alguma leitura falhar, ou se o
+        Future devolvido for cancelado, as que ainda estão na fila são
+        canceladas.
+
+        Args:
+            file_paths (Sequence[str]): Caminhos dos arquivos CSV, um por
+                temporada.
+            sessao (Optional[Hashable]): Identificador da sessão; o pedido
+                substitui o anterior dela, como em ``ler_csv_fifa_async``.
+
+        Returns:
+            Future[PlayerTable]: Jogadores de todas as temporadas.
+                ``result()`` levanta FileNotFoundError ou LoadCsvFifaError
+                da primeira leitura que falhar, ou CancelledError se um
+                pedido mais novo da sessão o cancelou.
+
+        Example:
+            ```python
+            presenter = FeaturesPresenter()
+            future = presenter.ler_temporadas_async(
+                ["data/FIFA23.csv", "data/FIFA22.csv"], sessao=session_id)
+            table = aguardar_leitura(future)
+            ```
+        """
+        partes = {
+            Path(file_path).stem: _EXECUTOR.submit(
+                self.ler_csv_fifa, file_path)
+            for file_path in file_paths
+        }
+        uniao = _UniaoTemporadas(partes).future
+        if sessao is not None:
+            _substituir_cargas(sessao, [*partes.values(), uniao])
+        return uniao
+
+    def ler_temporadas(
+            self,
+            file_paths: Sequence[str],
+            sessao: Optional[Hashable] = None,
+            timeout: Optional[float] = TIMEOUT_LEITURA_S) -> PlayerTable:
+        """Executa ``ler_temporadas_async`` e aguarda o resultado.
+
+        Args:
+            file_paths (Sequence[str]): Caminhos dos arquivos CSV, um por
+                temporada.
+            sessao (Optional[Hashable]): Identificador da sessão; o pedido
+                substitui o anterior dela, como em ``ler_csv_fifa_async``.
+            timeout (Optional[float]): Segundos de espera pelo conjunto das
+                leituras; None espera sem limite.
+
+        Returns:
+            PlayerTable: Jogadores de todas as temporadas.
+
+        Raises:
+            FileNotFoundError: Se algum arquivo não for encontrado.
+            LoadCsvFifaError: Se ocorrer erro no carregamento de algum CSV.
+            TimeoutError: Se as leituras não terminarem no prazo; as que
+                ainda estão na fila são canceladas.
+
+        Example:
+            ```python
+            presenter = FeaturesPresenter()
+            table = presenter.ler_temporadas(
+                ["data/FIFA23.csv", "data/FIFA22.csv"])
+            fifa22 = table.frame[table.frame['season'] == 'FIFA22']
+            ```
+        """
+        with span('presenter.ler_temporadas',
+                  temporadas=len(file_paths)) as atual:
+            future = self.ler_temporadas_async(file_paths, sessao)
+            try:
+                uniao = future.result(timeout=timeout)
+            except BaseException:
+                future.cancel()
+                raise
+            atual.registrar(rows=len(uniao))
+            return uniao
+
+    def prefetch_csv_fifa(
+            self, file_paths: Iterable[str]) -> List["Future[PlayerTable]"]:
+        """Inicia em segundo plano a leitura completa de vários datasets.
+
+        As cargas antecipadas rodam em um executor próprio, com
+        WORKERS_PREFETCH threads, e nunca ocupam as threads das leituras
+        pedidas pelas páginas. Nenhuma carga é iniciada enquanto alguma
+        sessão aguarda uma leitura, e no máximo PREFETCH_MAX_DATASETS ficam
+        na fila ao mesmo tempo. Datasets que já estão no DATASET_CACHE ou
+        que já estão sendo carregados são ignorados. Uma chamada de
+        ``ler_csv_fifa`` para um dataset em carregamento aguarda essa carga
+        em vez de repeti-la, ou a cancela se ela ainda estiver na fila.
+        Erros da leitura ficam guardados no Future e não são levantados
+        aqui.
+
+        Args:
+            file_paths (Iterable[str]): Caminhos dos arquivos CSV.
+
+        Returns:
+            List[Future[PlayerTable]]: Leituras iniciadas por esta chamada.
+
+        Example:
+            ```python
+            presenter = FeaturesPresenter()
+            presenter.prefetch_csv_fifa(
+                [PASTA_DATASETS / f'{nome}.csv' for nome in nomes])
+            ```
+        """
+        futures: List["Future[PlayerTable]"] = []
+        if _leituras_pendentes():
+            return futures
+        as_of = date.today()
+        variante = _variante(None, None, as_of)
+        for file_path in file_paths:
+            path = Path(file_path)
+            if DATASET_CACHE.contains(path, variante):
+                continue
+            chave = (str(path.resolve()), variante)
+            with _LOCK_LEITURAS:
+                if chave in _LEITURAS_EM_ANDAMENTO:
+                    continue
+                if len(_LEITURAS_EM_ANDAMENTO) >= PREFETCH_MAX_DATASETS:
+                    break
+                future = _EXECUTOR_PREFETCH.submit(
+                    self._ler_do_cache, path, None, None, as_of)
+                _LEITURAS_EM_ANDAMENTO[chave] = future
+            future.add_done_callback(
+                lambda _, chave=chave: _remover_leitura(chave))
+            futures.append(future)
+        return futures
+
+    def aguardar_segundo_plano(self, timeout: Optional[float] = None) -> None:
+        """Aguarda as cargas antecipadas e as somas de agregados em curso.
+
+        Cargas antecipadas que ainda estão na fila são canceladas. Permite
+        que benchmarks e testes partam de um estado estável, sem trabalho
+        iniciado por chamadas anteriores, como ``salvar_csv_fifa``,
+        disputando o processador ou preenchendo o DATASET_CACHE.
+
+        Args:
+            timeout (Optional[float]): Segundos de espera; None espera sem
+                limite.
+
+        Example:
+            ```python
+            presenter.salvar_csv_fifa(nome, bytes_csv)
+            presenter.aguardar_segundo_plano()
+            DATASET_CACHE.clear()
+            ```
+        """
+        with _LOCK_LEITURAS:
+            leituras = list(_LEITURAS_EM_ANDAMENTO.values())
+        for future in leituras:
+            future.cancel()
+        with _LOCK_AGREGADOS:
+            agregados = list(_AGREGADOS_EM_ANDAMENTO)
+        wait([*leituras, *agregados], timeout=timeout)
+
+    def _ler_do_cache(
+            self,
+            path: Path,
+            columns: Optional[Tuple[str, ...]] = None,
+            club: Optional[str] = None,
+            as_of: Optional[date] = None) -> PlayerTable:
+        as_of = as_of or date.today()
+        return DATASET_CACHE.get_or_load(
+            path,
+            lambda: self._executar_ler_csv_fifa(path, columns, club, as_of),
+            _variante(columns, club, as_of))
 
+    def _executar_ler_csv_fifa(
+            self,
+            path: Path,
+            columns: Optional[Tuple[str, ...]] = None,
+            club: Optional[str] = None,
+            as_of: Optional[date] = None) -> PlayerTable:
         error: LoadCsvFifaError = LoadCsvFifaError()
         parameters: LoadCsvParameters = LoadCsvParameters(
-            error=error, file_path=str(path))
-        dataSource: LCFData = LoadCsvPandasDatasource()
-        usecase: LCFUsecase = LerCsvFifaUseCase(dataSource)
+            error=error,
+            file_path=str(path),
+            as_of=as_of,
+            columns=columns,
+            club=club,
+            engine=MOTOR_LEITURA_CSV)
 
-        data = usecase.runNewThread(parameters)
-        list_fifa_players: List[dict] = []
+        data = self._ler_usecase(parameters)
+        table = PlayerTable.from_players([])
 
         if isinstance(data, SuccessReturn):
 
-            list_fifa_players = data.result
+            table = data.result
 
         if isinstance(data, ErrorReturn):
             raise data.result
 
-        return list_fifa_players
+        return table
 
-    def salvar_csv_fifa(self, csv_name: str, bytes_csv: bytes) -> Path:
+    def salvar_csv_fifa(
+            self, csv_name: str, bytes_csv: bytes) -> SaveCsvResult:
         """Executa o caso de uso de salvamento de arquivo CSV do FIFA.
 
         Recebe os bytes do arquivo CSV e um nome, realiza a validação e salva
-        o arquivo no sistema de arquivos.
+        o arquivo no sistema de arquivos. Versões do arquivo já carregadas no
+        DATASET_CACHE são invalidadas, assim como o CATALOGO_DATASETS. Se o
+        mesmo conteúdo já estiver salvo com esse nome, nada é validado nem
+        gravado e o cache é mantido.
+
+        Um arquivo alterado é carregado em segundo plano e seus agregados de
+        GRUPOS_RANKING são somados, de modo que o primeiro ranking que o
+        usar já os encontra prontos. As demais temporadas mantêm os
+        agregados que já tinham.
 
         Args:
             csv_name (str): Nome do arquivo CSV a ser salvo (sem extensão)
             bytes_csv (bytes): Conteúdo do arquivo CSV em formato bytes
 
         Returns:
-            Path: Caminho completo do arquivo salvo
+            SaveCsvResult: Caminho completo do arquivo salvo e se ele mudou
 
         Raises:
             SaveCsvFifaError: Se ocorrer erro durante o salvamento do CSV
@@ -103,23 +446,183 @@ class FeaturesPresenter:
             presenter = FeaturesPresenter()
             with open('fifa23.csv', 'rb') as f:
                 bytes_data = f.read()
-                path = presenter.salvar_csv_fifa("novo_fifa", bytes_data)
+                result = presenter.salvar_csv_fifa("novo_fifa", bytes_data)
             ```
         """
-        error: SaveCsvFifaError = SaveCsvFifaError()
-        parameters: SaveCsvParameters = SaveCsvParameters(
-            error=error, csv_name=csv_name, bytes_csv=bytes_csv
-        )
-        dataSource: SCFData = SalvarBytesCsvFifaDatasource()
-        usecase: SCFUsecase = SalvarBytesCsvFifaUsecase(dataSource)
+        with span('presenter.salvar_csv_fifa', bytes=len(bytes_csv)) as atual:
+            error: SaveCsvFifaError = SaveCsvFifaError()
+            parameters: SaveCsvParameters = SaveCsvParameters(
+                error=error, csv_name=csv_name, bytes_csv=bytes_csv
+            )
 
-        data = usecase.runNewThread(parameters)
-        path = Path()
+            data = self._salvar_usecase(parameters)
+            result = SaveCsvResult(path=Path(), changed=False)
 
-        if isinstance(data, SuccessReturn):
-            path = data.result
+            if isinstance(data, SuccessReturn):
+                result = data.result
+                if result.changed:
+                    DATASET_CACHE.invalidate(result.path)
+                    CATALOGO_DATASETS.invalidar()
+                    for future in self.prefetch_csv_fifa([result.path]):
+                        _agendar_agregados(future)
+
+            if isinstance(data, ErrorReturn):
+                raise data.result
+
+            atual.registrar(changed=result.changed)
+            return result
+
+    def salvar_csv_fifa_async(
+            self, csv_name: str, bytes_csv: bytes) -> "Future[SaveCsvResult]":
+        """Executa ``salvar_csv_fifa`` em segundo plano.
+
+        Args:
+            csv_name (str): Nome do arquivo CSV a ser salvo (sem extensão)
+            bytes_csv (bytes): Conteúdo do arquivo CSV em formato bytes
+
+        Returns:
+            Future[SaveCsvResult]: Resultado do salvamento. ``result()``
+                levanta SaveCsvFifaError se o salvamento falhar.
+
+        Example:
+            ```python
+            presenter = FeaturesPresenter()
+            future = presenter.salvar_csv_fifa_async("novo_fifa", bytes_data)
+            result = future.result(timeout=TIMEOUT_SALVAMENTO_S)
+            ```
+        """
+        return _EXECUTOR.submit(self.salvar_csv_fifa, csv_name, bytes_csv)
+
+
+class _UniaoTemporadas:
+    """Junta as leituras de várias temporadas em um único Future.
+
+    A união é montada pela thread que conclui a última leitura, sem ocupar
+    uma thread do executor aguardando as demais.
+
+    Attributes:
+        future (Future[PlayerTable]): Tabela unida; cancelá-lo cancela as
+            leituras que ainda estão na fila.
+    """
+
+    def __init__(self, partes: Dict[str, "Future[PlayerTable]"]) -> None:
+        self.future: "Future[PlayerTable]" = Future()
+        self._partes = partes
+        self._restantes = len(partes)
+        self._concluida = False
+        self._lock = threading.Lock()
+        self.future.add_done_callback(self._cancelar_partes)
+        if not partes:
+            self._unir()
+        for parte in partes.values():
+            parte.add_done_callback(self._concluir_parte)
+
+    def _cancelar_partes(self, future: "Future[PlayerTable]") -> None:
+        if future.cancelled():
+            for parte in self._partes.values():
+                parte.cancel()
+
+    def _concluir_parte(self, parte: "Future[PlayerTable]") -> None:
+        with self._lock:
+            self._restantes -= 1
+            falhou = parte.cancelled() or parte.exception() is not None
+            if self._concluida or not (falhou or self._restantes == 0):
+                return
+            self._concluida = True
+
+        if parte.cancelled():
+            self.future.cancel()
+        elif falhou:
+            for outra in self._partes.values():
+                outra.cancel()
+            if self.future.set_running_or_notify_cancel():
+                self.future.set_exception(parte.exception())
+        else:
+            self._unir()
+
+    def _unir(self) -> None:
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            uniao = _unir_temporadas({
+                stem: parte.result() for stem, parte in self._partes.items()
+            })
+        except BaseException as e:
+            self.future.set_exception(e)
+        else:
+            self.future.set_result(uniao)
+
+
+def _unir_temporadas(tabelas: Dict[str, PlayerTable]) -> PlayerTable:
+    chave = tuple(tabelas)
+    partes = tuple(tabelas.values())
+    with _LOCK_UNIAO:
+        anterior = _UNIAO_TEMPORADAS.get(chave)
+    if anterior is not None and all(
+            tabela is usada for tabela, usada in zip(partes, anterior[0])):
+        return anterior[1]
+    uniao = PlayerTable.concatenar(tabelas)
+    with _LOCK_UNIAO:
+        _UNIAO_TEMPORADAS.clear()
+        _UNIAO_TEMPORADAS[chave] = (partes, uniao)
+    return uniao
+
+
+def _remover_leitura(chave: Tuple[str, str]) -> None:
+    with _LOCK_LEITURAS:
+        _LEITURAS_EM_ANDAMENTO.pop(chave, None)
+
+
+def _leituras_pendentes() -> bool:
+    with _LOCK_CARGAS:
+        return bool(_CARGAS_POR_SESSAO)
+
+
+def _agendar_agregados(future: "Future[PlayerTable]") -> None:
+    # Registrada antes da carga terminar, a soma não escapa de quem aguarda
+    # o segundo plano entre o fim da carga e o início do callback
+    concluida: "Future[None]" = Future()
+    with _LOCK_AGREGADOS:
+        _AGREGADOS_EM_ANDAMENTO.add(concluida)
+    future.add_done_callback(
+        lambda future: _somar_agregados(future, concluida))
+
+
+def _somar_agregados(
+        future: "Future[PlayerTable]", concluida: "Future[None]") -> None:
+    try:
+        if future.cancelled() or future.exception() is not None:
+            return
+        table = future.result()
+        with span('presenter.somar_agregados', rows=len(table)):
+            for grupo in GRUPOS_RANKING:
+                table.agregados(grupo)
+    finally:
+        with _LOCK_AGREGADOS:
+            _AGREGADOS_EM_ANDAMENTO.discard(concluida)
+        concluida.set_result(None)
+
+
+def _substituir_cargas(
+        sessao: Hashable, futures: List["Future[PlayerTable]"]) -> None:
+    with _LOCK_CARGAS:
+        anteriores = _CARGAS_POR_SESSAO.get(sessao, [])
+        _CARGAS_POR_SESSAO[sessao] = list(futures)
+    for future in anteriores:
+        future.cancel()
+    for future in futures:
+        future.add_done_callback(
+            lambda future: _concluir_carga(sessao, future))
+
+
+def _concluir_carga(sessao: Hashable, future: "Future[PlayerTable]") -> None:
+    with _LOCK_CARGAS:
+        pendentes = _CARGAS_POR_SESSAO.get(sessao)
+        if pendentes is not None and future in pendentes:
+            pendentes.remove(future)
+            if not pendentes:
+                del _CARGAS_POR_SESSAO[sessao]
 
-        if isinstance(data, ErrorReturn):
-            raise data.result
 
-        return path
+FEATURES_PRESENTER = FeaturesPresenter()
+"""Presenter compartilhado pelas sessões da aplicação."""
@@ -1,44 +1,233 @@
-from typing import List
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 
-from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.fifa_player import (
-    FifaPlayer, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    COLUNAS_PLAYER_TABLE,
+    ORIGEM_CSV_PLAYER_TABLE,
+    PlayerTable,
+)
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    COLUNAS_CSV_FIFA,
+    LINHAS_POR_CHUNK_LEITURA,
+)
 from streamlit_fifa_py_estudo.app.utils.parameters import LoadCsvParameters
+from streamlit_fifa_py_estudo.app.utils.sidecar import caminho_sidecar, ler_sidecar
+from streamlit_fifa_py_estudo.app.utils.tracing import Span, span
 from streamlit_fifa_py_estudo.app.utils.types import LCFData
 
 
+def colunas_necessarias(
+        parameters: LoadCsvParameters) -> Optional[Tuple[str, ...]]:
+    """Colunas da PlayerTable que a leitura precisa materializar.
+
+    Junta a projeção pedida às colunas usadas pelos filtros e pela
+    ordenação do caso de uso, na ordem de COLUNAS_PLAYER_TABLE.
+
+    Args:
+        parameters (LoadCsvParameters): Parâmetros da leitura.
+
+    Returns:
+        Optional[Tuple[str, ...]]: Colunas necessárias, ou None se todas
+            forem necessárias.
+    """
+    if parameters.columns is None:
+        return None
+    necessarias = {
+        *parameters.columns,
+        'overall',
+        'contract_valid_until',
+        parameters.sort_by,
+    }
+    if parameters.club is not None:
+        necessarias.add('club')
+    return tuple(nome for nome in COLUNAS_PLAYER_TABLE if nome in necessarias)
+
+
+def _tem_predicados(parameters: LoadCsvParameters) -> bool:
+    return parameters.club is not None or parameters.min_overall > 1
+
+
+def _mascara_linhas(
+        coluna: Callable[[str], np.ndarray],
+        parameters: LoadCsvParameters) -> np.ndarray:
+    """Avalia os predicados de clube e overall mínimo sobre as colunas."""
+    mascara = coluna('overall') >= parameters.min_overall
+    if parameters.club is not None:
+        mascara &= coluna('club') == parameters.club
+    return mascara
+
+
+def _tamanho(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return None
+
+
+def _ler_csv_pyarrow(
+        fonte: Union[str, Path, IO[bytes]],
+        usecols: Optional[List[str]]) -> pd.DataFrame:
+    """Lê o CSV com o leitor multi-thread do pyarrow.
+
+    As colunas de COLUNAS_CSV_FIFA recebem os tipos declarados no esquema
+    da validação de upload, em vez de terem o tipo inferido. Os textos são
+    lidos como strings do Arrow e convertidos para objetos com NaN nos
+    valores ausentes, como faz o leitor padrão do pandas.
+    """
+    tipos: Dict[str, Any] = {
+        coluna: 'string[pyarrow]' if tipo == 'object' else tipo
+        for coluna, tipo in COLUNAS_CSV_FIFA.items()
+        if usecols is None or coluna in usecols
+    }
+    df = pd.read_csv(fonte, engine='pyarrow', usecols=usecols, dtype=tipos)
+    for coluna, tipo in tipos.items():
+        if tipo == 'string[pyarrow]':
+            df[coluna] = df[coluna].to_numpy(dtype=object, na_value=np.nan)
+    return df
+
+
+def ler_csv_fifa_frame(
+        fonte: Union[str, Path, IO[bytes]],
+        usecols: Optional[List[str]] = None,
+        engine: str = 'c',
+        chunksize: Optional[int] = None) -> Any:
+    """Lê um CSV de jogadores FIFA com as opções usadas em toda a aplicação.
+
+    A leitura dos datasets e a cópia colunar gravada ao salvar passam por
+    esta função, de modo que as duas nunca divergem nas colunas lidas, no
+    índice ou nos tipos. O índice do DataFrame é sempre o padrão; a coluna
+    sem nome que alguns CSVs trazem no início é apenas ignorada pela
+    conversão para PlayerTable.
+
+    Args:
+        fonte (Union[str, Path, IO[bytes]]): Caminho ou conteúdo do CSV.
+        usecols (Optional[List[str]]): Colunas do CSV a ler; None lê todas.
+        engine (str): Leitor do CSV: 'c' ou 'pyarrow'.
+        chunksize (Optional[int]): Linhas por bloco; com um valor, devolve
+            um leitor em blocos. Não é aceito com ``engine='pyarrow'``.
+
+    Returns:
+        Any: DataFrame com as colunas originais do CSV, ou o leitor em
+            blocos se ``chunksize`` for informado.
+
+    Example:
+        ```python
+        df = ler_csv_fifa_frame(BytesIO(bytes_csv))
+        table = PlayerTable.from_csv_frame(df)
+        ```
+    """
+    if engine == 'pyarrow':
+        if chunksize is not None:
+            raise ValueError("engine='pyarrow' não lê em blocos")
+        return _ler_csv_pyarrow(fonte, usecols)
+    return pd.read_csv(
+        fonte, usecols=usecols, engine=engine, chunksize=chunksize)
+
+
 class LoadCsvPandasDatasource(LCFData):
     """Classe responsável por carregar dados de jogadores do FIFA 23 a partir de um arquivo CSV.
 
     Esta classe implementa a interface LCFData e utiliza o pandas para ler e processar
-    os dados do arquivo CSV.
+    os dados do arquivo CSV, normalizando todas as colunas de forma vetorizada.
+    Quando existe uma cópia colunar atualizada do CSV, ela é lida no lugar
+    do texto.
 
     Attributes:
-        Não possui atributos próprios.
+        memory_map (bool): Se True, a cópia colunar é mapeada em memória e
+            suas colunas são expostas sem cópia.
     """
 
-    def __call__(self, parameters: LoadCsvParameters) -> List[FifaPlayer]:
+    def __init__(self, memory_map: bool = False) -> None:
+        self.memory_map = memory_map
+
+    def __call__(self, parameters: LoadCsvParameters) -> PlayerTable:
         """Carrega e processa um arquivo CSV com dados de jogadores do FIFA 23.
 
+        Usa a cópia colunar gravada ao salvar o dataset se o hash registrado
+        nela coincidir com o do CSV; caso contrário, lê o próprio CSV. No
+        modo ``memory_map`` a memória ocupada não cresce com a quantidade de
+        datasets abertos, apenas com as colunas efetivamente lidas.
+
+        A projeção (``columns``) e os predicados de clube e overall mínimo
+        dos parâmetros são aplicados na própria leitura: só as colunas
+        necessárias são lidas e, havendo predicados, o CSV é lido em blocos
+        de LINHAS_POR_CHUNK_LEITURA linhas, mantendo apenas as que os
+        satisfazem antes da conversão.
+
+        Com ``engine='pyarrow'`` o CSV é lido de uma vez pelo leitor
+        multi-thread do pyarrow, com os tipos de COLUNAS_CSV_FIFA, e os
+        predicados são aplicados depois da leitura. O resultado é o mesmo do
+        leitor padrão do pandas.
+
         Args:
             parameters (LoadCsvParameters): Objeto contendo os parâmetros de carregamento,
                 incluindo o caminho do arquivo CSV.
 
         Returns:
-            List[FifaPlayer]: Lista de objetos FifaPlayer contendo os dados dos jogadores.
+            PlayerTable: Tabela colunar com os dados normalizados dos jogadores,
+                na ordem do arquivo.
 
         Example:
             ```python
-            datasource = LoadCsvPandasDatasource()
+            datasource = LoadCsvPandasDatasource(memory_map=True)
             parameters = LoadCsvParameters(file_path="fifa23_players.csv")
             players = datasource(parameters)
             ```
         """
-        df = pd.read_csv(parameters.file_path, index_col=0)
-        players = [
-            FifaPlayer.from_csv_row(row)
-            for row in df.to_dict('records')
-        ]
+        with span('datasource.ler_csv', engine=parameters.engine) as atual:
+            table = self._ler(parameters, atual)
+            atual.registrar(rows=len(table))
+            return table
+
+    def _ler(self, parameters: LoadCsvParameters, atual: Span) -> PlayerTable:
+        colunas = colunas_necessarias(parameters)
+        table = ler_sidecar(
+            Path(parameters.file_path), self.memory_map, colunas)
+        if table is not None:
+            atual.registrar(
+                origem='sidecar',
+                bytes=_tamanho(caminho_sidecar(Path(parameters.file_path))))
+            if not _tem_predicados(parameters):
+                return table
+            return table.take(
+                np.flatnonzero(_mascara_linhas(table.coluna, parameters)))
+
+        atual.registrar(
+            origem='csv', bytes=_tamanho(Path(parameters.file_path)))
+        if colunas is None:
+            usecols = None
+        else:
+            usecols = [ORIGEM_CSV_PLAYER_TABLE[nome] for nome in colunas]
+        if parameters.engine == 'pyarrow':
+            df = ler_csv_fifa_frame(
+                parameters.file_path, usecols, engine='pyarrow')
+            if _tem_predicados(parameters):
+                df = df[_mascara_linhas(
+                    lambda nome: df[ORIGEM_CSV_PLAYER_TABLE[nome]].to_numpy(),
+                    parameters)]
+            return PlayerTable.from_csv_frame(df, colunas)
+
+        if not _tem_predicados(parameters):
+            df = ler_csv_fifa_frame(
+                parameters.file_path, usecols, engine=parameters.engine)
+            return PlayerTable.from_csv_frame(df, colunas)
+
+        def coluna_csv(chunk: pd.DataFrame) -> Callable[[str], np.ndarray]:
+            return lambda nome: chunk[ORIGEM_CSV_PLAYER_TABLE[nome]].to_numpy()
 
-        return players
+        leitor = ler_csv_fifa_frame(
+            parameters.file_path,
+            usecols,
+            engine=parameters.engine,
+            chunksize=LINHAS_POR_CHUNK_LEITURA)
+        with leitor:
+            blocos = [
+                chunk[_mascara_linhas(coluna_csv(chunk), parameters)]
+                for chunk in leitor
+            ]
+        if not blocos:
+            return PlayerTable.from_csv_frame(pd.DataFrame(), colunas)
+        return PlayerTable.from_csv_frame(pd.concat(blocos), colunas)
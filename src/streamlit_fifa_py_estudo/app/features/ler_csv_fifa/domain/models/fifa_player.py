@@ -3,12 +3,14 @@ from datetime import date
 from typing import Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FifaPlayer:
     """Classe para representar dados de jogadores do FIFA 23.
 
     Esta classe modela os atributos e características de um jogador do FIFA 23,
-    incluindo informações pessoais, profissionais e estatísticas.
+    incluindo informações pessoais, profissionais e estatísticas. As
+    instâncias são imutáveis e não têm ``__dict__``; para ler campos de uma
+    PlayerTable sem criar objetos, use PlayerRow.
 
     Attributes:
         id (int): Identificador único do jogador.
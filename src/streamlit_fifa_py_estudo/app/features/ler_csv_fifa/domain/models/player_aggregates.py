@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+        PlayerTable, )
+
+COLUNAS_SOMADAS: tuple[str, ...] = ('value', 'wage', 'overall', 'age')
+"""Colunas da PlayerTable somadas em cada grupo."""
+
+METRICAS_RANKING: tuple[str, ...] = (
+    'players',
+    'squad_value',
+    'wage_bill',
+    'avg_overall',
+    'avg_age',
+)
+"""Colunas do ranking, todas calculadas a partir das somas dos grupos."""
+
+
+@dataclass(frozen=True)
+class Agregados:
+    """Somas parciais de uma PlayerTable agrupada por uma coluna.
+
+    Cada posição dos arrays é um par (origem, grupo), como (temporada,
+    clube), com a quantidade de jogadores e as somas de COLUNAS_SOMADAS.
+    Somas podem ser juntadas sem voltar às linhas, de modo que os
+    agregados de várias temporadas são a concatenação dos agregados de cada
+    uma e o ranking de qualquer seleção de temporadas custa O(grupos).
+
+    Attributes:
+        grupo (str): Coluna agrupada, como ``'club'``.
+        origem (str): Coluna que identifica a origem das linhas, como
+            ``'season'``.
+        grupos (np.ndarray): Valor do grupo de cada par.
+        origens (np.ndarray): Origem de cada par; ``''`` se a tabela não
+            tiver a coluna de origem.
+        jogadores (np.ndarray): Quantidade de jogadores de cada par.
+        somas (Dict[str, np.ndarray]): Soma de cada coluna em cada par.
+
+    Example:
+        ```python
+        agregados = table.agregados('club')
+        top = agregados.ranking('squad_value', origens=['FIFA23']).head(10)
+        ```
+    """
+    grupo: str
+    origem: str
+    grupos: np.ndarray
+    origens: np.ndarray
+    jogadores: np.ndarray
+    somas: Dict[str, np.ndarray]
+
+    @classmethod
+    def from_table(
+            cls,
+            table: "PlayerTable",
+            grupo: str,
+            origem: str = 'season') -> "Agregados":
+        """Calcula as somas percorrendo as colunas da tabela uma vez.
+
+        Linhas sem grupo ficam de fora. Valores ausentes somam zero, mas o
+        jogador continua contado.
+
+        Args:
+            table (PlayerTable): Tabela agrupada.
+            grupo (str): Coluna agrupada.
+            origem (str): Coluna de origem das linhas, se existir.
+
+        Returns:
+            Agregados: Somas de cada par (origem, grupo) presente.
+
+        Raises:
+            KeyError: Se a tabela não tiver o grupo ou COLUNAS_SOMADAS.
+        """
+        codigos, grupos = pd.factorize(table.coluna(grupo))
+        if origem in table.colunas:
+            codigos_origem, origens = pd.factorize(table.coluna(origem))
+        else:
+            codigos_origem = np.zeros(len(table), dtype=np.int64)
+            origens = np.array([''], dtype=object)
+
+        validas = (codigos >= 0) & (codigos_origem >= 0)
+        chaves = (codigos_origem[validas].astype(np.int64) * len(grupos)
+                  + codigos[validas])
+        total = len(origens) * len(grupos)
+        jogadores = np.bincount(chaves, minlength=total)
+        presentes = np.flatnonzero(jogadores)
+        somas = {
+            nome: np.bincount(
+                chaves,
+                weights=np.nan_to_num(
+                    table.coluna(nome)[validas].astype('float64')),
+                minlength=total)[presentes]
+            for nome in COLUNAS_SOMADAS
+        }
+        por_origem = max(len(grupos), 1)
+        return cls(
+            grupo=grupo,
+            origem=origem,
+            grupos=np.asarray(grupos, dtype=object)[presentes % por_origem],
+            origens=np.asarray(origens, dtype=object)[
+                presentes // por_origem],
+            jogadores=jogadores[presentes],
+            somas=somas,
+        )
+
+    @classmethod
+    def concatenar(
+            cls,
+            partes: Mapping[str, "Agregados"],
+            origem: str = 'season') -> "Agregados":
+        """Junta os agregados de várias tabelas sem voltar às linhas.
+
+        Equivale a calcular os agregados de ``PlayerTable.concatenar`` das
+        mesmas tabelas: a origem de cada par passa a ser o nome da parte.
+
+        Args:
+            partes (Mapping[str, Agregados]): Agregados do mesmo grupo,
+                indexados pelo nome da origem, como a temporada.
+            origem (str): Coluna que recebe o nome da origem.
+
+        Returns:
+            Agregados: Pares de todas as partes.
+
+        Raises:
+            ValueError: Se as partes agruparem colunas diferentes.
+        """
+        lista = list(partes.values())
+        grupos = {parte.grupo for parte in lista}
+        if len(grupos) != 1:
+            raise ValueError(f"Agregados de grupos diferentes: {grupos}")
+        nomes = np.empty(len(partes), dtype=object)
+        nomes[:] = list(partes)
+        return cls(
+            grupo=grupos.pop(),
+            origem=origem,
+            grupos=np.concatenate([parte.grupos for parte in lista]),
+            origens=np.repeat(nomes, [len(parte.grupos) for parte in lista]),
+            jogadores=np.concatenate([parte.jogadores for parte in lista]),
+            somas={
+                nome: np.concatenate([parte.somas[nome] for parte in lista])
+                for nome in COLUNAS_SOMADAS
+            },
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Memória aproximada ocupada pelos arrays; os textos dos grupos são
+        os mesmos objetos da tabela."""
+        return (self.grupos.nbytes + self.origens.nbytes
+                + self.jogadores.nbytes
+                + sum(valores.nbytes for valores in self.somas.values()))
+
+    def ranking(
+            self,
+            metrica: str = 'squad_value',
+            descending: bool = True,
+            origens: Optional[Iterable[str]] = None) -> pd.DataFrame:
+        """Ordena os grupos por uma das METRICAS_RANKING.
+
+        Args:
+            metrica (str): Coluna usada na ordenação.
+            descending (bool): Se True, do maior para o menor.
+            origens (Optional[Iterable[str]]): Origens consideradas; None
+                considera todas.
+
+        Returns:
+            pd.DataFrame: Uma linha por grupo, com a coluna do grupo e as
+                METRICAS_RANKING; empates seguem a ordem da tabela.
+
+        Raises:
+            KeyError: Se a métrica não existir.
+        """
+        if metrica not in METRICAS_RANKING:
+            raise KeyError(metrica)
+        selecionados = slice(None)
+        if origens is not None:
+            selecionados = np.isin(self.origens, list(origens))
+
+        total = pd.DataFrame({
+            self.grupo: self.grupos[selecionados],
+            'players': self.jogadores[selecionados],
+            **{nome: valores[selecionados]
+               for nome, valores in self.somas.items()},
+        }).groupby(self.grupo, sort=False).sum()
+        ranking = pd.DataFrame({
+            'players': total['players'],
+            'squad_value': total['value'],
+            'wage_bill': total['wage'],
+            'avg_overall': total['overall'] / total['players'],
+            'avg_age': total['age'] / total['players'],
+        })
+        return ranking.sort_values(
+            metrica, ascending=not descending, kind='stable').reset_index()
@@ -0,0 +1,238 @@
+import sys
+from typing import TYPE_CHECKING, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+        PlayerRow,
+        PlayerTable,
+    )
+
+
+def _primeiras_posicoes(
+        chaves: Iterable[Hashable], quantidade: int) -> Dict[Hashable, int]:
+    # Percorre de trás para frente para que a primeira ocorrência vença
+    return dict(zip(reversed(list(chaves)), range(quantidade - 1, -1, -1)))
+
+
+class PlayerIndex:
+    """Índices de uma PlayerTable para buscas sem percorrer a tabela.
+
+    Mantém uma cópia da tabela ordenada por clube, de modo que o elenco de
+    cada clube ocupa um intervalo contínuo de linhas, e três dicionários:
+    (temporada, ID) para posição na tabela original, clube para intervalo na
+    cópia ordenada e (temporada, clube, nome) para posição na tabela
+    original. Os clubes seguem a ordem em que aparecem na tabela e, dentro
+    de cada clube, a ordem original das linhas é preservada. Jogadores sem
+    clube só entram no índice por ID.
+
+    Em uma tabela com várias temporadas, o mesmo jogador aparece uma vez por
+    temporada; as buscas sem temporada devolvem a primeira linha. Tabelas
+    sem a coluna ``season`` usam apenas a temporada None.
+
+    Attributes:
+        _table (PlayerTable): Tabela indexada.
+        _por_clube (PlayerTable): Tabela com as linhas agrupadas por clube.
+        _posicoes_por_clube (np.ndarray): Posição na tabela original de
+            cada linha de ``_por_clube``.
+        _posicao_por_id (Dict[Tuple[Optional[str], int], int]): Posição de
+            cada ID na tabela, por temporada.
+        _intervalo_por_clube (Dict[str, Tuple[int, int]]): Início e fim do
+            elenco de cada clube em ``_por_clube``.
+        _posicao_por_nome (Dict[Tuple[Optional[str], str, str], int]):
+            Posição de cada jogador na tabela pela temporada, clube e nome.
+
+    Example:
+        ```python
+        index = table.indices
+        elenco = index.elenco('Manchester City')
+        player = index.jogador(index.id_por_nome('Manchester City', 'Rodri'))
+        messi = table.linha(
+            index.posicao_por_nome('Paris SG', 'L. Messi', season='FIFA22'))
+        ```
+    """
+    __slots__ = (
+        '_table',
+        '_por_clube',
+        '_posicoes_por_clube',
+        '_posicao_por_id',
+        '_intervalo_por_clube',
+        '_posicao_por_nome',
+    )
+
+    def __init__(self, table: "PlayerTable") -> None:
+        """Constrói os índices a partir das colunas id, club, name e, se
+        existir, season.
+
+        IDs e nomes repetidos na mesma temporada apontam para a primeira
+        linha em que aparecem.
+
+        Args:
+            table (PlayerTable): Tabela a ser indexada.
+        """
+        ids = table.coluna('id').tolist()
+        clubes = table.coluna('club')
+        chaves_nome = list(zip(clubes.tolist(), table.coluna('name').tolist()))
+        quantidade = len(table)
+        # A temporada None indexa a primeira linha de cada jogador em
+        # qualquer temporada
+        temporadas: List[List[Optional[str]]] = [[None] * quantidade]
+        if 'season' in table.colunas:
+            temporadas.append(table.coluna('season').tolist())
+
+        self._table = table
+        self._posicao_por_id: Dict[Tuple[Optional[str], int], int] = {}
+        self._posicao_por_nome: Dict[
+            Tuple[Optional[str], str, str], int] = {}
+        for temporada in temporadas:
+            self._posicao_por_id.update(
+                _primeiras_posicoes(zip(temporada, ids), quantidade))
+            self._posicao_por_nome.update(_primeiras_posicoes(
+                ((season, club, name)
+                 for season, (club, name) in zip(temporada, chaves_nome)),
+                quantidade))
+
+        codigos, unicos = pd.factorize(clubes)
+        com_clube = np.flatnonzero(codigos >= 0)
+        ordem = com_clube[np.argsort(codigos[com_clube], kind='stable')]
+        ordem.flags.writeable = False
+        contagens = np.bincount(codigos[com_clube], minlength=len(unicos))
+        fins = np.cumsum(contagens)
+        inicios = fins - contagens
+
+        self._por_clube = table.take(ordem)
+        self._posicoes_por_clube = ordem
+        self._intervalo_por_clube: Dict[str, Tuple[int, int]] = {
+            club: (int(inicio), int(fim))
+            for club, inicio, fim in zip(unicos.tolist(), inicios, fins)
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Memória aproximada ocupada pela cópia ordenada e pelos
+        dicionários, sem os textos compartilhados com a tabela."""
+        chave = sys.getsizeof((None, None, None))
+        return (self._por_clube.nbytes_colunas
+                + self._posicoes_por_clube.nbytes
+                + sys.getsizeof(self._posicao_por_id)
+                + len(self._posicao_por_id) * chave
+                + sys.getsizeof(self._intervalo_por_clube)
+                + len(self._intervalo_por_clube) * chave
+                + sys.getsizeof(self._posicao_por_nome)
+                + len(self._posicao_por_nome) * chave)
+
+    @property
+    def clubes(self) -> List[str]:
+        """Clubes na ordem em que aparecem na tabela."""
+        return list(self._intervalo_por_clube)
+
+    def posicao(
+            self,
+            player_id: int,
+            season: Optional[str] = None) -> Optional[int]:
+        """Retorna a posição de um jogador na tabela pelo ID.
+
+        Args:
+            player_id (int): ID do jogador.
+            season (Optional[str]): Temporada da linha; None devolve a
+                primeira linha do jogador em qualquer temporada.
+
+        Returns:
+            Optional[int]: Posição na tabela, ou None se o ID não existir.
+        """
+        return self._posicao_por_id.get((season, player_id))
+
+    def jogador(
+            self,
+            player_id: int,
+            season: Optional[str] = None) -> "PlayerRow":
+        """Retorna a linha de um jogador pelo ID.
+
+        Args:
+            player_id (int): ID do jogador.
+            season (Optional[str]): Temporada da linha; None devolve a
+                primeira linha do jogador em qualquer temporada.
+
+        Returns:
+            PlayerRow: Visão da linha, que lê apenas os campos acessados.
+
+        Raises:
+            KeyError: Se o ID não existir na tabela ou na temporada.
+        """
+        return self._table.linha(self._posicao_por_id[(season, player_id)])
+
+    def posicao_por_nome(
+            self,
+            club: str,
+            name: str,
+            season: Optional[str] = None) -> int:
+        """Retorna a posição de um jogador na tabela pelo clube e nome.
+
+        Args:
+            club (str): Nome do clube.
+            name (str): Nome do jogador.
+            season (Optional[str]): Temporada da linha; None devolve a
+                primeira linha em qualquer temporada.
+
+        Returns:
+            int: Posição na tabela.
+
+        Raises:
+            KeyError: Se não houver jogador com esse nome no clube.
+        """
+        return self._posicao_por_nome[(season, club, name)]
+
+    def id_por_nome(
+            self,
+            club: str,
+            name: str,
+            season: Optional[str] = None) -> int:
+        """Retorna o ID de um jogador pelo clube e nome.
+
+        Args:
+            club (str): Nome do clube.
+            name (str): Nome do jogador.
+            season (Optional[str]): Temporada da linha; None considera a
+                primeira linha em qualquer temporada.
+
+        Returns:
+            int: ID do jogador.
+
+        Raises:
+            KeyError: Se não houver jogador com esse nome no clube.
+        """
+        return int(self._table.coluna('id')[
+            self.posicao_por_nome(club, name, season)])
+
+    def posicoes_elenco(self, club: str) -> np.ndarray:
+        """Retorna as posições dos jogadores de um clube na tabela.
+
+        Permite escolher uma linha do elenco sem depender de nome ou ID,
+        que se repetem entre temporadas.
+
+        Args:
+            club (str): Nome do clube.
+
+        Returns:
+            np.ndarray: Posições somente leitura, na ordem da tabela; vazio
+                se o clube não existir.
+        """
+        inicio, fim = self._intervalo_por_clube.get(club, (0, 0))
+        return self._posicoes_por_clube[inicio:fim]
+
+    def elenco(self, club: str) -> "PlayerTable":
+        """Retorna os jogadores de um clube, na ordem da tabela.
+
+        As colunas do resultado são fatias da cópia ordenada por clube, sem
+        cópia dos valores.
+
+        Args:
+            club (str): Nome do clube.
+
+        Returns:
+            PlayerTable: Jogadores do clube; vazia se o clube não existir.
+        """
+        inicio, fim = self._intervalo_por_clube.get(club, (0, 0))
+        return self._por_clube.take(slice(inicio, fim))
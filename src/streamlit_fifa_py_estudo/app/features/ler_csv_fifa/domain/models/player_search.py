@@ -0,0 +1,249 @@
+import re
+import sys
+import unicodedata
+from typing import TYPE_CHECKING, Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    BUSCA_LIMITE,
+    BUSCA_SIMILARIDADE_MIN,
+)
+
+_ACENTOS = re.compile('[\u0300-\u036f]')
+_SEPARADORES = re.compile(r'[\W_]+')
+
+if TYPE_CHECKING:
+    from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+        PlayerTable, )
+
+
+def normalizar(texto: str) -> str:
+    """Normaliza um texto para a busca, sem acentos e sem caixa.
+
+    Letras e dígitos são mantidos; pontuação e espaços repetidos viram um
+    único espaço.
+
+    Args:
+        texto (str): Texto original, como ``'Kylian Mbappé'``.
+
+    Returns:
+        str: Texto normalizado, como ``'kylian mbappe'``.
+    """
+    sem_acentos = _ACENTOS.sub('', unicodedata.normalize('NFKD', texto))
+    return _SEPARADORES.sub(' ', sem_acentos.casefold()).strip()
+
+
+def trigramas(texto: str) -> Set[str]:
+    """Retorna os trigramas de um texto já normalizado.
+
+    Cada palavra recebe dois espaços antes e um depois, como no pg_trgm, de
+    modo que o início das palavras pesa mais que o fim e palavras curtas
+    também geram trigramas.
+
+    Args:
+        texto (str): Texto normalizado.
+
+    Returns:
+        Set[str]: Trigramas distintos de todas as palavras.
+
+    Example:
+        ```python
+        trigramas('messi')  # {'  m', ' me', 'mes', 'ess', 'ssi', 'si '}
+        ```
+    """
+    resultado = set()
+    for palavra in texto.split():
+        palavra = f'  {palavra} '
+        resultado.update(map(''.join, zip(palavra, palavra[1:], palavra[2:])))
+    return resultado
+
+
+class IndiceTrigramas:
+    """Índice invertido de trigramas dos valores de uma coluna de texto.
+
+    Os valores da coluna são agrupados em termos distintos, de modo que um
+    nome repetido em várias temporadas é normalizado e indexado uma única
+    vez. Cada trigrama aponta para os termos que o contêm e cada termo para
+    as linhas em que aparece. Uma busca soma, com ``np.bincount``, os
+    trigramas da consulta encontrados em cada termo, sem percorrer a coluna.
+
+    Attributes:
+        _vocabulario (Dict[str, int]): Posição de cada trigrama.
+        _inicio_termos (np.ndarray): Início dos termos de cada trigrama em
+            ``_termos``; o trigrama ``i`` ocupa ``[inicio[i], inicio[i+1])``.
+        _termos (np.ndarray): Termos de cada trigrama, agrupados.
+        _tamanhos (np.ndarray): Quantidade de trigramas de cada termo.
+        _inicio_linhas (np.ndarray): Início das linhas de cada termo em
+            ``_linhas``, no mesmo formato de ``_inicio_termos``.
+        _linhas (np.ndarray): Linhas de cada termo, na ordem da tabela.
+    """
+    __slots__ = (
+        '_vocabulario',
+        '_inicio_termos',
+        '_termos',
+        '_tamanhos',
+        '_inicio_linhas',
+        '_linhas',
+    )
+
+    def __init__(self, valores: np.ndarray) -> None:
+        """Constrói o índice a partir dos valores de uma coluna.
+
+        Valores ausentes ficam fora do índice.
+
+        Args:
+            valores (np.ndarray): Valores da coluna, um por linha.
+        """
+        codigos, unicos = pd.factorize(valores)
+        codigos = codigos.astype(np.int64)
+        com_valor = np.flatnonzero(codigos >= 0)
+        self._linhas = com_valor[np.argsort(codigos[com_valor], kind='stable')]
+        self._inicio_linhas = np.concatenate(([0], np.cumsum(
+            np.bincount(codigos[com_valor], minlength=len(unicos)))))
+
+        por_termo = [trigramas(normalizar(str(termo))) for termo in unicos]
+        self._tamanhos = np.fromiter(
+            (len(termo) for termo in por_termo), dtype=np.int64,
+            count=len(por_termo))
+        todos = [trigrama for termo in por_termo for trigrama in termo]
+        codigos_trigramas, vocabulario = pd.factorize(
+            pd.Series(todos, dtype=object))
+        termos = np.repeat(np.arange(len(unicos)), self._tamanhos)
+        self._termos = termos[np.argsort(codigos_trigramas, kind='stable')]
+        self._inicio_termos = np.concatenate(([0], np.cumsum(
+            np.bincount(codigos_trigramas, minlength=len(vocabulario)))))
+        self._vocabulario: Dict[str, int] = {
+            trigrama: posicao
+            for posicao, trigrama in enumerate(vocabulario.tolist())
+        }
+
+    @property
+    def nbytes(self) -> int:
+        """Memória aproximada ocupada pelos arrays e pelo vocabulário."""
+        arrays = (self._inicio_termos, self._termos, self._tamanhos,
+                  self._inicio_linhas, self._linhas)
+        return (sum(array.nbytes for array in arrays)
+                + sys.getsizeof(self._vocabulario)
+                + len(self._vocabulario) * sys.getsizeof('abc'))
+
+    def pontuar(
+            self,
+            consulta: Set[str],
+            limite: int,
+            minimo: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Encontra os termos mais parecidos com os trigramas da consulta.
+
+        A pontuação principal é a fração dos trigramas da consulta contida
+        no termo, que tolera erros de digitação e consultas com só parte do
+        nome. Empates são desfeitos pela similaridade de Jaccard, que
+        favorece os termos sem trigramas sobrando.
+
+        Args:
+            consulta (Set[str]): Trigramas da consulta.
+            limite (int): Quantidade máxima de termos devolvidos.
+            minimo (float): Fração mínima dos trigramas da consulta.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Termos, da melhor
+                para a pior pontuação, e a fração e a similaridade de
+                Jaccard de cada um.
+        """
+        fatias = [
+            self._termos[self._inicio_termos[posicao]:
+                         self._inicio_termos[posicao + 1]]
+            for posicao in map(self._vocabulario.get, consulta)
+            if posicao is not None
+        ]
+        if not fatias:
+            vazio = np.empty(0)
+            return vazio.astype(np.int64), vazio, vazio
+
+        comuns = np.bincount(
+            np.concatenate(fatias), minlength=len(self._tamanhos))
+        termos = np.flatnonzero(
+            (comuns > 0) & (comuns >= minimo * len(consulta)))
+        comuns = comuns[termos]
+        fracao = comuns / len(consulta)
+        jaccard = comuns / (len(consulta) + self._tamanhos[termos] - comuns)
+        ordem = np.lexsort((termos, -jaccard, -fracao))[:limite]
+        return termos[ordem], fracao[ordem], jaccard[ordem]
+
+    def linhas(self, termos: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Retorna as linhas em que cada termo aparece.
+
+        Args:
+            termos (np.ndarray): Termos devolvidos por ``pontuar``.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Linhas de todos os termos, na
+                ordem dos termos, e a quantidade de linhas de cada termo.
+        """
+        inicios = self._inicio_linhas[termos]
+        fins = self._inicio_linhas[termos + 1]
+        linhas = [self._linhas[inicio:fim] for inicio, fim in zip(inicios, fins)]
+        return (np.concatenate(linhas) if linhas else np.empty(0, np.int64),
+                fins - inicios)
+
+
+def buscar_posicoes(
+        table: "PlayerTable",
+        consulta: str,
+        campos: Sequence[str] = ('name',),
+        limite: int = BUSCA_LIMITE,
+        minimo: float = BUSCA_SIMILARIDADE_MIN) -> np.ndarray:
+    """Busca jogadores por semelhança de texto em uma ou mais colunas.
+
+    Cada linha recebe a melhor pontuação entre as colunas consultadas; a
+    busca não exige que o nome esteja completo, correto ou acentuado.
+    Linhas com a mesma pontuação seguem a ordem da tabela.
+
+    Args:
+        table (PlayerTable): Tabela consultada; os índices de cada coluna
+            são montados na primeira busca e guardados na tabela.
+        consulta (str): Texto digitado, como ``'mbape'``.
+        campos (Sequence[str]): Colunas de texto consultadas.
+        limite (int): Quantidade máxima de linhas devolvidas.
+        minimo (float): Fração mínima dos trigramas da consulta que o valor
+            da coluna deve conter.
+
+    Returns:
+        np.ndarray: Posições das linhas encontradas, da mais parecida para
+            a menos parecida; vazio se a consulta não tiver letras ou
+            dígitos.
+
+    Raises:
+        KeyError: Se alguma coluna não existir.
+
+    Example:
+        ```python
+        posicoes = buscar_posicoes(table, 'mbape', campos=('name', 'club'))
+        player = table.linha(posicoes[0])
+        ```
+    """
+    trigramas_consulta = trigramas(normalizar(consulta))
+    if not trigramas_consulta:
+        return np.empty(0, dtype=np.int64)
+
+    linhas: List[np.ndarray] = []
+    fracoes: List[np.ndarray] = []
+    jaccards: List[np.ndarray] = []
+    for campo in campos:
+        indice = table.indice_texto(campo)
+        # Os `limite` melhores termos já têm ao menos `limite` linhas, que
+        # empatam ou vencem as linhas de qualquer outro termo
+        termos, fracao, jaccard = indice.pontuar(
+            trigramas_consulta, limite, minimo)
+        linhas_campo, contagens = indice.linhas(termos)
+        linhas.append(linhas_campo)
+        fracoes.append(np.repeat(fracao, contagens))
+        jaccards.append(np.repeat(jaccard, contagens))
+
+    linhas = np.concatenate(linhas)
+    ordem = np.lexsort(
+        (linhas, -np.concatenate(jaccards), -np.concatenate(fracoes)))
+    linhas = linhas[ordem]
+    # Uma linha encontrada por várias colunas fica com a melhor pontuação
+    _, primeiras = np.unique(linhas, return_index=True)
+    return linhas[np.sort(primeiras)][:limite]
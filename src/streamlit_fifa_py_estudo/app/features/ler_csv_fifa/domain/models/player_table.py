@@ -0,0 +1,777 @@
+import sys
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import fields
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.fifa_player import (
+    FifaPlayer, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_aggregates import (
+    Agregados, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_index import (
+    PlayerIndex, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_search import (
+    IndiceTrigramas,
+    buscar_posicoes,
+)
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    BUSCA_LIMITE,
+    BUSCA_SIMILARIDADE_MIN,
+)
+
+COLUNAS_PLAYER_TABLE: tuple[str, ...] = tuple(
+    campo.name for campo in fields(FifaPlayer))
+"""Nome das colunas da PlayerTable, na mesma ordem dos campos de FifaPlayer."""
+
+TIPOS_PLAYER_TABLE: Dict[str, str] = {
+    'id': 'int64',
+    'name': 'object',
+    'age': 'int64',
+    'photo': 'object',
+    'nationality': 'object',
+    'flag': 'object',
+    'overall': 'int64',
+    'club': 'object',
+    'club_logo': 'object',
+    'value': 'float64',
+    'wage': 'float64',
+    'position': 'object',
+    'joined': 'object',
+    'contract_valid_until': 'float64',
+    'height_m': 'float64',
+    'weight_kg': 'float64',
+    'release_clause': 'float64',
+}
+"""Tipo numpy de cada coluna da PlayerTable."""
+
+COLUNAS_TEXTO_CSV: Dict[str, str] = {
+    'Name': 'name',
+    'Photo': 'photo',
+    'Nationality': 'nationality',
+    'Flag': 'flag',
+    'Club': 'club',
+    'Club Logo': 'club_logo',
+    'Position': 'position',
+}
+"""Colunas do CSV copiadas sem conversão, com o nome usado na tabela."""
+
+COLUNAS_INTEIRAS_CSV: Dict[str, str] = {
+    'ID': 'id',
+    'Age': 'age',
+    'Overall': 'overall',
+}
+"""Colunas do CSV convertidas para inteiro, com o nome usado na tabela."""
+
+COLUNAS_MOEDA_CSV: Dict[str, str] = {
+    'Value(£)': 'value',
+    'Wage(£)': 'wage',
+    'Release Clause(£)': 'release_clause',
+}
+"""Colunas monetárias do CSV, que podem conter separador de milhar."""
+
+ORIGEM_CSV_PLAYER_TABLE: Dict[str, str] = {
+    **{destino: origem for origem, destino in COLUNAS_INTEIRAS_CSV.items()},
+    **{destino: origem for origem, destino in COLUNAS_TEXTO_CSV.items()},
+    **{destino: origem for origem, destino in COLUNAS_MOEDA_CSV.items()},
+    'joined': 'Joined',
+    'contract_valid_until': 'Contract Valid Until',
+    'height_m': 'Height(cm.)',
+    'weight_kg': 'Weight(lbs.)',
+}
+"""Coluna do CSV de onde vem cada coluna da PlayerTable."""
+
+
+class ColunaPreguicosa(ABC):
+    """Coluna da PlayerTable lida por inteiro apenas quando necessário.
+
+    Permite que fontes como arquivos mapeados em memória entreguem colunas
+    sem copiá-las: valores isolados são lidos diretamente da fonte e o array
+    completo só é criado quando a coluna inteira é pedida.
+    """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Retorna a quantidade de valores da coluna."""
+
+    @abstractmethod
+    def materializar(self) -> np.ndarray:
+        """Cria o array numpy com todos os valores da coluna."""
+
+    @abstractmethod
+    def valor(self, posicao: int) -> Any:
+        """Lê um único valor, sem criar o array completo."""
+
+    @abstractmethod
+    def take(self, posicoes: np.ndarray) -> "ColunaPreguicosa":
+        """Seleciona valores pelas posições, mantendo a leitura adiada."""
+
+    @property
+    @abstractmethod
+    def nbytes(self) -> int:
+        """Memória aproximada que a coluna ocupará depois de materializada."""
+
+
+def _arredondar(valores: np.ndarray, casas: int) -> np.ndarray:
+    """Arredonda um array exatamente como o ``round`` do Python.
+
+    O ``np.round`` escala o valor antes de arredondar e pode divergir do
+    ``round`` nos valores muito próximos da metade. Apenas esses valores são
+    recalculados com o ``round``.
+    """
+    arredondado = np.round(valores, casas)
+    escala = valores * 10 ** casas
+    ambiguos = np.isfinite(valores) & (
+        np.abs(escala - np.floor(escala) - 0.5) < 1e-6)
+    if ambiguos.any():
+        arredondado[ambiguos] = [
+            round(float(valor), casas) for valor in valores[ambiguos]]
+    return arredondado
+
+
+def _converter_inteiro(serie: pd.Series) -> np.ndarray:
+    """Converte uma coluna inteira do CSV em int64.
+
+    Falha, como ``int(valor)``, em valores ausentes, em vez de deixar o
+    ``astype`` transformá-los no menor int64; valores com parte decimal
+    também são recusados.
+
+    Raises:
+        ValueError: Se algum valor estiver ausente ou não for inteiro.
+    """
+    if serie.isna().any():
+        raise ValueError('cannot convert float NaN to integer')
+    valores = serie.to_numpy()
+    if pd.api.types.is_float_dtype(valores.dtype):
+        if not np.all(np.isfinite(valores)):
+            raise ValueError('cannot convert float infinity to integer')
+        if not np.all(np.mod(valores, 1) == 0):
+            raise ValueError(f'Valores não inteiros na coluna {serie.name}')
+    return valores.astype('int64')
+
+
+def _converter_moeda(serie: pd.Series) -> np.ndarray:
+    """Converte uma coluna monetária do CSV em float.
+
+    Equivale a ``float(str(valor).replace(',', ''))``, com valores vazios
+    convertidos para 0.0.
+    """
+    if pd.api.types.is_numeric_dtype(serie.dtype):
+        return serie.to_numpy(dtype='float64', copy=True)
+    valores = serie.to_numpy(dtype=object)
+    vazios = np.equal(valores, None) | np.equal(valores, '')
+    texto = pd.Series(valores).where(~vazios, '0').astype(str)
+    return texto.str.replace(',', '', regex=False).to_numpy(dtype='float64')
+
+
+def _converter_joined(serie: pd.Series) -> np.ndarray:
+    """Converte a coluna Joined em datas ISO ``AAAA-MM-DD`` ou None."""
+    datas = pd.to_datetime(serie, format='%Y-%m-%d')
+    texto = datas.dt.strftime('%Y-%m-%d').to_numpy(dtype=object)
+    texto[datas.isna().to_numpy()] = None
+    return texto
+
+
+class PlayerTable:
+    """Tabela colunar e imutável com os dados dos jogadores do FIFA 23.
+
+    Armazena cada atributo de FifaPlayer em um array numpy somente leitura,
+    evitando manter um dicionário por jogador. O DataFrame usado pelas
+    páginas é montado uma única vez, sobre os mesmos arrays, e reaproveitado
+    em todas as execuções do Streamlit que compartilham a tabela. Colunas
+    preguiçosas só são convertidas em array na primeira leitura completa.
+
+    Attributes:
+        _colunas (Dict[str, Union[np.ndarray, ColunaPreguicosa]]): Arrays
+            somente leitura ou colunas preguiçosas, indexados pelo nome.
+        _frame (Optional[pd.DataFrame]): DataFrame montado sob demanda.
+        _nbytes (Optional[int]): Memória ocupada, calculada sob demanda.
+        _indices (Optional[PlayerIndex]): Índices montados sob demanda.
+        _ordens (Dict[Tuple[str, bool], np.ndarray]): Ordenações já
+            calculadas, por coluna e sentido.
+        _indices_texto (Dict[str, IndiceTrigramas]): Índices de busca já
+            montados, por coluna.
+        _agregados (Dict[str, Agregados]): Somas por grupo já calculadas,
+            por coluna agrupada.
+        _partes (Optional[Tuple[str, Dict[str, PlayerTable]]]): Coluna de
+            origem e tabelas que formaram esta, se ela veio de
+            ``concatenar``.
+        _lock (threading.RLock): Garante que cada coluna preguiçosa e cada
+            estrutura montada sob demanda seja criada uma única vez, mesmo
+            quando várias sessões a pedem ao mesmo tempo.
+
+    Example:
+        ```python
+        table = PlayerTable.from_players(players)
+        clubes = table.coluna('club')
+        print(table[0]['name'])  # Output: "K. De Bruyne"
+        ```
+    """
+    __slots__ = (
+        '_colunas',
+        '_frame',
+        '_nbytes',
+        '_indices',
+        '_ordens',
+        '_indices_texto',
+        '_agregados',
+        '_partes',
+        '_lock',
+    )
+
+    def __init__(
+            self,
+            colunas: Mapping[str, Union[np.ndarray, ColunaPreguicosa]]) -> None:
+        """Cria a tabela a partir de um mapeamento de colunas.
+
+        Os arrays recebidos passam a pertencer à tabela e são marcados como
+        somente leitura. Colunas preguiçosas são mantidas como recebidas.
+
+        Args:
+            colunas (Mapping[str, Union[np.ndarray, ColunaPreguicosa]]):
+                Colunas de mesmo tamanho indexadas pelo nome.
+
+        Raises:
+            ValueError: Se as colunas tiverem tamanhos diferentes.
+        """
+        tamanhos = {len(valores) for valores in colunas.values()}
+        if len(tamanhos) > 1:
+            raise ValueError(
+                f"Colunas com tamanhos diferentes: {sorted(tamanhos)}")
+
+        self._colunas: Dict[str, Union[np.ndarray, ColunaPreguicosa]] = {}
+        for nome, valores in colunas.items():
+            if isinstance(valores, ColunaPreguicosa):
+                self._colunas[nome] = valores
+                continue
+            array = np.asarray(valores)
+            array.flags.writeable = False
+            self._colunas[nome] = array
+        self._frame: Optional[pd.DataFrame] = None
+        self._nbytes: Optional[int] = None
+        self._indices: Optional[PlayerIndex] = None
+        self._ordens: Dict[Tuple[str, bool], np.ndarray] = {}
+        self._indices_texto: Dict[str, IndiceTrigramas] = {}
+        self._agregados: Dict[str, Agregados] = {}
+        self._partes: Optional[Tuple[str, Dict[str, PlayerTable]]] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_players(cls, players: Sequence[FifaPlayer]) -> "PlayerTable":
+        """Cria uma PlayerTable a partir de uma lista de FifaPlayer.
+
+        Args:
+            players (Sequence[FifaPlayer]): Jogadores na ordem desejada.
+
+        Returns:
+            PlayerTable: Nova tabela com uma linha por jogador.
+        """
+        colunas: Dict[str, np.ndarray] = {}
+        for nome in COLUNAS_PLAYER_TABLE:
+            valores = [getattr(player, nome) for player in players]
+            if nome == 'joined':
+                valores = [
+                    joined.isoformat() if joined else None
+                    for joined in valores
+                ]
+            array = np.empty(len(valores), dtype=TIPOS_PLAYER_TABLE[nome])
+            array[:] = valores
+            colunas[nome] = array
+        return cls(colunas)
+
+    @classmethod
+    def from_csv_frame(
+            cls,
+            df: pd.DataFrame,
+            colunas: Optional[Sequence[str]] = None) -> "PlayerTable":
+        """Cria uma PlayerTable a partir do DataFrame lido do CSV.
+
+        Aplica, coluna a coluna, as mesmas conversões de
+        FifaPlayer.from_csv_row: remoção do separador de milhar dos valores
+        monetários, conversão da altura para metros e do peso para
+        quilogramas com duas casas decimais e validação das datas de Joined.
+        O resultado é idêntico ao de aplicar from_csv_row e to_dict em cada
+        linha, sem criar objetos por jogador. Datas de Joined ausentes viram
+        None em vez de interromper a leitura.
+
+        Args:
+            df (pd.DataFrame): DataFrame com as colunas originais do CSV.
+            colunas (Optional[Sequence[str]]): Colunas da PlayerTable a
+                converter; None converte todas. Só as colunas do CSV
+                correspondentes precisam estar em ``df``.
+
+        Returns:
+            PlayerTable: Nova tabela, na mesma ordem das linhas do CSV.
+
+        Raises:
+            KeyError: Se alguma coluna obrigatória estiver ausente.
+            ValueError: Se algum valor não puder ser convertido.
+
+        Example:
+            ```python
+            df = pd.read_csv("fifa23.csv", index_col=0)
+            table = PlayerTable.from_csv_frame(df)
+            ```
+        """
+        if colunas is None:
+            colunas = COLUNAS_PLAYER_TABLE
+        if len(df) == 0:
+            return cls({
+                nome: np.empty(0, dtype=TIPOS_PLAYER_TABLE[nome])
+                for nome in colunas
+            })
+
+        convertidas: Dict[str, np.ndarray] = {}
+        for nome in colunas:
+            serie = df[ORIGEM_CSV_PLAYER_TABLE[nome]]
+            if nome in COLUNAS_INTEIRAS_CSV.values():
+                convertidas[nome] = _converter_inteiro(serie)
+            elif nome in COLUNAS_TEXTO_CSV.values():
+                convertidas[nome] = serie.to_numpy(dtype=object, copy=True)
+            elif nome in COLUNAS_MOEDA_CSV.values():
+                convertidas[nome] = _converter_moeda(serie)
+            elif nome == 'joined':
+                convertidas[nome] = _converter_joined(serie)
+            elif nome == 'contract_valid_until':
+                convertidas[nome] = serie.to_numpy(dtype='float64', copy=True)
+            elif nome == 'height_m':
+                convertidas[nome] = _arredondar(
+                    serie.to_numpy(dtype='float64') / 100, 2)
+            elif nome == 'weight_kg':
+                convertidas[nome] = _arredondar(
+                    serie.to_numpy(dtype='float64') * 0.453, 2)
+
+        return cls(convertidas)
+
+    @classmethod
+    def concatenar(
+            cls,
+            tabelas: Mapping[str, "PlayerTable"],
+            coluna: str = 'season') -> "PlayerTable":
+        """Junta várias tabelas em uma, identificando a origem de cada linha.
+
+        As linhas mantêm a ordem das tabelas recebidas e, dentro de cada uma,
+        a ordem original. Só as colunas presentes em todas as tabelas são
+        mantidas. A nova tabela guarda as recebidas para montar seus
+        agregados a partir dos agregados delas.
+
+        Args:
+            tabelas (Mapping[str, PlayerTable]): Tabelas indexadas pelo nome
+                da origem, como a temporada.
+            coluna (str): Nome da coluna que recebe o nome da origem.
+
+        Returns:
+            PlayerTable: Nova tabela com as linhas de todas as tabelas e a
+                coluna de origem ao final.
+
+        Example:
+            ```python
+            table = PlayerTable.concatenar({'FIFA23': fifa23, 'FIFA22': fifa22})
+            print(table[0]['season'])  # Output: "FIFA23"
+            ```
+        """
+        partes = list(tabelas.values())
+        nomes = [
+            nome for nome in (partes[0].colunas if partes else ())
+            if all(nome in parte._colunas for parte in partes[1:])
+        ]
+        colunas: Dict[str, np.ndarray] = {
+            nome: np.concatenate([parte.coluna(nome) for parte in partes])
+            for nome in nomes
+        }
+        origens = np.empty(len(tabelas), dtype=object)
+        origens[:] = list(tabelas)
+        colunas[coluna] = np.repeat(
+            origens, [len(parte) for parte in partes])
+        table = cls(colunas)
+        table._partes = (coluna, dict(tabelas))
+        return table
+
+    @property
+    def colunas(self) -> tuple[str, ...]:
+        """Nomes das colunas disponíveis na tabela."""
+        return tuple(self._colunas)
+
+    def coluna(self, nome: str) -> np.ndarray:
+        """Retorna o array somente leitura de uma coluna.
+
+        Colunas preguiçosas são materializadas na primeira chamada e o array
+        resultante é reaproveitado nas seguintes.
+
+        Args:
+            nome (str): Nome da coluna.
+
+        Returns:
+            np.ndarray: Valores da coluna, sem cópia.
+
+        Raises:
+            KeyError: Se a coluna não existir.
+        """
+        valores = self._colunas[nome]
+        if isinstance(valores, ColunaPreguicosa):
+            with self._lock:
+                valores = self._colunas[nome]
+                if isinstance(valores, ColunaPreguicosa):
+                    valores = valores.materializar()
+                    valores.flags.writeable = False
+                    self._colunas[nome] = valores
+        return valores
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        """DataFrame somente leitura que compartilha os arrays da tabela.
+
+        É montado na primeira chamada e reaproveitado nas seguintes. Filtros
+        e seleções geram novos DataFrames; escrever diretamente neste gera
+        ``ValueError``.
+        """
+        if self._frame is None:
+            with self._lock:
+                if self._frame is None:
+                    self._frame = pd.DataFrame(
+                        {nome: self.coluna(nome) for nome in self._colunas},
+                        copy=False)
+        return self._frame
+
+    @property
+    def nbytes(self) -> int:
+        """Memória aproximada ocupada pela tabela, incluindo os textos.
+
+        Colunas preguiçosas contam pelo tamanho que terão depois de
+        materializadas, de modo que ler a tabela inteira não ultrapassa o
+        orçamento do cache. Índices, ordenações e agregados contam a partir
+        do momento em que são montados.
+
+        Não usa o lock da tabela, para não esperar a montagem de um índice:
+        duas threads podem medir as colunas ao mesmo tempo, com o mesmo
+        resultado, já que materializar uma coluna não muda o seu tamanho.
+        """
+        if self._nbytes is None:
+            total = 0
+            for valores in list(self._colunas.values()):
+                total += valores.nbytes
+                if (not isinstance(valores, ColunaPreguicosa)
+                        and valores.dtype == object):
+                    total += sum(sys.getsizeof(valor) for valor in valores)
+            self._nbytes = total
+        return self._nbytes + self._nbytes_derivados()
+
+    @property
+    def nbytes_colunas(self) -> int:
+        """Memória dos arrays da tabela, sem os objetos de texto.
+
+        Os textos de uma tabela criada por ``take`` são os mesmos objetos da
+        tabela original; colunas preguiçosas contam pelo tamanho
+        materializado, que terá textos próprios.
+        """
+        return sum(valores.nbytes for valores in self._colunas.values())
+
+    def _nbytes_derivados(self) -> int:
+        # Cópias das estruturas, que outras threads podem estar aumentando
+        total = sum(ordem.nbytes for ordem in list(self._ordens.values()))
+        total += sum(
+            indice.nbytes for indice in list(self._indices_texto.values()))
+        total += sum(
+            agregados.nbytes for agregados in list(self._agregados.values()))
+        indices = self._indices
+        if indices is not None:
+            total += indices.nbytes
+        return total
+
+    @property
+    def indices(self) -> PlayerIndex:
+        """Índices por ID, clube e (clube, nome), montados uma única vez.
+
+        Como a tabela é compartilhada entre as sessões, os índices também
+        são, e cada troca de seleção nas páginas custa apenas uma consulta
+        a dicionário.
+        """
+        if self._indices is None:
+            with self._lock:
+                if self._indices is None:
+                    self._indices = PlayerIndex(self)
+        return self._indices
+
+    def ordem(self, nome: str, descending: bool = False) -> np.ndarray:
+        """Retorna as posições das linhas ordenadas por uma coluna.
+
+        A ordenação é estável, mantendo a ordem da tabela nos empates também
+        na ordem decrescente, e deixa os valores ausentes por último. Ela é
+        calculada uma vez por coluna e sentido; as páginas de uma tabela
+        ordenada são apenas fatias do array devolvido.
+
+        Args:
+            nome (str): Nome da coluna.
+            descending (bool): Se True, do maior para o menor.
+
+        Returns:
+            np.ndarray: Posições somente leitura, na ordem pedida.
+
+        Raises:
+            KeyError: Se a coluna não existir.
+        """
+        chave = (nome, descending)
+        if chave not in self._ordens:
+            with self._lock:
+                if chave not in self._ordens:
+                    ordem = pd.Series(self.coluna(nome)).sort_values(
+                        ascending=not descending, kind='stable',
+                        na_position='last').index.to_numpy()
+                    ordem.flags.writeable = False
+                    self._ordens[chave] = ordem
+        return self._ordens[chave]
+
+    def indice_texto(self, nome: str) -> IndiceTrigramas:
+        """Retorna o índice de trigramas de uma coluna de texto.
+
+        O índice é montado uma vez por coluna e, como a tabela, compartilhado
+        entre as sessões.
+
+        Args:
+            nome (str): Nome da coluna.
+
+        Returns:
+            IndiceTrigramas: Índice usado por ``buscar``.
+
+        Raises:
+            KeyError: Se a coluna não existir.
+        """
+        if nome not in self._indices_texto:
+            with self._lock:
+                if nome not in self._indices_texto:
+                    self._indices_texto[nome] = IndiceTrigramas(
+                        self.coluna(nome))
+        return self._indices_texto[nome]
+
+    def buscar(
+            self,
+            consulta: str,
+            campos: Sequence[str] = ('name',),
+            limite: int = BUSCA_LIMITE,
+            minimo: float = BUSCA_SIMILARIDADE_MIN) -> np.ndarray:
+        """Busca jogadores por nome, ignorando acentos e erros de digitação.
+
+        Veja ``buscar_posicoes`` para os detalhes da pontuação.
+
+        Args:
+            consulta (str): Texto digitado.
+            campos (Sequence[str]): Colunas de texto consultadas.
+            limite (int): Quantidade máxima de linhas devolvidas.
+            minimo (float): Fração mínima dos trigramas da consulta que o
+                valor da coluna deve conter.
+
+        Returns:
+            np.ndarray: Posições das linhas encontradas, da mais parecida
+                para a menos parecida.
+
+        Example:
+            ```python
+            posicoes = table.buscar('mbape')
+            print(table[posicoes[0]]['name'])  # Output: "K. Mbappé"
+            ```
+        """
+        return buscar_posicoes(self, consulta, campos, limite, minimo)
+
+    def agregados(self, grupo: str) -> Agregados:
+        """Retorna a quantidade de jogadores e as somas de cada grupo.
+
+        As somas são calculadas uma vez por coluna e, como a tabela,
+        compartilhadas entre as sessões. Uma tabela criada por
+        ``concatenar`` junta os agregados das tabelas que a formaram, sem
+        percorrer suas linhas: cada temporada é somada uma única vez, mesmo
+        quando aparece em várias uniões.
+
+        Args:
+            grupo (str): Coluna agrupada, como ``'club'``.
+
+        Returns:
+            Agregados: Somas por temporada e grupo, usadas pelos rankings.
+
+        Raises:
+            KeyError: Se a coluna não existir.
+
+        Example:
+            ```python
+            clubes = table.agregados('club').ranking('wage_bill')
+            ```
+        """
+        if grupo not in self._agregados:
+            with self._lock:
+                if grupo not in self._agregados:
+                    self._agregados[grupo] = self._somar(grupo)
+        return self._agregados[grupo]
+
+    def _somar(self, grupo: str) -> Agregados:
+        if self._partes is None:
+            return Agregados.from_table(self, grupo)
+        origem, partes = self._partes
+        return Agregados.concatenar(
+            {nome: parte.agregados(grupo) for nome, parte in partes.items()},
+            origem)
+
+    def take(self, posicoes: Union[np.ndarray, slice]) -> "PlayerTable":
+        """Cria uma nova tabela com as linhas nas posições informadas.
+
+        Args:
+            posicoes (Union[np.ndarray, slice]): Posições das linhas, na
+                ordem desejada, ou uma fatia contínua.
+
+        Returns:
+            PlayerTable: Nova tabela com as linhas selecionadas; com uma
+                fatia, as colunas compartilham os valores desta tabela.
+        """
+        if isinstance(posicoes, slice) and any(
+                isinstance(valores, ColunaPreguicosa)
+                for valores in self._colunas.values()):
+            posicoes = np.arange(len(self))[posicoes]
+        return PlayerTable({
+            nome: valores.take(posicoes)
+            if isinstance(valores, ColunaPreguicosa)
+            else valores[posicoes]
+            for nome, valores in self._colunas.items()
+        })
+
+    def __len__(self) -> int:
+        """Retorna a quantidade de jogadores na tabela."""
+        if not self._colunas:
+            return 0
+        return len(next(iter(self._colunas.values())))
+
+    def _posicao_valida(self, posicao: int) -> int:
+        if not -len(self) <= posicao < len(self):
+            raise IndexError(f"Posição fora da tabela: {posicao}")
+        return posicao % len(self)
+
+    def _valor(self, nome: str, posicao: int) -> Any:
+        valores = self._colunas[nome]
+        if isinstance(valores, ColunaPreguicosa):
+            return valores.valor(posicao)
+        valor = valores[posicao]
+        return valor.item() if isinstance(valor, np.generic) else valor
+
+    def __getitem__(self, posicao: int) -> dict:
+        """Retorna uma linha da tabela no formato de FifaPlayer.to_dict().
+
+        Args:
+            posicao (int): Posição da linha, aceitando índices negativos.
+
+        Returns:
+            dict: Dicionário com os valores da linha em tipos nativos.
+
+        Raises:
+            IndexError: Se a posição estiver fora da tabela.
+        """
+        posicao = self._posicao_valida(posicao)
+        return {nome: self._valor(nome, posicao) for nome in self._colunas}
+
+    def linha(self, posicao: int) -> "PlayerRow":
+        """Retorna uma visão de uma linha, sem copiar seus valores.
+
+        Args:
+            posicao (int): Posição da linha, aceitando índices negativos.
+
+        Returns:
+            PlayerRow: Visão que lê cada campo da tabela quando acessado.
+
+        Raises:
+            IndexError: Se a posição estiver fora da tabela.
+        """
+        return PlayerRow(self, self._posicao_valida(posicao))
+
+    def linhas(self) -> Iterator["PlayerRow"]:
+        """Itera sobre as linhas da tabela como visões PlayerRow."""
+        for posicao in range(len(self)):
+            yield PlayerRow(self, posicao)
+
+    def __iter__(self) -> Iterator[dict]:
+        """Itera sobre as linhas da tabela como dicionários."""
+        for posicao in range(len(self)):
+            yield self[posicao]
+
+    def to_dicts(self) -> List[dict]:
+        """Converte a tabela em uma lista de dicionários.
+
+        Returns:
+            List[dict]: Uma entrada por jogador, no formato de
+                FifaPlayer.to_dict().
+        """
+        return list(self)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação resumida da tabela."""
+        return f'PlayerTable(linhas={len(self)}, colunas={len(self._colunas)})'
+
+
+class PlayerRow(Mapping):
+    """Visão somente leitura de uma linha da PlayerTable.
+
+    Ocupa apenas a referência à tabela e a posição: cada campo é lido da
+    coluna correspondente quando acessado, por chave (``row['name']``) ou
+    por atributo (``row.name``). Como Mapping, compara igual ao dicionário
+    de FifaPlayer.to_dict() com os mesmos valores.
+
+    Attributes:
+        _table (PlayerTable): Tabela de origem.
+        _posicao (int): Posição da linha na tabela.
+
+    Example:
+        ```python
+        row = table.linha(0)
+        print(row.name, row['overall'])
+        player = row.to_player()
+        ```
+    """
+    __slots__ = ('_table', '_posicao')
+
+    def __init__(self, table: PlayerTable, posicao: int) -> None:
+        self._table = table
+        self._posicao = posicao
+
+    def __getitem__(self, nome: str) -> Any:
+        if nome not in self._table._colunas:
+            raise KeyError(nome)
+        return self._table._valor(nome, self._posicao)
+
+    def __getattr__(self, nome: str) -> Any:
+        try:
+            return self[nome]
+        except KeyError:
+            raise AttributeError(nome) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table._colunas)
+
+    def __len__(self) -> int:
+        return len(self._table._colunas)
+
+    def to_dict(self) -> dict:
+        """Copia a linha para um dicionário no formato de
+        FifaPlayer.to_dict()."""
+        return self._table[self._posicao]
+
+    def to_player(self) -> FifaPlayer:
+        """Cria o FifaPlayer da linha, para código que precisa do objeto.
+
+        Colunas extras da tabela, como a temporada, são ignoradas.
+
+        Returns:
+            FifaPlayer: Jogador com os valores da linha.
+
+        Raises:
+            TypeError: Se a tabela não tiver todas as colunas de FifaPlayer.
+        """
+        valores = {
+            nome: valor for nome, valor in self.to_dict().items()
+            if nome in COLUNAS_PLAYER_TABLE
+        }
+        if valores.get('joined') is not None:
+            valores['joined'] = date.fromisoformat(valores['joined'])
+        return FifaPlayer(**valores)
+
+    def __repr__(self) -> str:
+        """Retorna uma representação resumida da linha."""
+        return f'PlayerRow(posicao={self._posicao}, {self.to_dict()!r})'
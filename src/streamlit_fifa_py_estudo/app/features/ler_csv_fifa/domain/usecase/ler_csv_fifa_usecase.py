@@ -1,43 +1,61 @@
-from datetime import datetime
-from typing import List
+from datetime import date
 
+import numpy as np
+import pandas as pd
 from py_return_success_or_error import (
     ErrorReturn,
     ReturnSuccessOrError,
     SuccessReturn,
 )
 
-from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.fifa_player import (
-    FifaPlayer, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
 from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError
 from streamlit_fifa_py_estudo.app.utils.parameters import LoadCsvParameters
+from streamlit_fifa_py_estudo.app.utils.tracing import span
 from streamlit_fifa_py_estudo.app.utils.types import LCFUsecase
 
 
+def _ordenar(valores: np.ndarray, descending: bool) -> np.ndarray:
+    """Retorna as posições que ordenam os valores.
+
+    Como em ``PlayerTable.ordem``, a ordenação estável mantém a ordem do
+    arquivo nos empates, inclusive na ordem decrescente, e deixa os valores
+    ausentes por último nos dois sentidos.
+    """
+    return pd.Series(valores).sort_values(
+        ascending=not descending, kind='stable',
+        na_position='last').index.to_numpy()
+
+
 class LerCsvFifaUseCase(LCFUsecase):
     """Caso de uso para leitura e processamento de dados de jogadores do FIFA 23 de um CSV.
 
     Esta classe implementa a lógica de negócio para carregar dados de jogadores,
-    aplicar filtros e ordenação, e converter os resultados em dicionários.
+    aplicar filtros e ordenação, e converter os resultados em uma PlayerTable.
 
     Attributes:
         _datasource (LCFData): Fonte de dados que implementa a interface LCFData.
     """
 
     def __call__(
-            self, parameters: LoadCsvParameters) -> ReturnSuccessOrError[List[dict]]:
+            self, parameters: LoadCsvParameters) -> ReturnSuccessOrError[PlayerTable]:
         """Executa o caso de uso de leitura do CSV.
 
-        Carrega os dados do CSV, aplica filtros para remover jogadores inativos
-        ou com overall 0, ordena por overall e converte para dicionários.
+        Carrega os dados do CSV, aplica filtros para remover jogadores com
+        contrato encerrado na data de referência ou com overall abaixo do
+        mínimo, além dos critérios extras dos parâmetros, e ordena pela
+        coluna escolhida. Filtros e ordenação são feitos sobre as colunas
+        inteiras, sem laços por jogador.
 
         Args:
             parameters (LoadCsvParameters): Parâmetros para carregamento do CSV,
-                incluindo o caminho do arquivo.
+                incluindo o caminho do arquivo e os critérios de filtro e
+                ordenação.
 
         Returns:
-            ReturnSuccessOrError[List[dict]]:
-                Em caso de sucesso: SuccessReturn contendo lista de dicionários com dados dos jogadores.
+            ReturnSuccessOrError[PlayerTable]:
+                Em caso de sucesso: SuccessReturn contendo a PlayerTable com dados dos jogadores.
                 Em caso de erro: ErrorReturn contendo detalhes do erro ocorrido.
 
         Example:
@@ -49,26 +67,33 @@ class LerCsvFifaUseCase(LCFUsecase):
                 players = result.result
             ```
         """
-        # class responsável pelo tratamento da lista List[FifaPlayer] que vem
-        # do datasource
+        # class responsável pelo tratamento da PlayerTable que vem do
+        # datasource
         try:
-            result_dict: List[dict] = []
+            table = PlayerTable.from_players([])
             result = self._resultDatasource(
                 parameters=parameters, datasource=self._datasource
             )
             if isinstance(result, SuccessReturn):
-                data: List[FifaPlayer] = result.result
-                data = [
-                    player for player in data if player.overall > 0 and int(
-                        player.contract_valid_until) >= datetime.today().year
-                ]
-                data = sorted(data, key=lambda x: x.overall, reverse=True)
+                data: PlayerTable = result.result
+                with span('usecase.filtrar', rows_lidas=len(data)) as atual:
+                    as_of = parameters.as_of or date.today()
+                    mascara = (
+                        (data.coluna('overall') >= parameters.min_overall)
+                        & (np.trunc(data.coluna('contract_valid_until'))
+                           >= as_of.year))
+                    for filtro in parameters.filters:
+                        mascara &= np.asarray(filtro(data), dtype=bool)
+                    ativos = np.flatnonzero(mascara)
 
-                result_dict = [player.to_dict() for player in data]
+                    table = data.take(ativos[_ordenar(
+                        data.coluna(parameters.sort_by)[ativos],
+                        parameters.descending)])
+                    atual.registrar(rows=len(table))
 
             if isinstance(result, ErrorReturn):
                 return result
 
-            return SuccessReturn(result_dict)
+            return SuccessReturn(table)
         except Exception as e:
             return ErrorReturn(LoadCsvFifaError(str(e)))
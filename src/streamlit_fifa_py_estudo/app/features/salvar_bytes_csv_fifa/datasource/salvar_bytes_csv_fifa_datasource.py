@@ -1,20 +1,101 @@
+import threading
+from collections import OrderedDict
+from contextlib import suppress
 from io import BytesIO
+from itertools import count
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 import pandas as pd
 
-from streamlit_fifa_py_estudo.app.utils.consts import PASTA_DATASETS
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.datasource.load_csv_pandas_datasource import (
+    ler_csv_fifa_frame, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.domain.models.save_csv_result import (
+    SaveCsvResult, )
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    COLUNAS_CSV_FIFA,
+    LINHAS_POR_CHUNK_VALIDACAO,
+    PASTA_DATASETS,
+    VALIDACOES_MEMORIZADAS,
+)
+from streamlit_fifa_py_estudo.app.utils.hashing import hash_arquivo, hash_bytes
 from streamlit_fifa_py_estudo.app.utils.parameters import SaveCsvParameters
+from streamlit_fifa_py_estudo.app.utils.sidecar import (
+    caminho_sidecar,
+    escrever_sidecar,
+)
+from streamlit_fifa_py_estudo.app.utils.tracing import span
 from streamlit_fifa_py_estudo.app.utils.types import SCFData
 
 
+def _tipos_leitura() -> Dict[str, Any]:
+    return {
+        coluna: str if tipo == 'object' else tipo
+        for coluna, tipo in COLUNAS_CSV_FIFA.items()
+    }
+
+
+def _valores_invalidos(valores: pd.Series, tipo: str) -> pd.Series:
+    numeros = pd.to_numeric(valores, errors='coerce')
+    invalidos = valores.notna() & numeros.isna()
+    if tipo == 'int64':
+        invalidos |= numeros.isna() | (numeros % 1 != 0)
+    return invalidos
+
+
+def _descrever_erro_tipo(
+        bytes_csv: bytes, indice_chunk: int) -> Optional[str]:
+    """Localiza a primeira célula com tipo inválido de um chunk rejeitado.
+
+    O chunk é lido novamente com todas as colunas como texto, o que só
+    acontece quando a validação já falhou. Retorna None se o erro não for
+    de tipo, como uma linha malformada.
+    """
+    leitor = pd.read_csv(
+        BytesIO(bytes_csv),
+        usecols=list(COLUNAS_CSV_FIFA),
+        dtype=str,
+        chunksize=LINHAS_POR_CHUNK_VALIDACAO,
+    )
+    with leitor:
+        for _ in range(indice_chunk):
+            next(leitor)
+        chunk = next(leitor)
+
+    erros = []
+    for coluna, tipo in COLUNAS_CSV_FIFA.items():
+        if tipo == 'object':
+            continue
+        invalidos = _valores_invalidos(chunk[coluna], tipo)
+        if invalidos.any():
+            posicao = int(invalidos.to_numpy().argmax())
+            erros.append((posicao, coluna, tipo))
+    if not erros:
+        return None
+
+    posicao, coluna, tipo = min(erros, key=lambda erro: erro[0])
+    valor = chunk[coluna].iloc[posicao]
+    encontrado = 'float64' if pd.isna(valor) or pd.notna(
+        pd.to_numeric(valor, errors='coerce')) else 'object'
+    # Linha do arquivo, contando o cabeçalho como linha 1
+    linha = indice_chunk * LINHAS_POR_CHUNK_VALIDACAO + posicao + 2
+    return (f"Coluna {coluna} tem tipo {encontrado}, esperado {tipo} "
+            f"(linha {linha}, valor {valor!r})")
+
+
 def validate_fifa_csv(bytes_csv: bytes) -> tuple[bool, Optional[str]]:
     """Valida se um arquivo CSV em bytes contém os dados esperados de jogadores FIFA.
 
     Verifica se o CSV possui as colunas necessárias com os tipos de dados corretos
     para ser considerado um arquivo válido de dados de jogadores FIFA.
 
+    O cabeçalho é conferido antes de qualquer linha ser lida. Em seguida só
+    as colunas de COLUNAS_CSV_FIFA são lidas, já com seus tipos, em blocos
+    de LINHAS_POR_CHUNK_VALIDACAO linhas; a leitura para no primeiro bloco
+    com um valor inválido, e a mensagem indica a coluna e a linha dele.
+
     Args:
         bytes_csv (bytes): Conteúdo do arquivo CSV em formato bytes.
 
@@ -33,43 +114,31 @@ def validate_fifa_csv(bytes_csv: bytes) -> tuple[bool, Optional[str]]:
                 print(f"Erro na validação: {error}")
         ```
     """
-    expected_columns = {
-        'ID': 'int64',
-        'Name': 'object',
-        'Age': 'int64',
-        'Photo': 'object',
-        'Nationality': 'object',
-        'Flag': 'object',
-        'Overall': 'int64',
-        'Club': 'object',
-        'Club Logo': 'object',
-        'Value(£)': 'float64',
-        'Wage(£)': 'float64',
-        'Position': 'object',
-        'Joined': 'object',
-        'Contract Valid Until': 'float64',
-        'Height(cm.)': 'float64',
-        'Weight(lbs.)': 'float64',
-        'Release Clause(£)': 'float64',
-    }
-
     try:
-        df = pd.read_csv(BytesIO(bytes_csv))
-        if 'Height(cm.)' in df.columns:
-            df['Height(cm.)'] = df['Height(cm.)'].astype(float)
-        if 'Weight(lbs.)' in df.columns:
-            df['Weight(lbs.)'] = df['Weight(lbs.)'].astype(float)
-
         # Verifica colunas presentes
-        missing_cols = set(expected_columns.keys()) - set(df.columns)
+        colunas = set(pd.read_csv(BytesIO(bytes_csv), nrows=0).columns)
+        missing_cols = [c for c in COLUNAS_CSV_FIFA if c not in colunas]
         if missing_cols:
             return False, f"Colunas ausentes: {', '.join(missing_cols)}"
 
         # Verifica tipos de dados
-        for col, expected_type in expected_columns.items():
-            if str(df[col].dtype) != expected_type:
-                return False, f"Coluna {col} tem tipo {
-                    df[col].dtype}, esperado {expected_type}"
+        leitor = pd.read_csv(
+            BytesIO(bytes_csv),
+            usecols=list(COLUNAS_CSV_FIFA),
+            dtype=_tipos_leitura(),
+            chunksize=LINHAS_POR_CHUNK_VALIDACAO,
+        )
+        with leitor:
+            for indice_chunk in count():
+                try:
+                    next(leitor)
+                except StopIteration:
+                    break
+                except ValueError:
+                    mensagem = _descrever_erro_tipo(bytes_csv, indice_chunk)
+                    if mensagem is None:
+                        raise
+                    return False, mensagem
 
         return True, 'Capos esperados presentes e com tipos corretos'
 
@@ -77,28 +146,80 @@ def validate_fifa_csv(bytes_csv: bytes) -> tuple[bool, Optional[str]]:
         return False, f"Erro ao ler CSV: {str(e)}"
 
 
+_validacoes: OrderedDict[str, Tuple[bool, Optional[str]]] = OrderedDict()
+_lock_validacoes = threading.Lock()
+
+
+def validate_fifa_csv_memorizado(
+        bytes_csv: bytes,
+        content_hash: Optional[str] = None) -> Tuple[bool, Optional[str]]:
+    """Valida um CSV reaproveitando o resultado de conteúdos já validados.
+
+    Os últimos VALIDACOES_MEMORIZADAS resultados, válidos ou não, ficam
+    guardados pelo hash do conteúdo, de modo que reenviar o mesmo arquivo
+    não o valida novamente.
+
+    Args:
+        bytes_csv (bytes): Conteúdo do arquivo CSV em formato bytes.
+        content_hash (Optional[str]): Hash de ``bytes_csv`` já calculado
+            com ``hash_bytes``; calculado aqui se não for informado.
+
+    Returns:
+        Tuple[bool, Optional[str]]: O mesmo retorno de validate_fifa_csv.
+    """
+    with span('datasource.validar', bytes=len(bytes_csv)) as atual:
+        if content_hash is None:
+            content_hash = hash_bytes(bytes_csv)
+        with _lock_validacoes:
+            memorizado = _validacoes.get(content_hash)
+            if memorizado is not None:
+                _validacoes.move_to_end(content_hash)
+        atual.registrar(memorizado=memorizado is not None)
+        if memorizado is not None:
+            return memorizado
+
+        resultado = validate_fifa_csv(bytes_csv)
+        atual.registrar(valido=resultado[0])
+    with _lock_validacoes:
+        _validacoes[content_hash] = resultado
+        while len(_validacoes) > VALIDACOES_MEMORIZADAS:
+            _validacoes.popitem(last=False)
+    return resultado
+
+
+def _conteudo_igual(path: Path, content_hash: str) -> bool:
+    return path.exists() and hash_arquivo(path) == content_hash
+
+
 class SalvarBytesCsvFifaDatasource(SCFData):
     """Classe para salvar dados de jogadores FIFA recebidos em formato bytes.
 
     Esta classe implementa a interface SCFData e é responsável por validar e 
-    salvar os dados do FIFA recebidos em formato bytes em um arquivo CSV.
+    salvar os dados do FIFA recebidos em formato bytes em um arquivo CSV,
+    acompanhado de sua cópia colunar normalizada.
 
     Attributes:
         Não possui atributos próprios.
     """
 
-    def __call__(self, parameters: SaveCsvParameters) -> Path:
+    def __call__(self, parameters: SaveCsvParameters) -> SaveCsvResult:
         """Salva os dados em bytes como um arquivo CSV.
 
         Valida se os dados recebidos são um CSV válido de jogadores FIFA e
-        salva em arquivo na pasta de datasets.
+        salva em arquivo na pasta de datasets. Em seguida grava a cópia
+        colunar usada pela leitura; se a normalização falhar, a cópia é
+        removida e a leitura volta a usar o CSV.
+
+        Se o arquivo de destino já tiver exatamente o mesmo conteúdo, nada
+        é validado nem gravado e o resultado indica que nada mudou.
 
         Args:
             parameters (SaveCsvParameters): Parâmetros contendo os bytes do CSV
                 e o nome do arquivo a ser salvo.
 
         Returns:
-            Path: Caminho completo do arquivo CSV salvo.
+            SaveCsvResult: Caminho completo do arquivo CSV salvo e se ele
+                foi gravado.
 
         Raises:
             ValueError: Se os dados do CSV forem inválidos.
@@ -110,16 +231,36 @@ class SalvarBytesCsvFifaDatasource(SCFData):
                 bytes_csv=csv_bytes,
                 csv_name="fifa23_players"
             )
-            file_path = datasource(params)
+            file_path = datasource(params).path
             ```
         """
-        is_valid, error_msg = validate_fifa_csv(parameters.bytes_csv)
+        path = PASTA_DATASETS / f'{parameters.csv_name}.csv'
+        content_hash = hash_bytes(parameters.bytes_csv)
+        if _conteudo_igual(path, content_hash):
+            return SaveCsvResult(path=path, changed=False)
+
+        is_valid, error_msg = validate_fifa_csv_memorizado(
+            parameters.bytes_csv, content_hash)
         if not is_valid:
             raise ValueError(f"CSV inválido: {error_msg}")
         
         PASTA_DATASETS.mkdir(exist_ok=True)
-        path = PASTA_DATASETS / f'{parameters.csv_name}.csv'
 
-        with open(path, 'wb') as file:
-            file.write(parameters.bytes_csv)
-        return path
+        with span('datasource.gravar',
+                  bytes=len(parameters.bytes_csv)) as atual:
+            with open(path, 'wb') as file:
+                file.write(parameters.bytes_csv)
+
+            try:
+                # Mesma leitura do carregamento, para que a cópia seja
+                # idêntica à tabela lida do CSV
+                df = ler_csv_fifa_frame(BytesIO(parameters.bytes_csv))
+                escrever_sidecar(PlayerTable.from_csv_frame(df), path)
+                atual.registrar(rows=len(df), sidecar=True)
+            except Exception:
+                # Uma cópia desatualizada é ignorada na leitura, mesmo que
+                # não possa ser removida por estar mapeada em memória
+                with suppress(OSError):
+                    caminho_sidecar(path).unlink(missing_ok=True)
+                atual.registrar(sidecar=False)
+        return SaveCsvResult(path=path, changed=True)
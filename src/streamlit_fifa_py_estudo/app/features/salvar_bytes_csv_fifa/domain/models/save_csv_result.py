@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from pathlib import Path
+
+
+@dataclass(frozen=True)
+class SaveCsvResult:
+    """Resultado do salvamento de um arquivo CSV do FIFA.
+
+    Attributes:
+        path (Path): Caminho completo do arquivo CSV salvo.
+        changed (bool): True se o arquivo foi gravado; False se um arquivo
+            com o mesmo conteúdo já estava salvo com esse nome.
+
+    Example:
+        ```python
+        result = presenter.salvar_csv_fifa("fifa23", bytes_csv)
+        if result.changed:
+            atualizar_lista_arquivos()
+        ```
+    """
+    path: Path
+    changed: bool
@@ -1,12 +1,14 @@
-from pathlib import Path
-
 from py_return_success_or_error import (
     ErrorReturn,
     ReturnSuccessOrError,
+    SuccessReturn,
 )
 
+from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.domain.models.save_csv_result import (
+    SaveCsvResult, )
 from streamlit_fifa_py_estudo.app.utils.erros import SaveCsvFifaError
 from streamlit_fifa_py_estudo.app.utils.parameters import SaveCsvParameters
+from streamlit_fifa_py_estudo.app.utils.tracing import span
 from streamlit_fifa_py_estudo.app.utils.types import SCFUsecase
 
 
@@ -22,7 +24,7 @@ class SalvarBytesCsvFifaUsecase(SCFUsecase):
 
     def __call__(
             self,
-            parameters: SaveCsvParameters) -> ReturnSuccessOrError[Path]:
+            parameters: SaveCsvParameters) -> ReturnSuccessOrError[SaveCsvResult]:
         """Executa o caso de uso de salvamento do CSV.
 
         Tenta salvar os dados em bytes como um arquivo CSV usando o datasource configurado.
@@ -33,8 +35,9 @@ class SalvarBytesCsvFifaUsecase(SCFUsecase):
                 e o nome do arquivo a ser salvo.
 
         Returns:
-            ReturnSuccessOrError[Path]: 
-                Em caso de sucesso: SuccessReturn contendo o caminho do arquivo salvo.
+            ReturnSuccessOrError[SaveCsvResult]: 
+                Em caso de sucesso: SuccessReturn contendo o SaveCsvResult com o
+                caminho do arquivo salvo.
                 Em caso de erro: ErrorReturn contendo SaveCsvFifaError com detalhes do erro.
 
         Example:
@@ -46,12 +49,16 @@ class SalvarBytesCsvFifaUsecase(SCFUsecase):
             )
             result = usecase(params)
             if isinstance(result, SuccessReturn):
-                file_path = result.result
+                file_path = result.result.path
             ```
         """
-        try:
-            return self._resultDatasource(
-                parameters=parameters, datasource=self._datasource
-            )
-        except Exception as e:
-            return ErrorReturn(SaveCsvFifaError(str(e)))
+        with span('usecase.salvar_csv_fifa',
+                  bytes=len(parameters.bytes_csv)) as atual:
+            try:
+                result = self._resultDatasource(
+                    parameters=parameters, datasource=self._datasource
+                )
+            except Exception as e:
+                result = ErrorReturn(SaveCsvFifaError(str(e)))
+            atual.registrar(sucesso=isinstance(result, SuccessReturn))
+            return result
@@ -1,10 +1,72 @@
-from typing import List
+"""Barra lateral e carregamento dos dados compartilhados pelas páginas.
+
+O presenter, o pandas e o numpy só são importados pelas funções que leem ou
+salvam datasets. Assim a home, que não usa dados, é exibida sem carregar a
+pilha de dados na partida de uma nova réplica.
+
+As leituras rodam no executor do presenter e são aguardadas com um aviso na
+barra lateral. Atualizar o aviso permite ao Streamlit interromper a execução
+quando o usuário muda a seleção; a leitura seguinte da mesma sessão cancela
+a anterior, se ela ainda estiver na fila.
+"""
+import time
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, List, Optional
 
-import pandas as pd
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from streamlit_fifa_py_estudo.app.utils.catalogo import CATALOGO_DATASETS
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    INTERVALO_AVISO_CARGA_S,
+    OPCAO_TODAS_TEMPORADAS,
+    PASTA_DATASETS,
+    PREFETCH_MAX_DATASETS,
+    TIMEOUT_LEITURA_S,
+    TIMEOUT_SALVAMENTO_S,
+)
+
+if TYPE_CHECKING:
+    from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+        PlayerTable, )
+
+
+def _sessao() -> Optional[str]:
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return None if ctx is None else ctx.session_id
+
+
+def aguardar_leitura(
+        future: "Future[PlayerTable]",
+        timeout: Optional[float] = TIMEOUT_LEITURA_S) -> "PlayerTable":
+    """Aguarda uma leitura em segundo plano, com um aviso na barra lateral.
+
+    Args:
+        future (Future[PlayerTable]): Leitura iniciada pelo presenter.
+        timeout (Optional[float]): Segundos de espera; None espera sem
+            limite.
+
+    Returns:
+        PlayerTable: Tabela lida.
 
-from streamlit_fifa_py_estudo.app.features.features_presenter import FeaturesPresenter
-from streamlit_fifa_py_estudo.app.utils.consts import PASTA_DATASETS
+    Raises:
+        TimeoutError: Se a leitura não terminar no prazo; ela é cancelada se
+            ainda estiver na fila.
+    """
+    aviso = st.sidebar.empty()
+    inicio = time.monotonic()
+    try:
+        while True:
+            try:
+                return future.result(timeout=INTERVALO_AVISO_CARGA_S)
+            except TimeoutError:
+                decorrido = time.monotonic() - inicio
+                if timeout is not None and decorrido >= timeout:
+                    future.cancel()
+                    raise
+                aviso.caption(f'Carregando dados... {decorrido:.0f}s')
+    finally:
+        aviso.empty()
 
 
 def atualizar_lista_arquivos():
@@ -22,13 +84,16 @@ def set_data():
 
     Verifica se já existem dados carregados na sessão. Caso não existam,
     carrega o primeiro arquivo CSV da lista de datasets disponíveis e
-    armazena na variável de sessão 'data'.
+    armazena a PlayerTable resultante na variável de sessão 'data'.
     """
-    presenter = FeaturesPresenter()
+    from streamlit_fifa_py_estudo.app.features.features_presenter import (
+        FEATURES_PRESENTER, )
+
     if 'data' not in st.session_state:
         paths = listar_arquivos_datasets()
-        df_list = presenter.ler_csv_fifa(PASTA_DATASETS / f'{paths[0]}.csv')
-        st.session_state.data = df_list
+        table = aguardar_leitura(FEATURES_PRESENTER.ler_csv_fifa_async(
+            PASTA_DATASETS / f'{paths[0]}.csv', sessao=_sessao()))
+        st.session_state.data = table
 
 
 def upload_data():
@@ -36,26 +101,35 @@ def upload_data():
 
     Cria um componente de upload de arquivo na sidebar do Streamlit que aceita
     arquivos CSV. Quando um arquivo é carregado, seus bytes são lidos para
-    posterior processamento.
+    posterior processamento. Como o arquivo continua no componente entre os
+    reruns, a lista de arquivos e o aviso só são atualizados quando o
+    conteúdo salvo de fato muda. O salvamento é aguardado por até
+    TIMEOUT_SALVAMENTO_S segundos.
 
     Returns:
         bytes: Conteúdo do arquivo CSV em formato de bytes se um arquivo
             for carregado.
     """
-    presenter = FeaturesPresenter()
     uploaded_file = st.sidebar.file_uploader(
         "Escolha um arquivo CSV", type="csv")
     if uploaded_file is not None:
+        from streamlit_fifa_py_estudo.app.features.features_presenter import (
+            FEATURES_PRESENTER, )
+
         try:
             bytes_csv = uploaded_file.read()
-            presenter.salvar_csv_fifa(
+            result = FEATURES_PRESENTER.salvar_csv_fifa_async(
                 uploaded_file.name.replace(
-                    '.csv', ''), bytes_csv)
+                    '.csv', ''), bytes_csv).result(
+                        timeout=TIMEOUT_SALVAMENTO_S)
 
-            atualizar_lista_arquivos()
+            if result.changed:
+                atualizar_lista_arquivos()
 
-            st.toast("Arquivo salvo com sucesso!", icon="✅")
+                st.toast("Arquivo salvo com sucesso!", icon="✅")
 
+        except TimeoutError:
+            st.toast("O arquivo ainda está sendo salvo.", icon="⏳")
         except Exception as e:
             st.toast(f"Erro ao salvar arquivo: {str(e)}", icon="❌")
 
@@ -63,9 +137,9 @@ def upload_data():
 def listar_arquivos_datasets() -> List[str]:
     """Lista todos os arquivos CSV disponíveis na pasta datasets.
 
-    Busca recursivamente todos os arquivos com extensão .csv no diretório
-    definido em PASTA_DATASETS e retorna uma lista com os nomes dos arquivos
-    sem a extensão.
+    Consulta o CATALOGO_DATASETS, que só varre o diretório definido em
+    PASTA_DATASETS quando ele muda, e retorna uma lista com os nomes dos
+    arquivos sem a extensão, em ordem alfabética.
 
     Returns:
         List[str]: Lista contendo os nomes dos arquivos CSV encontrados,
@@ -76,22 +150,27 @@ def listar_arquivos_datasets() -> List[str]:
             com a mensagem de erro detalhada.
     """
     try:
-        paths = list(PASTA_DATASETS.glob('*.csv'))
-        nomes_arquivos = [path.stem for path in paths]
+        nomes_arquivos = [info.name for info in CATALOGO_DATASETS.listar()]
         return nomes_arquivos
     except Exception as e:
         raise ValueError(f"Erro ao listar arquivos: {str(e)}")
 
 
-def select_dataset():
+def select_dataset(carregar: bool = True):
     """Permite selecionar um dataset através da interface do Streamlit.
 
     Cria um componente de seleção na interface que lista os datasets disponíveis.
     Quando um dataset é selecionado, seus dados são carregados na sessão do Streamlit
-    através do FeaturesPresenter.
+    através do FeaturesPresenter, substituindo a leitura anterior da sessão
+    que ainda não tenha começado. Os demais datasets da lista, até
+    PREFETCH_MAX_DATASETS, começam a ser carregados em segundo plano para
+    que a troca de seleção não espere a leitura do arquivo. Com mais de um
+    dataset, a opção OPCAO_TODAS_TEMPORADAS carrega todos em paralelo, em
+    uma única tabela com a coluna ``season``.
 
     Args:
-        None
+        carregar (bool): Se False, só exibe a seleção, sem ler o dataset;
+            usado pelas páginas que não mostram dados.
 
     Returns:
         None
@@ -101,21 +180,103 @@ def select_dataset():
         serão automaticamente carregados na sessão do Streamlit para uso
         posterior na aplicação.
     """
-    presenter = FeaturesPresenter()
-    coluna = 'name'
-    df_datasets = pd.DataFrame(
-        st.session_state.arquivos_datasets,
-        columns=[coluna])
+    datasets = list(dict.fromkeys(st.session_state.arquivos_datasets))
+    opcoes = list(datasets)
+    if len(datasets) > 1:
+        opcoes.append(OPCAO_TODAS_TEMPORADAS)
+    dataset = st.sidebar.selectbox('Selecione a fonte de dados', opcoes)
+    if not carregar:
+        return
+
+    from streamlit_fifa_py_estudo.app.features.features_presenter import (
+        FEATURES_PRESENTER as presenter, )
+
+    if dataset == OPCAO_TODAS_TEMPORADAS:
+        # Temporadas mais recentes primeiro, para que buscas por nome
+        # encontrem a versão atual do jogador
+        st.session_state.data = aguardar_leitura(
+            presenter.ler_temporadas_async([
+                PASTA_DATASETS / f'{nome}.csv'
+                for nome in sorted(datasets, reverse=True)
+            ], sessao=_sessao()))
+        return
+
+    table = aguardar_leitura(presenter.ler_csv_fifa_async(
+        PASTA_DATASETS / f'{dataset}.csv', sessao=_sessao()))
+    st.session_state.data = table
+
+    outros = [nome for nome in datasets if nome != dataset]
+    presenter.prefetch_csv_fifa(
+        PASTA_DATASETS / f'{nome}.csv'
+        for nome in outros[:PREFETCH_MAX_DATASETS])
+
+
+def temporadas_selecionadas(table: 'PlayerTable') -> Optional[List[str]]:
+    """Cria na barra lateral a seleção das temporadas exibidas.
+
+    A seleção só aparece quando a tabela tem a coluna ``season``; todas as
+    temporadas vêm marcadas e desmarcar todas equivale a manter todas.
+
+    Args:
+        table (PlayerTable): Tabela carregada na sessão.
+
+    Returns:
+        Optional[List[str]]: Temporadas escolhidas, ou None se a tabela não
+            tiver temporadas ou se todas estiverem selecionadas.
+    """
+    if 'season' not in table.colunas:
+        return None
+
+    import pandas as pd
+
+    temporadas = list(pd.unique(table.coluna('season')))
+    selecionadas = st.sidebar.multiselect(
+        'Temporadas', temporadas, default=temporadas)
+    if not selecionadas or len(selecionadas) == len(temporadas):
+        return None
+    return selecionadas
+
+
+def filtrar_temporadas(table: 'PlayerTable') -> 'PlayerTable':
+    """Permite escolher as temporadas exibidas quando várias estão carregadas.
+
+    Usa a seleção de ``temporadas_selecionadas``; sem a coluna ``season`` a
+    tabela é devolvida sem alterações. A tabela filtrada é guardada na
+    sessão e reaproveitada, com seus índices, enquanto a seleção não mudar.
+
+    Args:
+        table (PlayerTable): Tabela carregada na sessão.
+
+    Returns:
+        PlayerTable: Linhas das temporadas selecionadas.
+    """
+    selecionadas = temporadas_selecionadas(table)
+    if selecionadas is None:
+        return table
+
+    import numpy as np
+    import pandas as pd
+
+    chave = (id(table), tuple(selecionadas))
+    anterior = st.session_state.get('temporadas_filtradas')
+    if anterior is None or anterior[0] != chave:
+        mascara = pd.Series(table.coluna('season')).isin(selecionadas)
+        filtrada = table.take(np.flatnonzero(mascara.to_numpy()))
+        anterior = (chave, filtrada)
+        st.session_state.temporadas_filtradas = anterior
+    return anterior[1]
 
-    datasets = df_datasets['name'].unique()
-    dataset = st.sidebar.selectbox('Selecione a fonte de dados', datasets)
-    df_list = presenter.ler_csv_fifa(PASTA_DATASETS / f'{dataset}.csv')
-    st.session_state.data = df_list
 
+def inicializacao(carregar_dados: bool = True):
+    """Monta a barra lateral e, se pedido, carrega os dados na sessão.
 
-def inicializacao():
+    Args:
+        carregar_dados (bool): Se False, a barra lateral é exibida sem ler
+            nenhum dataset nem importar a pilha de dados.
+    """
     # execução das funções de inicialização
     atualizar_lista_arquivos()
-    set_data()
+    if carregar_dados:
+        set_data()
     upload_data()
-    select_dataset()
+    select_dataset(carregar_dados)
@@ -0,0 +1,174 @@
+"""Tabela paginada no servidor para PlayerTables de qualquer tamanho.
+
+Só as linhas da página visível são materializadas e enviadas ao navegador,
+inclusive as imagens. A ordenação de cada coluna é calculada uma vez por
+tabela (``PlayerTable.ordem``) e cada troca de página é apenas uma fatia
+dessa ordenação, de modo que o custo não depende do tamanho da tabela.
+As imagens da página são servidas pelo ASSET_CACHE, a partir do disco.
+"""
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import pandas as pd
+import streamlit as st
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+from streamlit_fifa_py_estudo.app.utils.asset_cache import ASSET_CACHE
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    COLUNAS_IMAGEM,
+    TAMANHOS_PAGINA,
+)
+
+
+@dataclass(frozen=True)
+class Pagina:
+    """Uma página de uma tabela, já ordenada.
+
+    Attributes:
+        linhas (PlayerTable): Linhas da página.
+        numero (int): Número da página, a partir de 1.
+        total_paginas (int): Quantidade de páginas da tabela.
+        inicio (int): Posição da primeira linha da página na tabela
+            ordenada.
+        total_linhas (int): Quantidade de linhas da tabela.
+    """
+    linhas: PlayerTable
+    numero: int
+    total_paginas: int
+    inicio: int
+    total_linhas: int
+
+
+def paginar(
+        table: PlayerTable,
+        numero: int,
+        tamanho: int,
+        ordenar_por: Optional[str] = None,
+        descending: bool = False) -> Pagina:
+    """Seleciona as linhas de uma página da tabela.
+
+    Args:
+        table (PlayerTable): Tabela completa.
+        numero (int): Número da página, a partir de 1; valores fora do
+            intervalo são trazidos para a primeira ou a última página.
+        tamanho (int): Quantidade de linhas por página.
+        ordenar_por (Optional[str]): Coluna usada na ordenação; None mantém
+            a ordem da tabela.
+        descending (bool): Se True, ordena do maior para o menor.
+
+    Returns:
+        Pagina: Linhas e posição da página.
+
+    Example:
+        ```python
+        pagina = paginar(table, numero=3, tamanho=50, ordenar_por='overall',
+                         descending=True)
+        df = pagina.linhas.frame
+        ```
+    """
+    total_paginas = max(1, math.ceil(len(table) / tamanho))
+    numero = min(max(1, numero), total_paginas)
+    inicio = (numero - 1) * tamanho
+    fim = min(inicio + tamanho, len(table))
+    if ordenar_por is None:
+        linhas = table.take(slice(inicio, fim))
+    else:
+        linhas = table.take(table.ordem(ordenar_por, descending)[inicio:fim])
+    return Pagina(
+        linhas=linhas,
+        numero=numero,
+        total_paginas=total_paginas,
+        inicio=inicio,
+        total_linhas=len(table),
+    )
+
+
+def imagens_locais(df: pd.DataFrame) -> pd.DataFrame:
+    """Troca as URLs das colunas de imagem pelas imagens do ASSET_CACHE.
+
+    As imagens que faltam no cache são buscadas em segundo plano e, até lá,
+    assim como as que não puderem ser buscadas, mantêm a URL original.
+
+    Args:
+        df (pd.DataFrame): Linhas exibidas.
+
+    Returns:
+        pd.DataFrame: Cópia com data URLs nas colunas de COLUNAS_IMAGEM.
+    """
+    colunas = [coluna for coluna in COLUNAS_IMAGEM if coluna in df.columns]
+    if not colunas:
+        return df
+    locais = ASSET_CACHE.data_urls(
+        url for coluna in colunas for url in df[coluna])
+    return df.assign(**{coluna: df[coluna].map(locais) for coluna in colunas})
+
+
+def tabela_paginada(
+        table: PlayerTable,
+        colunas: Sequence[str],
+        chave: str,
+        column_config: Optional[Dict[str, Any]] = None,
+        ordenaveis: Optional[Sequence[str]] = None,
+        preparar: Optional[Callable[[pd.DataFrame], pd.DataFrame]] = None,
+        indice: Optional[str] = None) -> Pagina:
+    """Exibe a tabela uma página por vez, com ordenação por coluna.
+
+    Args:
+        table (PlayerTable): Tabela completa.
+        colunas (Sequence[str]): Colunas exibidas, na ordem.
+        chave (str): Prefixo das chaves dos widgets; distingue tabelas da
+            mesma página.
+        column_config (Optional[Dict[str, Any]]): Configuração das colunas,
+            repassada ao ``st.dataframe``.
+        ordenaveis (Optional[Sequence[str]]): Colunas oferecidas para
+            ordenação; por padrão, as colunas exibidas que não são imagens.
+        preparar (Optional[Callable[[pd.DataFrame], pd.DataFrame]]): Ajusta
+            o DataFrame da página antes da exibição, por exemplo para criar
+            colunas formatadas. As imagens das colunas exibidas vêm do
+            ASSET_CACHE.
+        indice (Optional[str]): Coluna usada como índice do DataFrame.
+
+    Returns:
+        Pagina: Página exibida.
+
+    Example:
+        ```python
+        tabela_paginada(table, ['name', 'club', 'overall'], chave='todos',
+                        indice='name')
+        ```
+    """
+    if ordenaveis is None:
+        ordenaveis = [
+            coluna for coluna in colunas
+            if coluna in table.colunas and coluna not in COLUNAS_IMAGEM
+        ]
+
+    ordenacao, sentido, linhas, pagina = st.columns([3, 2, 2, 2])
+    ordenar_por = ordenacao.selectbox(
+        'Ordenar por', [None, *ordenaveis],
+        format_func=lambda coluna: 'ordem do arquivo' if coluna is None
+        else coluna,
+        key=f'{chave}_ordenar_por')
+    descending = sentido.toggle('Decrescente', key=f'{chave}_descending')
+    tamanho = linhas.selectbox(
+        'Linhas por página', TAMANHOS_PAGINA, key=f'{chave}_tamanho')
+    numero = pagina.number_input(
+        'Página', min_value=1, step=1, key=f'{chave}_pagina')
+
+    atual = paginar(table, int(numero), tamanho, ordenar_por, descending)
+    df = atual.linhas.frame
+    if preparar is not None:
+        df = preparar(df)
+    if indice is not None:
+        df = df.set_index(indice)
+    st.dataframe(
+        imagens_locais(df[[coluna for coluna in colunas if coluna != indice]]),
+        column_config=column_config)
+
+    fim = atual.inicio + len(atual.linhas)
+    st.caption(
+        f'Página {atual.numero} de {atual.total_paginas} · jogadores '
+        f'{atual.inicio + 1 if fim else 0}–{fim} de {atual.total_linhas}')
+    return atual
@@ -0,0 +1,64 @@
+"""Página com todos os jogadores do dataset carregado.
+
+Exibe a tabela inteira, de todos os clubes e temporadas selecionadas, em
+páginas ordenáveis. Só a página visível é enviada ao navegador, de modo que
+datasets com dezenas de milhares de jogadores continuam navegáveis.
+"""
+import streamlit as st
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+from streamlit_fifa_py_estudo.app.inicializacao import filtrar_temporadas
+from streamlit_fifa_py_estudo.app.ui.components.tabela_paginada import tabela_paginada
+from streamlit_fifa_py_estudo.app.utils.tracing import span
+
+
+def all_players():
+    """Renderiza a página com todos os jogadores.
+
+    Returns:
+        None
+    """
+    with span('pagina.all_players') as atual:
+        table: PlayerTable = filtrar_temporadas(st.session_state.data)
+        atual.registrar(rows=len(table))
+
+    st.markdown(f"## Todos os jogadores ({len(table)})")
+
+    colunas = [
+        'photo',
+        'name',
+        'club',
+        'position',
+        'flag',
+        'nationality',
+        'age',
+        'overall',
+        'value',
+        'wage',
+        'release_clause',
+        'contract_valid_until',
+    ]
+    if 'season' in table.colunas:
+        colunas.insert(0, 'season')
+
+    tabela_paginada(
+        table,
+        colunas,
+        chave='all_players',
+        indice='name',
+        column_config={
+            'overall': st.column_config.ProgressColumn(
+                min_value=0,
+                max_value=100,
+                format='%d',
+            ),
+            'value': st.column_config.NumberColumn(format='£ %.0f'),
+            'wage': st.column_config.NumberColumn(format='£ %.0f'),
+            'release_clause': st.column_config.NumberColumn(format='£ %.0f'),
+            'photo': st.column_config.ImageColumn(),
+            'flag': st.column_config.ImageColumn('country'),
+        })
+
+
+all_players()
@@ -0,0 +1,89 @@
+"""Página de rankings de clubes, seleções e posições.
+
+Os rankings usam os agregados da PlayerTable, somados uma vez por dataset e
+compartilhados entre as sessões. Trocar o agrupamento, a métrica ou as
+temporadas só reordena os grupos, sem percorrer os jogadores.
+"""
+import streamlit as st
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+from streamlit_fifa_py_estudo.app.inicializacao import temporadas_selecionadas
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    GRUPOS_RANKING,
+    RANKING_LIMITE,
+)
+from streamlit_fifa_py_estudo.app.utils.tracing import span
+
+ROTULOS_GRUPOS = {
+    'club': 'Clubes',
+    'nationality': 'Seleções',
+    'position': 'Posições',
+}
+"""Nome exibido de cada coluna de GRUPOS_RANKING."""
+
+ROTULOS_METRICAS = {
+    'squad_value': 'Valor do elenco',
+    'wage_bill': 'Folha salarial',
+    'avg_overall': 'Overall médio',
+    'avg_age': 'Idade média',
+    'players': 'Jogadores',
+}
+"""Nome exibido de cada métrica do ranking, na ordem do seletor."""
+
+
+def leaderboard():
+    """Renderiza a página de rankings.
+
+    Returns:
+        None
+    """
+    table: PlayerTable = st.session_state.data
+    origens = temporadas_selecionadas(table)
+
+    st.markdown("## Rankings")
+    coluna1, coluna2, coluna3 = st.columns([2, 2, 1])
+    grupo = coluna1.radio(
+        'Agrupar por', GRUPOS_RANKING, horizontal=True,
+        format_func=lambda grupo: ROTULOS_GRUPOS.get(grupo, grupo),
+        key='leaderboard_grupo')
+    metrica = coluna2.selectbox(
+        'Ordenar por', list(ROTULOS_METRICAS),
+        format_func=ROTULOS_METRICAS.get, key='leaderboard_metrica')
+    descending = coluna3.toggle(
+        'Decrescente', value=True, key='leaderboard_descending')
+
+    with span('pagina.leaderboard', grupo=grupo, metrica=metrica) as atual:
+        ranking = table.agregados(grupo).ranking(
+            metrica, descending=descending, origens=origens)
+        atual.registrar(rows=len(ranking))
+
+    limite = st.slider(
+        'Quantidade', min_value=1, max_value=max(len(ranking), 1),
+        value=min(RANKING_LIMITE, max(len(ranking), 1)),
+        key='leaderboard_limite') if len(ranking) > 1 else len(ranking)
+    st.caption(f"{len(ranking)} {ROTULOS_GRUPOS.get(grupo, grupo).lower()}")
+
+    pagina = ranking.head(limite)
+    pagina.index = range(1, len(pagina) + 1)
+    st.dataframe(
+        pagina,
+        column_config={
+            grupo: st.column_config.TextColumn(
+                ROTULOS_GRUPOS.get(grupo, grupo)),
+            'players': st.column_config.NumberColumn(
+                ROTULOS_METRICAS['players']),
+            'squad_value': st.column_config.NumberColumn(
+                ROTULOS_METRICAS['squad_value'], format='£ %.0f'),
+            'wage_bill': st.column_config.NumberColumn(
+                ROTULOS_METRICAS['wage_bill'], format='£ %.0f'),
+            'avg_overall': st.column_config.ProgressColumn(
+                ROTULOS_METRICAS['avg_overall'], min_value=0,
+                max_value=100, format='%.1f'),
+            'avg_age': st.column_config.NumberColumn(
+                ROTULOS_METRICAS['avg_age'], format='%.1f'),
+        },
+        use_container_width=True)
+
+
+leaderboard()
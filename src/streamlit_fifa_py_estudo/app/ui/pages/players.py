@@ -8,9 +8,16 @@ Functions:
     inject_custom_css(): Injeta estilos CSS personalizados na página
 """
 
-import pandas as pd
 import streamlit as st
 
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+from streamlit_fifa_py_estudo.app.inicializacao import filtrar_temporadas
+from streamlit_fifa_py_estudo.app.utils.asset_cache import ASSET_CACHE
+from streamlit_fifa_py_estudo.app.utils.consts import CAMPOS_BUSCA
+from streamlit_fifa_py_estudo.app.utils.tracing import span
+
+
 def format_currency(value: float) -> str:
     """Formata valores monetários para exibição em formato compacto.
 
@@ -92,34 +99,82 @@ def responsive_metric(container, label, value):
     """, unsafe_allow_html=True)
 
 
+def rotulo_busca(table: PlayerTable, posicao: int) -> str:
+    """Monta o texto de um resultado da busca de jogadores.
+
+    Args:
+        table (PlayerTable): Tabela consultada.
+        posicao (int): Posição do jogador na tabela.
+
+    Returns:
+        str: Nome, clube e, se houver, temporada do jogador.
+    """
+    player = table.linha(posicao)
+    partes = [player['name'], player['club'], player.get('season')]
+    return ' · '.join(str(parte) for parte in partes if isinstance(parte, str))
+
+
+def rotulo_elenco(table: PlayerTable, posicao: int) -> str:
+    """Monta o texto de um jogador na lista do elenco de um clube.
+
+    Args:
+        table (PlayerTable): Tabela consultada.
+        posicao (int): Posição do jogador na tabela.
+
+    Returns:
+        str: Nome e, se houver, temporada do jogador, que distingue as
+            linhas do mesmo jogador em temporadas diferentes.
+    """
+    player = table.linha(posicao)
+    partes = [player['name'], player.get('season')]
+    return ' · '.join(str(parte) for parte in partes if isinstance(parte, str))
+
+
 def players():
     """Renderiza a página de detalhes dos jogadores.
     
     Cria uma interface interativa que permite:
-    - Selecionar um clube na barra lateral
-    - Escolher um jogador do clube selecionado
+    - Buscar um jogador pelo nome, clube ou nacionalidade, mesmo com erros
+      de digitação ou sem acentos
+    - Ou selecionar um clube na barra lateral e escolher um de seus
+      jogadores
     - Visualizar foto, informações e métricas do jogador
 
     Utiliza:
-    - Dados carregados na session_state
+    - PlayerTable carregada na session_state, seus índices por clube e ID e
+      seu índice de trigramas para a busca
     - Componentes Streamlit (selectbox, columns, markdown)
     - Cards de métricas customizados
 
     Returns:
         None
     """
-    df_data = pd.DataFrame(st.session_state.data)
-
-    clubes = df_data['club'].unique()
-    club = st.sidebar.selectbox('Selecione um clube', clubes)
-    df_players_club = df_data[(df_data['club'] == club)]
-
-    players = df_players_club['name'].unique()
-    player = st.sidebar.selectbox('Selecione um jogador', players)
-
-    player_stats = df_data[df_data['name'] == player].iloc[0]
-
-    st.image(player_stats['photo'])
+    with span('pagina.players') as atual:
+        table: PlayerTable = filtrar_temporadas(st.session_state.data)
+        index = table.indices
+
+        consulta = st.sidebar.text_input(
+            'Buscar jogador', placeholder='Nome, clube ou nacionalidade')
+        encontrados = table.buscar(consulta, campos=CAMPOS_BUSCA).tolist()
+        if encontrados:
+            posicao = st.sidebar.selectbox(
+                'Resultados da busca', encontrados,
+                format_func=lambda posicao: rotulo_busca(table, posicao))
+            player_stats = table.linha(posicao)
+        else:
+            if consulta.strip():
+                st.sidebar.caption('Nenhum jogador encontrado.')
+            club = st.sidebar.selectbox('Selecione um clube', index.clubes)
+            # A linha escolhida é passada pela posição: nome e ID se repetem
+            # quando várias temporadas são exibidas juntas
+            posicao = st.sidebar.selectbox(
+                'Selecione um jogador', index.posicoes_elenco(club).tolist(),
+                format_func=lambda posicao: rotulo_elenco(table, posicao))
+            player_stats = table.linha(posicao)
+        atual.registrar(rows=len(table), resultados=len(encontrados))
+
+    foto = player_stats['photo']
+    st.image(str(ASSET_CACHE.obter(foto) or foto))
     st.title(player_stats['name'])
     st.markdown(f"**Clube:** {player_stats['club']}")
     st.markdown(f"**Posição:** {player_stats['position']}")
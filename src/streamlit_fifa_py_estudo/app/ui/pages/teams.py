@@ -1,18 +1,30 @@
 import pandas as pd
 import streamlit as st
 
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+from streamlit_fifa_py_estudo.app.inicializacao import filtrar_temporadas
+from streamlit_fifa_py_estudo.app.ui.components.tabela_paginada import tabela_paginada
+from streamlit_fifa_py_estudo.app.utils.asset_cache import ASSET_CACHE
+from streamlit_fifa_py_estudo.app.utils.tracing import span
+
 
 def format_currency(value):
     # ajuste na formatação do valor
     return value / 1e3
 
 
+def formatar_salario(df: pd.DataFrame) -> pd.DataFrame:
+    # salário em milhares, exibido como barra de progresso
+    return df.assign(wage_formatted=df['wage'].apply(format_currency))
+
+
 def teams():
     """Renderiza a página de visualização de times.
 
     Cria uma interface que permite:
     - Selecionar um clube na barra lateral
-    - Visualizar uma tabela interativa com os jogadores do clube
+    - Visualizar uma tabela paginada e ordenável com os jogadores do clube
     - Ver métricas e estatísticas do clube selecionado
 
     A tabela inclui:
@@ -25,13 +37,18 @@ def teams():
         None
     """
     # Configuração da tabela de jogadores
-    df_data = pd.DataFrame(st.session_state.data)
+    with span('pagina.teams') as atual:
+        table: PlayerTable = filtrar_temporadas(st.session_state.data)
 
-    clubes = df_data['club'].unique()
-    club = st.sidebar.selectbox('Selecione um clube', clubes)
-    df_players_club = df_data[(df_data['club'] == club)].set_index('name')
+        index = table.indices
+        club = st.sidebar.selectbox('Selecione um clube', index.clubes)
+        # Seleciona apenas as linhas do clube; a tabela materializa só a
+        # página exibida
+        elenco = index.elenco(club)
+        atual.registrar(rows=len(elenco))
 
-    st.image(df_players_club.iloc[0]['club_logo'])
+    escudo = elenco.coluna('club_logo')[0]
+    st.image(str(ASSET_CACHE.obter(escudo) or escudo))
     st.markdown(f"## {club}")
 
     clunas = [
@@ -48,11 +65,19 @@ def teams():
         'contract_valid_until',
         'release_clause'
     ]
-    df_players_club['wage_formatted'] = df_players_club['wage'].apply(
-        format_currency)
+    if 'season' in elenco.colunas:
+        clunas.insert(0, 'season')
 
-    st.dataframe(
-        df_players_club[clunas],
+    tabela_paginada(
+        elenco,
+        ['name', *clunas],
+        chave='teams',
+        # o salário é ordenado pelo valor original, não pelo formatado
+        ordenaveis=['name', *(
+            coluna.replace('_formatted', '') for coluna in clunas
+            if coluna not in ('photo', 'flag'))],
+        preparar=formatar_salario,
+        indice='name',
         column_config={
             'overall': st.column_config.ProgressColumn(
                 min_value=0,
@@ -62,7 +87,7 @@ def teams():
             'wage_formatted': st.column_config.ProgressColumn(
                 'weekly wage',
                 min_value=0,
-                max_value=df_players_club['wage_formatted'].max(),
+                max_value=format_currency(elenco.coluna('wage').max()),
                 format='£ %.2f K',
             ),
             'photo': st.column_config.ImageColumn(),
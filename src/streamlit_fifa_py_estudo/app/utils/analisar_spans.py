@@ -0,0 +1,121 @@
+"""Resumo offline dos spans gravados pelo módulo de tracing.
+
+Lê o arquivo JSONL de spans e os arquivos rotacionados ao lado dele e
+imprime, por etapa, a quantidade de spans, de erros e os percentis p50, p95
+e p99 da duração, além da mediana de linhas e bytes processados.
+
+Uso:
+    python -m streamlit_fifa_py_estudo.app.utils.analisar_spans [arquivo]
+        [--etapa PREFIXO] [--desde 2025-01-31T12:00]
+"""
+import argparse
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pandas as pd
+
+from streamlit_fifa_py_estudo.app.utils.consts import ARQUIVO_SPANS
+
+PERCENTIS = (0.5, 0.95, 0.99)
+"""Percentis de duração calculados para cada etapa."""
+
+
+def arquivos_spans(arquivo: Path) -> List[Path]:
+    """Lista o arquivo de spans e seus rotacionados, do mais antigo ao atual.
+
+    Args:
+        arquivo (Path): Arquivo JSONL de spans.
+
+    Returns:
+        List[Path]: Arquivos existentes, na ordem em que foram gravados.
+    """
+    arquivo = Path(arquivo)
+    rotacionados = sorted(
+        (path for path in arquivo.parent.glob(f'{arquivo.name}.*')
+         if path.suffix[1:].isdigit()),
+        key=lambda path: int(path.suffix[1:]),
+        reverse=True)
+    return [*rotacionados, *([arquivo] if arquivo.exists() else [])]
+
+
+def ler_spans(arquivo: Path) -> pd.DataFrame:
+    """Lê os spans gravados, ignorando linhas que não sejam JSON válido.
+
+    Args:
+        arquivo (Path): Arquivo JSONL de spans.
+
+    Returns:
+        pd.DataFrame: Um span por linha, com uma coluna por atributo.
+    """
+    registros = []
+    for path in arquivos_spans(arquivo):
+        with open(path, encoding='utf-8') as linhas:
+            for linha in linhas:
+                try:
+                    registros.append(json.loads(linha))
+                except ValueError:
+                    continue
+    return pd.DataFrame(registros)
+
+
+def resumir_spans(spans: pd.DataFrame) -> pd.DataFrame:
+    """Calcula as estatísticas de duração de cada etapa.
+
+    Args:
+        spans (pd.DataFrame): Spans lidos por ``ler_spans``.
+
+    Returns:
+        pd.DataFrame: Uma linha por etapa, ordenada pelo p95, com as
+            colunas spans, erros, p50_ms, p95_ms, p99_ms, rows e bytes.
+    """
+    colunas = ['spans', 'erros', *(f'p{int(p * 100)}_ms' for p in PERCENTIS),
+               'rows', 'bytes']
+    if spans.empty:
+        return pd.DataFrame(columns=colunas)
+
+    # Etapas que nunca registraram linhas ou bytes não têm essas colunas
+    spans = spans.assign(**{
+        coluna: spans.get(coluna, float('nan')) for coluna in ('rows', 'bytes')
+    })
+    spans['erro'] = spans['status'] == 'erro'
+    grupos = spans.groupby('etapa')
+    resumo = pd.DataFrame({
+        'spans': grupos.size(),
+        'erros': grupos['erro'].sum(),
+    })
+    for percentil in PERCENTIS:
+        resumo[f'p{int(percentil * 100)}_ms'] = grupos['duracao_ms'].quantile(
+            percentil)
+    resumo['rows'] = grupos['rows'].median()
+    resumo['bytes'] = grupos['bytes'].median()
+    return resumo.sort_values('p95_ms', ascending=False)[colunas]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('arquivo', type=Path, nargs='?', default=ARQUIVO_SPANS)
+    parser.add_argument(
+        '--etapa', default='', help='considera só etapas com este prefixo')
+    parser.add_argument(
+        '--desde', type=datetime.fromisoformat,
+        help='considera só spans iniciados a partir desta data e hora')
+    args = parser.parse_args(argv)
+
+    spans = ler_spans(args.arquivo)
+    if not spans.empty:
+        spans = spans[spans['etapa'].str.startswith(args.etapa)]
+        if args.desde is not None:
+            spans = spans[spans['inicio'] >= args.desde.timestamp()]
+    if spans.empty:
+        print(f'Nenhum span encontrado em {args.arquivo}')
+        return
+
+    with pd.option_context('display.float_format', '{:.1f}'.format,
+                           'display.width', 120):
+        print(resumir_spans(spans).to_string())
+
+
+if __name__ == '__main__':
+    main()
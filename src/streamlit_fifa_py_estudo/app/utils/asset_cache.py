@@ -0,0 +1,345 @@
+"""Cache em disco das imagens dos jogadores: fotos, bandeiras e escudos.
+
+As páginas exibem imagens hospedadas na CDN do sofifa, uma requisição do
+navegador por imagem. O AssetCache busca cada URL uma única vez, em segundo
+plano, grava a imagem na pasta PASTA_ASSETS e a entrega às páginas a partir
+do disco: como caminho, para ``st.image``, ou como data URL, para as
+``ImageColumn`` do ``st.dataframe``. Enquanto a busca não termina, as
+páginas recebem a URL original, sem esperar pela rede. A pasta tem tamanho
+máximo e as imagens usadas há mais tempo são removidas primeiro.
+
+A busca é feita por uma função ``Fetcher`` que recebe a URL e devolve os
+bytes, de modo que os testes podem usar um servidor HTTP local ou uma função
+em memória. A padrão, ``buscar_url``, só acessa os hosts de
+ASSETS_HOSTS_PERMITIDOS por HTTPS, já que as URLs vêm dos CSVs enviados
+pelos usuários. URLs que falham não são buscadas de novo por
+ASSETS_ESPERA_FALHA_S segundos, e as páginas recebem a URL original.
+
+Attributes:
+    ASSET_CACHE (AssetCache): Cache da PASTA_ASSETS usado pelas páginas.
+"""
+import base64
+import hashlib
+import mimetypes
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Sequence
+
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    ASSETS_ESPERA_FALHA_S,
+    ASSETS_ESQUEMAS_PERMITIDOS,
+    ASSETS_HOSTS_PERMITIDOS,
+    ASSETS_MAX_BYTES,
+    ASSETS_TIMEOUT_S,
+    ASSETS_WORKERS,
+    PASTA_ASSETS,
+)
+from streamlit_fifa_py_estudo.app.utils.tracing import span
+
+Fetcher = Callable[[str], bytes]
+"""Função que busca uma URL e devolve seu conteúdo."""
+
+
+def validar_url(
+        url: str,
+        hosts: Sequence[str] = ASSETS_HOSTS_PERMITIDOS,
+        esquemas: Sequence[str] = ASSETS_ESQUEMAS_PERMITIDOS) -> None:
+    """Confere se uma URL aponta para um dos hosts de imagens permitidos.
+
+    Args:
+        url (str): Endereço da imagem.
+        hosts (Sequence[str]): Hosts aceitos.
+        esquemas (Sequence[str]): Esquemas aceitos, como ``'https'``.
+
+    Raises:
+        ValueError: Se o esquema ou o host não forem aceitos.
+    """
+    partes = urllib.parse.urlsplit(url)
+    if partes.scheme not in esquemas or partes.hostname not in hosts:
+        raise ValueError(f"URL de imagem não permitida: {url}")
+
+
+class _RedirecionamentoRestrito(urllib.request.HTTPRedirectHandler):
+    """Segue redirecionamentos apenas para URLs aceitas por validar_url."""
+
+    def __init__(self, hosts: Sequence[str], esquemas: Sequence[str]) -> None:
+        self.hosts = hosts
+        self.esquemas = esquemas
+
+    def redirect_request(self, req, fp, code, msg, headers, newurl):
+        validar_url(newurl, self.hosts, self.esquemas)
+        return super().redirect_request(req, fp, code, msg, headers, newurl)
+
+
+def buscar_url(
+        url: str,
+        timeout: float = ASSETS_TIMEOUT_S,
+        hosts: Sequence[str] = ASSETS_HOSTS_PERMITIDOS,
+        esquemas: Sequence[str] = ASSETS_ESQUEMAS_PERMITIDOS) -> bytes:
+    """Busca uma URL por HTTP com a biblioteca padrão.
+
+    Só acessa os hosts e esquemas permitidos, também nos redirecionamentos,
+    de modo que uma URL vinda de um CSV não consegue ler arquivos locais nem
+    alcançar outros servidores.
+
+    Args:
+        url (str): Endereço da imagem.
+        timeout (float): Tempo máximo da requisição, em segundos.
+        hosts (Sequence[str]): Hosts aceitos.
+        esquemas (Sequence[str]): Esquemas aceitos.
+
+    Returns:
+        bytes: Conteúdo da resposta.
+
+    Raises:
+        ValueError: Se a URL, ou um redirecionamento, não for permitida.
+        OSError: Se a requisição falhar ou passar do tempo.
+    """
+    validar_url(url, hosts, esquemas)
+    abridor = urllib.request.build_opener(
+        _RedirecionamentoRestrito(hosts, esquemas))
+    requisicao = urllib.request.Request(
+        url, headers={'User-Agent': 'streamlit-fifa-py-estudo'})
+    with abridor.open(requisicao, timeout=timeout) as resposta:
+        return resposta.read()
+
+
+class AssetCache:
+    """Cache LRU de imagens em disco, com orçamento de bytes.
+
+    O índice dos arquivos é montado a partir da pasta na primeira consulta
+    e mantido em memória. Arquivos são gravados com nome temporário e
+    renomeados, de modo que nunca há imagem pela metade na pasta. As buscas
+    rodam em um executor próprio e cada URL é buscada por uma única thread,
+    mesmo quando várias sessões a pedem.
+
+    Attributes:
+        pasta (Path): Pasta das imagens.
+        max_bytes (int): Tamanho máximo da pasta.
+        fetcher (Fetcher): Função usada para buscar as URLs.
+        workers (int): Buscas simultâneas.
+
+    Example:
+        ```python
+        cache = AssetCache(tmp_path, fetcher=lambda url: b'...')
+        caminhos = cache.obter_varios(df['photo'])
+        st.image(str(cache.obter(url) or url))
+        ```
+    """
+
+    def __init__(
+            self,
+            pasta: Path = PASTA_ASSETS,
+            max_bytes: int = ASSETS_MAX_BYTES,
+            fetcher: Fetcher = buscar_url,
+            workers: int = ASSETS_WORKERS) -> None:
+        self.pasta = Path(pasta)
+        self.max_bytes = max_bytes
+        self.fetcher = fetcher
+        self.workers = workers
+        self._arquivos: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        self._carregado = False
+        self._falhas: Dict[str, float] = {}
+        self._buscando: Dict[str, "Future[Optional[Path]]"] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix='fifa-assets')
+        self._lock = threading.Lock()
+
+    def caminho(self, url: str) -> Path:
+        """Retorna o arquivo local de uma URL, exista ele ou não.
+
+        Args:
+            url (str): Endereço da imagem.
+
+        Returns:
+            Path: Arquivo nomeado pelo hash da URL, com a extensão dela.
+        """
+        extensao = Path(url.split('?', 1)[0]).suffix.lower()[:5]
+        nome = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.pasta / f'{nome}{extensao}'
+
+    def obter(self, url: str, aguardar: bool = False) -> Optional[Path]:
+        """Retorna o arquivo local de uma imagem, buscando-a se necessário.
+
+        Args:
+            url (str): Endereço da imagem.
+            aguardar (bool): Se True, espera a busca de uma imagem que ainda
+                não está no cache.
+
+        Returns:
+            Optional[Path]: Arquivo local, ou None se a imagem ainda estiver
+                sendo buscada ou se a busca falhar.
+        """
+        return self.obter_varios([url], aguardar).get(url)
+
+    def obter_varios(
+            self,
+            urls: Iterable[str],
+            aguardar: bool = False) -> Dict[str, Optional[Path]]:
+        """Retorna os arquivos locais de várias imagens e busca as que
+        faltam em segundo plano.
+
+        Sem ``aguardar``, nunca espera pela rede: as imagens que faltam
+        ficam como None nesta chamada e estarão no cache nas próximas.
+        Valores que não são texto, como NaN, e URLs repetidas são ignorados.
+
+        Args:
+            urls (Iterable[str]): Endereços das imagens.
+            aguardar (bool): Se True, espera as buscas iniciadas ou em
+                curso.
+
+        Returns:
+            Dict[str, Optional[Path]]: Arquivo local de cada URL, ou None
+                para as que ainda não estão no cache.
+        """
+        unicas = list(dict.fromkeys(
+            url for url in urls if isinstance(url, str) and url))
+        resultado: Dict[str, Optional[Path]] = {}
+        buscas: Dict[str, "Future[Optional[Path]]"] = {}
+        novas = []
+        agora = time.monotonic()
+        with self._lock:
+            self._carregar_indice()
+            for url in unicas:
+                caminho = self.caminho(url)
+                if caminho.name in self._arquivos:
+                    self._arquivos.move_to_end(caminho.name)
+                    resultado[url] = caminho
+                    continue
+                resultado[url] = None
+                if url in self._buscando:
+                    buscas[url] = self._buscando[url]
+                elif agora - self._falhas.get(url, -ASSETS_ESPERA_FALHA_S) \
+                        >= ASSETS_ESPERA_FALHA_S:
+                    buscas[url] = self._buscando[url] = self._executor.submit(
+                        self._buscar, url)
+                    novas.append(url)
+
+        for url in novas:
+            buscas[url].add_done_callback(
+                lambda _, url=url: self._concluir_busca(url))
+        if aguardar and buscas:
+            wait(buscas.values())
+            resultado.update(
+                {url: future.result() for url, future in buscas.items()})
+        return resultado
+
+    def data_url(self, url: str, aguardar: bool = False) -> str:
+        """Retorna a imagem como data URL, ou a própria URL se ela ainda não
+        estiver no cache.
+
+        Args:
+            url (str): Endereço da imagem.
+            aguardar (bool): Se True, espera a busca da imagem.
+
+        Returns:
+            str: ``data:<tipo>;base64,...`` com o conteúdo local.
+        """
+        return self.data_urls([url], aguardar).get(url, url)
+
+    def data_urls(
+            self,
+            urls: Iterable[str],
+            aguardar: bool = False) -> Dict[str, str]:
+        """Versão em lote de ``data_url``.
+
+        Args:
+            urls (Iterable[str]): Endereços das imagens.
+            aguardar (bool): Se True, espera as buscas das imagens.
+
+        Returns:
+            Dict[str, str]: Data URL, ou a URL original, de cada endereço.
+        """
+        convertidas = {}
+        for url, caminho in self.obter_varios(urls, aguardar).items():
+            convertidas[url] = url
+            if caminho is not None:
+                # A imagem pode ter sido despejada depois da consulta
+                try:
+                    convertidas[url] = _como_data_url(caminho)
+                except FileNotFoundError:
+                    pass
+        return convertidas
+
+    def clear(self) -> None:
+        """Remove todas as imagens da pasta e esquece as falhas."""
+        with self._lock:
+            self._carregar_indice()
+            for nome in list(self._arquivos):
+                self._remover(nome)
+            self._falhas.clear()
+
+    def _concluir_busca(self, url: str) -> None:
+        with self._lock:
+            future = self._buscando.get(url)
+            if future is not None and future.done():
+                del self._buscando[url]
+
+    def _buscar(self, url: str) -> Optional[Path]:
+        with span('assets.buscar') as atual:
+            try:
+                conteudo = self.fetcher(url)
+            except Exception as e:
+                atual.registrar(falha=type(e).__name__)
+                with self._lock:
+                    self._falhas[url] = time.monotonic()
+                return None
+            atual.registrar(bytes=len(conteudo))
+
+        caminho = self.caminho(url)
+        self.pasta.mkdir(parents=True, exist_ok=True)
+        temporario = caminho.with_name(
+            f'.{caminho.name}.{threading.get_ident()}.tmp')
+        temporario.write_bytes(conteudo)
+        os.replace(temporario, caminho)
+        with self._lock:
+            self._falhas.pop(url, None)
+            self._bytes -= self._arquivos.pop(caminho.name, 0)
+            self._arquivos[caminho.name] = len(conteudo)
+            self._bytes += len(conteudo)
+            self._despejar(manter=caminho.name)
+        return caminho
+
+    def _carregar_indice(self) -> None:
+        if self._carregado:
+            return
+        self._carregado = True
+        if not self.pasta.is_dir():
+            return
+        arquivos = []
+        for entrada in os.scandir(self.pasta):
+            if entrada.is_file() and not entrada.name.startswith('.'):
+                stat = entrada.stat()
+                arquivos.append((stat.st_mtime_ns, entrada.name, stat.st_size))
+        for _, nome, tamanho in sorted(arquivos):
+            self._arquivos[nome] = tamanho
+            self._bytes += tamanho
+        self._despejar()
+
+    def _despejar(self, manter: Optional[str] = None) -> None:
+        while self._bytes > self.max_bytes and self._arquivos:
+            nome = next(iter(self._arquivos))
+            if nome == manter:
+                break
+            self._remover(nome)
+
+    def _remover(self, nome: str) -> None:
+        self._bytes -= self._arquivos.pop(nome)
+        (self.pasta / nome).unlink(missing_ok=True)
+
+
+def _como_data_url(caminho: Path) -> str:
+    tipo = mimetypes.guess_type(caminho.name)[0] or 'image/png'
+    conteudo = base64.b64encode(caminho.read_bytes()).decode('ascii')
+    return f'data:{tipo};base64,{conteudo}'
+
+
+ASSET_CACHE: AssetCache = AssetCache()
+"""Cache de imagens compartilhado por todas as sessões do processo."""
@@ -0,0 +1,240 @@
+"""Catálogo persistente dos datasets disponíveis na pasta de datasets.
+
+O catálogo guarda, para cada CSV, tamanho, data de modificação, hash, número
+de linhas, colunas e quantidade de clubes e nacionalidades. Ele é gravado em
+um manifesto JSON dentro de uma subpasta oculta e só é recalculado quando a
+data de modificação da pasta muda, isto é, quando arquivos são criados,
+removidos ou renomeados. Arquivos cujo tamanho e data de modificação não
+mudaram reaproveitam os dados do manifesto.
+
+Gravações feitas pela própria aplicação devem chamar ``invalidar``, pois
+sobrescrever um arquivo existente não altera a data de modificação da pasta.
+Arquivos que não podem ser lidos são registrados no log e ficam fora da
+listagem até a próxima mudança na pasta.
+
+O pandas e a cópia colunar só são importados quando um arquivo precisa ser
+lido, de modo que listar um catálogo atualizado não carrega a pilha de
+dados.
+
+Attributes:
+    CATALOGO_DATASETS (CatalogoDatasets): Catálogo da PASTA_DATASETS.
+"""
+import json
+import logging
+import os
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    MANIFESTO_CATALOGO,
+    PASTA_DATASETS,
+)
+from streamlit_fifa_py_estudo.app.utils.hashing import hash_arquivo
+
+LOGGER = logging.getLogger(__name__)
+
+VERSAO_CATALOGO = 1
+"""Versão do formato do manifesto; manifestos de outras versões são
+recalculados."""
+
+
+@dataclass(frozen=True)
+class DatasetInfo:
+    """Metadados de um arquivo de dataset.
+
+    Attributes:
+        name (str): Nome do arquivo sem a extensão .csv.
+        size (int): Tamanho do arquivo em bytes.
+        mtime_ns (int): Data de modificação em nanossegundos.
+        content_hash (str): Hash do conteúdo do arquivo.
+        rows (int): Quantidade de linhas de dados do CSV, antes dos filtros
+            aplicados na leitura.
+        columns (Tuple[str, ...]): Colunas do cabeçalho do CSV.
+        clubs (Optional[int]): Quantidade de clubes distintos, ou None se o
+            CSV não tiver a coluna Club.
+        nationalities (Optional[int]): Quantidade de nacionalidades
+            distintas, ou None se o CSV não tiver a coluna Nationality.
+    """
+    name: str
+    size: int
+    mtime_ns: int
+    content_hash: str
+    rows: int
+    columns: Tuple[str, ...]
+    clubs: Optional[int]
+    nationalities: Optional[int]
+
+    @classmethod
+    def from_path(cls, path: Path) -> "DatasetInfo":
+        """Calcula os metadados lendo o arquivo.
+
+        A cópia colunar é usada quando estiver atualizada; caso contrário
+        só as colunas Club e Nationality do CSV são lidas. Um arquivo que não
+        pode ser lido como CSV é catalogado sem colunas e sem linhas.
+
+        Args:
+            path (Path): Caminho do arquivo CSV.
+
+        Returns:
+            DatasetInfo: Metadados do arquivo.
+        """
+        import pandas as pd
+
+        from streamlit_fifa_py_estudo.app.utils.sidecar import ler_sidecar
+
+        stat = os.stat(path)
+        try:
+            columns = tuple(pd.read_csv(path, nrows=0).columns)
+        except ValueError:
+            columns = ()
+
+        table = ler_sidecar(path, memory_map=True)
+        if not columns:
+            rows, clubs, nationalities = 0, None, None
+        elif table is not None:
+            rows = len(table)
+            clubs = pd.Series(table.coluna('club')).nunique()
+            nationalities = pd.Series(table.coluna('nationality')).nunique()
+        else:
+            usecols = [c for c in ('Club', 'Nationality') if c in columns]
+            df = pd.read_csv(path, usecols=usecols or [0])
+            rows = len(df)
+            clubs = df['Club'].nunique() if 'Club' in df else None
+            nationalities = (df['Nationality'].nunique()
+                             if 'Nationality' in df else None)
+
+        return cls(
+            name=Path(path).stem,
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            content_hash=hash_arquivo(path),
+            rows=rows,
+            columns=columns,
+            clubs=None if clubs is None else int(clubs),
+            nationalities=(None if nationalities is None
+                           else int(nationalities)),
+        )
+
+
+class CatalogoDatasets:
+    """Catálogo dos CSVs de uma pasta, persistido em um manifesto JSON.
+
+    Attributes:
+        pasta (Path): Pasta com os arquivos CSV.
+        manifesto (Path): Arquivo JSON com o catálogo gravado.
+
+    Example:
+        ```python
+        catalogo = CatalogoDatasets(PASTA_DATASETS)
+        nomes = [info.name for info in catalogo.listar()]
+        ```
+    """
+
+    def __init__(self, pasta: Path) -> None:
+        self.pasta = Path(pasta)
+        self.manifesto = self.pasta / MANIFESTO_CATALOGO
+        self._mtime_pasta: Optional[int] = None
+        self._datasets: Dict[str, DatasetInfo] = {}
+        self._carregado = False
+        self._lock = threading.Lock()
+
+    def listar(self) -> List[DatasetInfo]:
+        """Retorna os datasets da pasta, ordenados pelo nome.
+
+        Custa apenas um ``stat`` da pasta enquanto ela não mudar.
+
+        Returns:
+            List[DatasetInfo]: Metadados de cada CSV da pasta; vazia se a
+                pasta não existir.
+        """
+        with self._lock:
+            if not self.pasta.is_dir():
+                return []
+            if not self._carregado:
+                self._ler_manifesto()
+            if os.stat(self.pasta).st_mtime_ns != self._mtime_pasta:
+                self._atualizar()
+            return [self._datasets[nome] for nome in sorted(self._datasets)]
+
+    def obter(self, name: str) -> Optional[DatasetInfo]:
+        """Retorna os metadados de um dataset pelo nome.
+
+        Args:
+            name (str): Nome do arquivo sem a extensão .csv.
+
+        Returns:
+            Optional[DatasetInfo]: Metadados do dataset, ou None se ele não
+                existir.
+        """
+        return next((info for info in self.listar() if info.name == name),
+                    None)
+
+    def invalidar(self) -> None:
+        """Força a conferência dos arquivos na próxima listagem."""
+        with self._lock:
+            self._mtime_pasta = None
+
+    def _ler_manifesto(self) -> None:
+        self._carregado = True
+        try:
+            dados = json.loads(self.manifesto.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if dados.get('versao') != VERSAO_CATALOGO:
+            return
+        self._mtime_pasta = dados['mtime_pasta']
+        self._datasets = {
+            info['name']: DatasetInfo(
+                **{**info, 'columns': tuple(info['columns'])})
+            for info in dados['datasets']
+        }
+
+    def _atualizar(self) -> None:
+        # O manifesto fica em uma subpasta para que gravá-lo não altere a
+        # data de modificação da pasta de datasets
+        self.manifesto.parent.mkdir(exist_ok=True)
+        # Lida antes da varredura: mudanças durante ela forçam outra
+        mtime_pasta = os.stat(self.pasta).st_mtime_ns
+        datasets: Dict[str, DatasetInfo] = {}
+        with os.scandir(self.pasta) as entradas:
+            for entrada in entradas:
+                if not entrada.name.endswith('.csv'):
+                    continue
+                nome = Path(entrada.name).stem
+                # Um arquivo corrompido, ilegível ou removido durante a
+                # varredura fica fora da listagem sem esconder os demais
+                try:
+                    if not entrada.is_file():
+                        continue
+                    stat = entrada.stat()
+                    anterior = self._datasets.get(nome)
+                    if (anterior is not None
+                            and anterior.size == stat.st_size
+                            and anterior.mtime_ns == stat.st_mtime_ns):
+                        datasets[nome] = anterior
+                    else:
+                        datasets[nome] = DatasetInfo.from_path(
+                            Path(entrada.path))
+                except Exception:
+                    LOGGER.exception(
+                        'Dataset %s ignorado no catálogo', entrada.path)
+
+        self._datasets = datasets
+        self._mtime_pasta = mtime_pasta
+        self._gravar_manifesto()
+
+    def _gravar_manifesto(self) -> None:
+        dados = {
+            'versao': VERSAO_CATALOGO,
+            'mtime_pasta': self._mtime_pasta,
+            'datasets': [asdict(info) for info in self._datasets.values()],
+        }
+        temporario = self.manifesto.with_name(f'{self.manifesto.name}.tmp')
+        temporario.write_text(json.dumps(dados), encoding='utf-8')
+        os.replace(temporario, self.manifesto)
+
+
+CATALOGO_DATASETS = CatalogoDatasets(PASTA_DATASETS)
+"""Catálogo da pasta de datasets compartilhado por todas as sessões."""
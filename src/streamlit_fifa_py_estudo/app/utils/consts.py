@@ -1,3 +1,110 @@
+import os
 from pathlib import Path
 #constante para o caminho do arquivo de dados
 PASTA_DATASETS = Path(__file__).parent.parent.parent / 'app/datasets'
+
+#limites do cache de datasets compartilhado entre as sessões
+CACHE_DATASETS_MAX_ENTRADAS = 8
+CACHE_DATASETS_MAX_BYTES = 512 * 1024 * 1024
+
+#extensão da cópia colunar (Arrow IPC/Feather) gravada ao lado de cada CSV
+EXTENSAO_SIDECAR = '.feather'
+#mapeia a cópia colunar em memória em vez de copiá-la para o processo
+LEITURA_MEMORY_MAP = True
+
+#colunas obrigatórias de um CSV de jogadores FIFA e seus tipos
+COLUNAS_CSV_FIFA = {
+    'ID': 'int64',
+    'Name': 'object',
+    'Age': 'int64',
+    'Photo': 'object',
+    'Nationality': 'object',
+    'Flag': 'object',
+    'Overall': 'int64',
+    'Club': 'object',
+    'Club Logo': 'object',
+    'Value(£)': 'float64',
+    'Wage(£)': 'float64',
+    'Position': 'object',
+    'Joined': 'object',
+    'Contract Valid Until': 'float64',
+    'Height(cm.)': 'float64',
+    'Weight(lbs.)': 'float64',
+    'Release Clause(£)': 'float64',
+}
+#quantidade de linhas do CSV validada por vez no upload
+LINHAS_POR_CHUNK_VALIDACAO = 50_000
+#quantidade de resultados de validação de upload memorizados por hash
+VALIDACOES_MEMORIZADAS = 32
+
+#manifesto do catálogo de datasets, relativo à pasta de datasets
+MANIFESTO_CATALOGO = '.catalogo/manifesto.json'
+
+#quantidade de linhas do CSV lida por vez quando há filtro de linhas
+LINHAS_POR_CHUNK_LEITURA = 50_000
+#motor de leitura do CSV: o pyarrow usa várias threads e só compensa com
+#mais de um núcleo
+MOTOR_LEITURA_CSV = 'pyarrow' if (os.cpu_count() or 1) > 1 else 'c'
+
+#threads usadas para carregar e salvar datasets em segundo plano, inclusive
+#as temporadas carregadas juntas
+WORKERS_SEGUNDO_PLANO = max(2, min(8, os.cpu_count() or 1))
+#opção do seletor de datasets que carrega todas as temporadas juntas
+OPCAO_TODAS_TEMPORADAS = 'Todas as temporadas'
+#quantidade máxima de datasets da barra lateral carregados antecipadamente
+PREFETCH_MAX_DATASETS = 4
+#threads das cargas antecipadas, separadas das leituras pedidas pelas páginas
+#para que a fila de cargas antecipadas nunca atrase uma leitura
+WORKERS_PREFETCH = 1
+#opções de linhas por página das tabelas paginadas
+TAMANHOS_PAGINA = (25, 50, 100)
+#colunas com URLs de imagens, exibidas como imagem e não usadas para ordenar
+COLUNAS_IMAGEM = ('photo', 'flag', 'club_logo')
+#colunas consultadas pela busca de jogadores, quantidade máxima de resultados
+#e fração mínima dos trigramas da busca que o texto encontrado deve conter
+CAMPOS_BUSCA = ('name', 'club', 'nationality')
+BUSCA_LIMITE = 20
+BUSCA_SIMILARIDADE_MIN = 0.4
+#colunas pelas quais os jogadores são agrupados nos rankings, somadas ao
+#salvar um dataset para que o primeiro ranking já as encontre prontas
+GRUPOS_RANKING = ('club', 'nationality', 'position')
+#quantidade de grupos exibidos por padrão no ranking
+RANKING_LIMITE = 20
+#pasta, tamanho máximo e buscas simultâneas do cache local de imagens
+PASTA_ASSETS = Path(__file__).parent.parent.parent / 'app/cache/assets'
+ASSETS_MAX_BYTES = 256 * 1024 * 1024
+ASSETS_WORKERS = 16
+#esquemas e hosts de onde as imagens podem ser buscadas, inclusive depois de
+#um redirecionamento
+ASSETS_ESQUEMAS_PERMITIDOS = ('https',)
+ASSETS_HOSTS_PERMITIDOS = ('cdn.sofifa.net', 'cdn.sofifa.com')
+#tempo máximo de cada busca de imagem e espera antes de tentar de novo uma
+#imagem que falhou, em segundos
+ASSETS_TIMEOUT_S = 5.0
+ASSETS_ESPERA_FALHA_S = 300.0
+#prazos, em segundos, das leituras e salvamentos aguardados pelas páginas
+TIMEOUT_LEITURA_S = 120.0
+TIMEOUT_SALVAMENTO_S = 120.0
+#intervalo, em segundos, entre as atualizações do aviso de carregamento
+INTERVALO_AVISO_CARGA_S = 0.5
+
+#grava os spans de tempo das etapas de leitura, salvamento e páginas
+TRACING_ATIVO = True
+#arquivo JSONL dos spans e sua rotação por tamanho
+ARQUIVO_SPANS = Path(__file__).parent.parent.parent / 'app/logs/spans.jsonl'
+SPANS_MAX_BYTES = 10 * 1024 * 1024
+SPANS_BACKUPS = 5
+
+#variável de ambiente (também lida do .env) e parâmetro da URL que ligam o
+#perfil de cada rerun com cProfile e tracemalloc; o parâmetro da URL só é
+#aceito quando a variável que o permite está ligada no servidor
+VARIAVEL_PERFIL = 'FIFA_PROFILING'
+VARIAVEL_PERFIL_URL = 'FIFA_PROFILING_URL'
+PARAMETRO_PERFIL = 'profile'
+#pasta dos perfis, com uma subpasta por sessão, e perfis mantidos por sessão
+#e no total, somando todas as sessões
+PASTA_PERFIS = Path(__file__).parent.parent.parent / 'app/logs/perfis'
+PERFIS_MAX_POR_SESSAO = 20
+PERFIS_MAX_TOTAL = 100
+#quantidade de funções e de pontos de alocação listados no resumo do perfil
+PERFIL_TOP_ITENS = 25
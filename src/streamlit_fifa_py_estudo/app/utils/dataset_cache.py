@@ -0,0 +1,365 @@
+"""Cache de datasets compartilhado por todas as sessões do Streamlit.
+
+Este módulo implementa um cache read-through, com despejo LRU, para os
+datasets carregados pelo FeaturesPresenter. Cada entrada é identificada pelo
+caminho, data de modificação, tamanho e hash do conteúdo do arquivo, de modo
+que um arquivo sobrescrito nunca devolve dados antigos.
+
+Leituras simultâneas da mesma versão de um arquivo são agrupadas: só a
+primeira executa o carregamento e as demais aguardam o resultado dela, o
+que evita que várias sessões processem o mesmo arquivo ao mesmo tempo
+depois de uma troca de versão ou de um reinício.
+
+Attributes:
+    DATASET_CACHE (DatasetCache): Instância única usada pelo processo.
+"""
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    CACHE_DATASETS_MAX_BYTES,
+    CACHE_DATASETS_MAX_ENTRADAS,
+)
+from streamlit_fifa_py_estudo.app.utils.hashing import hash_arquivo
+
+TypeDataset = TypeVar('TypeDataset')
+
+
+@dataclass(frozen=True)
+class DatasetKey:
+    """Identidade de um arquivo de dataset em disco.
+
+    Attributes:
+        path (str): Caminho absoluto do arquivo.
+        mtime_ns (int): Data de modificação em nanossegundos.
+        size (int): Tamanho do arquivo em bytes.
+        content_hash (str): Hash do conteúdo do arquivo.
+        variante (str): Identifica leituras parciais do mesmo arquivo, como
+            projeções e filtros; vazia para a leitura completa.
+    """
+    path: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+    variante: str = ''
+
+    @classmethod
+    def from_path(cls, path: Path, variante: str = '') -> "DatasetKey":
+        """Cria a chave a partir do estado atual do arquivo.
+
+        Args:
+            path (Path): Caminho do arquivo.
+            variante (str): Identificação da leitura parcial, se houver.
+
+        Returns:
+            DatasetKey: Chave do arquivo.
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir.
+        """
+        stat = os.stat(path)
+        return cls(
+            path=str(Path(path).resolve()),
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            content_hash=hash_arquivo(path),
+            variante=variante,
+        )
+
+    def mesma_versao(self, other: "DatasetKey") -> bool:
+        """Indica se as duas chaves se referem ao mesmo conteúdo do arquivo.
+
+        Args:
+            other (DatasetKey): Chave a comparar.
+
+        Returns:
+            bool: True se caminho, data, tamanho e hash coincidirem.
+        """
+        return (self.path, self.mtime_ns, self.size, self.content_hash) == (
+            other.path, other.mtime_ns, other.size, other.content_hash)
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Contadores de uso do cache.
+
+    Attributes:
+        hits (int): Leituras atendidas pelo cache.
+        misses (int): Leituras que precisaram carregar o dataset.
+        coalesced (int): Leituras que aguardaram o carregamento já em curso
+            do mesmo dataset em vez de repeti-lo.
+        evictions (int): Entradas removidas por falta de espaço.
+        invalidations (int): Entradas removidas explicitamente.
+        entries (int): Quantidade atual de entradas.
+        bytes (int): Memória atual ocupada pelas entradas.
+    """
+    hits: int
+    misses: int
+    coalesced: int
+    evictions: int
+    invalidations: int
+    entries: int
+    bytes: int
+
+
+def _tamanho(valor: Any) -> int:
+    return int(getattr(valor, 'nbytes', 0))
+
+
+def _versao_atual(key: DatasetKey) -> bool:
+    try:
+        stat = os.stat(key.path)
+    except FileNotFoundError:
+        return False
+    return (stat.st_mtime_ns, stat.st_size) == (key.mtime_ns, key.size)
+
+
+class DatasetCache(Generic[TypeDataset]):
+    """Cache LRU de datasets com orçamento de entradas e de bytes.
+
+    O carregamento é feito fora do lock, de modo que leituras de datasets
+    diferentes não se bloqueiam, e uma única vez por chave: quem pede uma
+    chave que já está sendo carregada aguarda esse carregamento. Valores com
+    atributo ``nbytes`` (como a PlayerTable) são contabilizados no orçamento
+    de bytes, medido novamente a cada armazenamento, já que as estruturas
+    montadas sob demanda fazem as entradas crescerem.
+
+    Attributes:
+        max_entries (int): Quantidade máxima de entradas.
+        max_bytes (int): Memória máxima ocupada pelas entradas.
+
+    Example:
+        ```python
+        cache = DatasetCache(max_entries=4)
+        table = cache.get_or_load(path, lambda: carregar(path))
+        cache.invalidate(path)
+        ```
+    """
+
+    def __init__(
+            self,
+            max_entries: int = CACHE_DATASETS_MAX_ENTRADAS,
+            max_bytes: int = CACHE_DATASETS_MAX_BYTES) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entradas: OrderedDict[DatasetKey, TypeDataset] = OrderedDict()
+        self._tamanhos: Dict[DatasetKey, int] = {}
+        self._carregando: Dict[DatasetKey, "Future[TypeDataset]"] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def get_or_load(
+            self,
+            path: Path,
+            loader: Callable[[], TypeDataset],
+            variante: str = '') -> TypeDataset:
+        """Retorna o dataset do cache ou o carrega com ``loader``.
+
+        Se outra thread já está carregando a mesma chave, aguarda esse
+        carregamento e devolve o mesmo resultado; ``loader`` não é chamado.
+        Se o arquivo mudar durante a carga, o resultado é devolvido mas não
+        é armazenado, e nunca substitui uma versão mais nova já em cache.
+
+        Args:
+            path (Path): Caminho do arquivo do dataset.
+            loader (Callable[[], TypeDataset]): Função que carrega o dataset
+                quando ele não está no cache.
+            variante (str): Identificação da leitura parcial feita por
+                ``loader``; cada variante ocupa sua própria entrada.
+
+        Returns:
+            TypeDataset: Dataset em cache ou recém carregado.
+
+        Raises:
+            FileNotFoundError: Se o arquivo não existir.
+            Exception: Qualquer erro lançado por ``loader`` ou ao armazenar
+                o resultado, levantado para quem carregou e para todos que
+                aguardavam, como a mesma instância; erros não são
+                armazenados no cache.
+        """
+        key = DatasetKey.from_path(path, variante)
+        with self._lock:
+            if key in self._entradas:
+                self._entradas.move_to_end(key)
+                self._hits += 1
+                return self._entradas[key]
+            em_curso = self._carregando.get(key)
+            if em_curso is not None:
+                self._coalesced += 1
+            else:
+                self._misses += 1
+                carregamento: "Future[TypeDataset]" = Future()
+                self._carregando[key] = carregamento
+
+        if em_curso is not None:
+            return em_curso.result()
+
+        # Falhas ao armazenar também chegam a quem aguarda, e a chave nunca
+        # fica presa como em carregamento
+        try:
+            valor = loader()
+            self._armazenar(key, valor)
+        except BaseException as e:
+            with self._lock:
+                self._carregando.pop(key, None)
+            carregamento.set_exception(e)
+            raise
+        carregamento.set_result(valor)
+        return valor
+
+    def contains(self, path: Path, variante: str = '') -> bool:
+        """Indica se a versão atual do arquivo já está no cache.
+
+        Não altera a ordem de despejo nem os contadores.
+
+        Args:
+            path (Path): Caminho do arquivo do dataset.
+            variante (str): Identificação da leitura parcial, se houver.
+
+        Returns:
+            bool: True se o dataset está no cache; False também se o arquivo
+                não existir.
+        """
+        try:
+            key = DatasetKey.from_path(path, variante)
+        except FileNotFoundError:
+            return False
+        with self._lock:
+            return key in self._entradas
+
+    def _armazenar(self, key: DatasetKey, valor: TypeDataset) -> None:
+        tamanho = _tamanho(valor)
+        medidas = self._medir()
+        # Uma carga lenta pode terminar depois que o arquivo foi
+        # sobrescrito; seu resultado é entregue, mas não guardado
+        atual = _versao_atual(key)
+        with self._lock:
+            self._carregando.pop(key, None)
+            outras = [
+                k for k in self._entradas
+                if k.path == key.path and not k.mesma_versao(key)
+            ]
+            if not atual or any(
+                    k.mtime_ns > key.mtime_ns for k in outras):
+                return
+            # Versões anteriores do mesmo arquivo não serão mais lidas
+            for antiga in outras:
+                self._remover(antiga)
+            if tamanho > self.max_bytes:
+                return
+            self._recontar(medidas)
+            self._entradas[key] = valor
+            self._tamanhos[key] = tamanho
+            self._bytes += tamanho
+            self._despejar()
+
+    def _medir(self) -> Dict[DatasetKey, int]:
+        # Índices e colunas lidas depois do armazenamento aumentam o tamanho
+        # das entradas, que é medido de novo antes de cada despejo. A medida
+        # é feita fora do lock, pois pode percorrer os textos de uma tabela
+        with self._lock:
+            entradas = list(self._entradas.items())
+        return {key: _tamanho(valor) for key, valor in entradas}
+
+    def _recontar(self, medidas: Dict[DatasetKey, int]) -> None:
+        for key, tamanho in medidas.items():
+            if key in self._tamanhos:
+                self._tamanhos[key] = tamanho
+        self._bytes = sum(self._tamanhos.values())
+
+    def _remover(self, key: DatasetKey) -> None:
+        del self._entradas[key]
+        self._bytes -= self._tamanhos.pop(key)
+
+    def _despejar(self) -> None:
+        while self._entradas and (
+                len(self._entradas) > self.max_entries
+                or self._bytes > self.max_bytes):
+            self._remover(next(iter(self._entradas)))
+            self._evictions += 1
+
+    def invalidate(self, path: Path) -> int:
+        """Remove do cache todas as entradas de um arquivo, de todas as
+        variantes.
+
+        Args:
+            path (Path): Caminho do arquivo.
+
+        Returns:
+            int: Quantidade de entradas removidas.
+        """
+        resolvido = str(Path(path).resolve())
+        with self._lock:
+            chaves = [k for k in self._entradas if k.path == resolvido]
+            for key in chaves:
+                self._remover(key)
+            self._invalidations += len(chaves)
+        return len(chaves)
+
+    def configure(
+            self,
+            max_entries: Optional[int] = None,
+            max_bytes: Optional[int] = None) -> None:
+        """Altera os limites do cache, despejando entradas se necessário.
+
+        Args:
+            max_entries (Optional[int]): Nova quantidade máxima de entradas.
+            max_bytes (Optional[int]): Nova memória máxima em bytes.
+        """
+        medidas = self._medir()
+        with self._lock:
+            if max_entries is not None:
+                self.max_entries = max_entries
+            if max_bytes is not None:
+                self.max_bytes = max_bytes
+            self._recontar(medidas)
+            self._despejar()
+
+    def clear(self) -> None:
+        """Remove todas as entradas e zera os contadores.
+
+        Carregamentos em curso não são interrompidos; seus resultados são
+        armazenados quando terminarem.
+        """
+        with self._lock:
+            self._entradas.clear()
+            self._tamanhos.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+            self._coalesced = 0
+            self._evictions = 0
+            self._invalidations = 0
+
+    def stats(self) -> CacheStats:
+        """Retorna uma fotografia dos contadores do cache.
+
+        Returns:
+            CacheStats: Contadores de uso e ocupação atual.
+        """
+        medidas = self._medir()
+        with self._lock:
+            self._recontar(medidas)
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                coalesced=self._coalesced,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entradas),
+                bytes=self._bytes,
+            )
+
+
+DATASET_CACHE: DatasetCache = DatasetCache()
+"""Cache de datasets compartilhado por todas as sessões do processo."""
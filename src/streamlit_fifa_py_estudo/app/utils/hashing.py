@@ -0,0 +1,79 @@
+"""Funções de hash de conteúdo usadas para identificar datasets.
+
+Este módulo centraliza o cálculo do hash dos arquivos e bytes de CSV, para que
+cache, salvamento e catálogo de datasets usem a mesma identidade de conteúdo.
+
+Functions:
+    hash_bytes(data: bytes) -> str: Hash de um conteúdo em memória
+    hash_arquivo(path: Path) -> str: Hash de um arquivo, memorizado por
+        caminho, data de modificação e tamanho
+"""
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Tuple
+
+TAMANHO_BLOCO_HASH = 1024 * 1024
+"""Quantidade de bytes lida por vez ao calcular o hash de um arquivo."""
+TAMANHO_DIGEST = 16
+"""Tamanho, em bytes, do hash blake2b gerado."""
+
+_hashes_arquivos: Dict[Tuple[str, int, int], str] = {}
+_lock_hashes = threading.Lock()
+
+
+def hash_bytes(data: bytes) -> str:
+    """Calcula o hash de um conteúdo em memória.
+
+    Args:
+        data (bytes): Conteúdo a ser identificado.
+
+    Returns:
+        str: Hash hexadecimal do conteúdo.
+
+    Example:
+        ```python
+        hash_bytes(b'ID,Name')  # Output: "5d0c..."
+        ```
+    """
+    digest = hashlib.blake2b(digest_size=TAMANHO_DIGEST)
+    digest.update(data)
+    return digest.hexdigest()
+
+
+def hash_arquivo(path: Path) -> str:
+    """Calcula o hash do conteúdo de um arquivo.
+
+    O resultado é memorizado pela combinação de caminho, data de modificação
+    e tamanho, de modo que chamadas repetidas sobre um arquivo inalterado
+    custam apenas um ``stat``.
+
+    Args:
+        path (Path): Caminho do arquivo.
+
+    Returns:
+        str: Hash hexadecimal do conteúdo, igual a ``hash_bytes`` dos
+            mesmos bytes.
+
+    Raises:
+        FileNotFoundError: Se o arquivo não existir.
+    """
+    stat = os.stat(path)
+    chave = (str(Path(path).resolve()), stat.st_mtime_ns, stat.st_size)
+    with _lock_hashes:
+        if chave in _hashes_arquivos:
+            return _hashes_arquivos[chave]
+
+    digest = hashlib.blake2b(digest_size=TAMANHO_DIGEST)
+    with open(path, 'rb') as file:
+        for bloco in iter(lambda: file.read(TAMANHO_BLOCO_HASH), b''):
+            digest.update(bloco)
+    resultado = digest.hexdigest()
+
+    with _lock_hashes:
+        # Mantém apenas a versão mais recente de cada caminho
+        for antiga in [c for c in _hashes_arquivos if c[0] == chave[0]]:
+            del _hashes_arquivos[antiga]
+        _hashes_arquivos[chave] = resultado
+    return resultado
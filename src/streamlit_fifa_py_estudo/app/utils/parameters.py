@@ -1,9 +1,20 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from datetime import date
+from typing import TYPE_CHECKING, Callable, Optional, Tuple
 
+import numpy as np
 from py_return_success_or_error import ParametersReturnResult
 
 from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError, SaveCsvFifaError
 
+if TYPE_CHECKING:
+    from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+        PlayerTable, )
+
+
+FiltroJogadores = Callable[['PlayerTable'], np.ndarray]
+"""Critério extra de filtro: recebe a tabela e retorna uma máscara booleana."""
+
 
 @dataclass
 class LoadCsvParameters(ParametersReturnResult):
@@ -12,25 +23,62 @@ class LoadCsvParameters(ParametersReturnResult):
     Attributes:
         file_path (str): Caminho do arquivo CSV a ser carregado
         error (LoadCsvFifaError): Instância de erro para tratamento de falhas
+        as_of (Optional[date]): Data de referência para considerar um
+            contrato ativo; None usa a data atual
+        min_overall (int): Overall mínimo dos jogadores mantidos
+        sort_by (str): Coluna da PlayerTable usada na ordenação
+        descending (bool): Se True, ordena do maior para o menor valor
+        filters (Tuple[FiltroJogadores, ...]): Critérios extras, combinados
+            com os padrões; cada um retorna uma máscara booleana
+        columns (Optional[Tuple[str, ...]]): Colunas da PlayerTable a
+            carregar; None carrega todas. As colunas usadas nos filtros e na
+            ordenação são incluídas automaticamente, exceto as dos critérios
+            extras
+        club (Optional[str]): Carrega apenas os jogadores desse clube
+        engine (str): Leitor do CSV: 'c', o padrão do pandas, ou 'pyarrow',
+            que usa várias threads
 
     Example:
         ```python
         params = LoadCsvParameters(
             file_path="data/fifa23.csv",
-            error=LoadCsvFifaError()
+            error=LoadCsvFifaError(),
+            as_of=date(2023, 1, 1),
+            sort_by='value',
+            columns=('id', 'name', 'club', 'overall'),
+            club='Manchester City',
+            engine='pyarrow',
         )
         ```
     """
     file_path: str
     error: LoadCsvFifaError
+    as_of: Optional[date] = None
+    min_overall: int = 1
+    sort_by: str = 'overall'
+    descending: bool = True
+    filters: Tuple[FiltroJogadores, ...] = ()
+    columns: Optional[Tuple[str, ...]] = None
+    club: Optional[str] = None
+    engine: str = 'c'
 
     def __str__(self) -> str:
         """Retorna representação string dos parâmetros.
 
+        Os critérios de filtro e ordenação só aparecem quando diferem do
+        padrão.
+
         Returns:
             str: String formatada com os atributos da classe
         """
-        return self.__repr__()
+        atributos = [f'error={self.error!r}', f'file_path={self.file_path!r}']
+        for campo in fields(self):
+            if campo.name in ('error', 'file_path'):
+                continue
+            valor = getattr(self, campo.name)
+            if valor != campo.default:
+                atributos.append(f'{campo.name}={valor!r}')
+        return f"LoadCsvParameters({', '.join(atributos)})"
 
 
 @dataclass
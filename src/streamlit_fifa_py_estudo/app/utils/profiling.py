@@ -0,0 +1,174 @@
+"""Perfil opcional de cada rerun do Streamlit com cProfile e tracemalloc.
+
+O perfil é ligado sem mudar código, pela variável de ambiente
+``FIFA_PROFILING=1`` (inclusive a partir de um ``.env``) ou pelo parâmetro
+``?profile=1`` na URL da aplicação. O parâmetro só é aceito quando o
+servidor também define ``FIFA_PROFILING_URL=1``, de modo que um visitante
+não consegue ligar o perfil, que deixa os reruns mais lentos e grava
+arquivos em disco. Cada rerun perfilado grava, na subpasta da sessão em
+``PASTA_PERFIS``:
+
+- ``<instante>.prof``: estatísticas do cProfile, que podem ser abertas com
+  ``pstats`` ou ``snakeviz``;
+- ``<instante>.txt``: as funções de maior tempo acumulado e os pontos do
+  código que mais alocaram memória durante o rerun.
+
+Só os ``PERFIS_MAX_POR_SESSAO`` reruns mais recentes de cada sessão, e os
+``PERFIS_MAX_TOTAL`` mais recentes somando todas as sessões, são mantidos.
+O cProfile e o tracemalloc valem para o processo inteiro, então apenas um
+rerun é perfilado por vez; reruns de outras sessões que coincidirem com ele
+rodam sem perfil.
+"""
+import cProfile
+import io
+import os
+import pstats
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+import streamlit as st
+from dotenv import load_dotenv
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    PARAMETRO_PERFIL,
+    PASTA_PERFIS,
+    PERFIL_TOP_ITENS,
+    PERFIS_MAX_POR_SESSAO,
+    PERFIS_MAX_TOTAL,
+    VARIAVEL_PERFIL,
+    VARIAVEL_PERFIL_URL,
+)
+
+load_dotenv()
+
+_LOCK_PERFIL = threading.Lock()
+
+VALORES_LIGADOS = ('1', 'true', 'sim', 'on')
+"""Valores da variável de ambiente ou do parâmetro que ligam o perfil."""
+
+
+def _ligado(valor: str) -> bool:
+    return valor.strip().lower() in VALORES_LIGADOS
+
+
+def perfil_ativo() -> bool:
+    """Indica se o rerun atual deve ser perfilado.
+
+    As variáveis de ambiente podem vir do ``.env`` do projeto, carregado na
+    importação deste módulo sem sobrescrever variáveis já definidas.
+
+    Returns:
+        bool: True se ``FIFA_PROFILING`` estiver ligada, ou se
+            ``?profile=`` estiver ligado e ``FIFA_PROFILING_URL`` o
+            permitir.
+    """
+    if _ligado(os.environ.get(VARIAVEL_PERFIL, '')):
+        return True
+    if not _ligado(os.environ.get(VARIAVEL_PERFIL_URL, '')):
+        return False
+    return (get_script_run_ctx(suppress_warning=True) is not None
+            and _ligado(st.query_params.get(PARAMETRO_PERFIL, '')))
+
+
+def pasta_da_sessao(pasta: Path = PASTA_PERFIS) -> Path:
+    """Retorna a pasta dos perfis da sessão atual do Streamlit.
+
+    Args:
+        pasta (Path): Pasta raiz dos perfis.
+
+    Returns:
+        Path: Subpasta com o id da sessão, ou ``sem_sessao`` fora do
+            Streamlit.
+    """
+    ctx = get_script_run_ctx(suppress_warning=True)
+    return pasta / (ctx.session_id if ctx is not None else 'sem_sessao')
+
+
+def _descartar_antigos(perfis: List[Path], maximo: int) -> None:
+    # Os nomes são instantes, então a ordem do nome é a ordem de gravação
+    perfis = sorted(perfis, key=lambda perfil: perfil.name)
+    for antigo in perfis[:max(0, len(perfis) - maximo)]:
+        antigo.unlink(missing_ok=True)
+        antigo.with_suffix('.txt').unlink(missing_ok=True)
+
+
+def _gravar_perfil(
+        destino: Path,
+        perfil: cProfile.Profile,
+        snapshot: tracemalloc.Snapshot,
+        maximo: int,
+        raiz: Path,
+        maximo_total: int) -> None:
+    destino.parent.mkdir(parents=True, exist_ok=True)
+    perfil.dump_stats(destino)
+
+    texto = io.StringIO()
+    pstats.Stats(perfil, stream=texto).sort_stats('cumulative').print_stats(
+        PERFIL_TOP_ITENS)
+    texto.write(f'Top {PERFIL_TOP_ITENS} alocações de memória\n')
+    for estatistica in snapshot.statistics('lineno')[:PERFIL_TOP_ITENS]:
+        texto.write(f'{estatistica}\n')
+    destino.with_suffix('.txt').write_text(texto.getvalue(), encoding='utf-8')
+
+    _descartar_antigos(list(destino.parent.glob('*.prof')), maximo)
+    if destino.parent.parent == raiz:
+        _descartar_antigos(list(raiz.glob('*/*.prof')), maximo_total)
+
+
+@contextmanager
+def perfilar_rerun(
+        pasta: Optional[Path] = None,
+        maximo: int = PERFIS_MAX_POR_SESSAO,
+        raiz: Path = PASTA_PERFIS,
+        maximo_total: int = PERFIS_MAX_TOTAL) -> Iterator[Optional[Path]]:
+    """Perfila o bloco com cProfile e tracemalloc, se o perfil estiver ligado.
+
+    Args:
+        pasta (Optional[Path]): Pasta onde o perfil é gravado; por padrão, a
+            pasta da sessão atual dentro de ``raiz``.
+        maximo (int): Quantidade de perfis mantidos na pasta.
+        raiz (Path): Pasta com as subpastas de todas as sessões.
+        maximo_total (int): Quantidade de perfis mantidos somando as
+            subpastas de ``raiz``; vale quando ``pasta`` é uma delas.
+
+    Yields:
+        Optional[Path]: Arquivo ``.prof`` que será gravado ao final do bloco,
+            ou None se o rerun não for perfilado.
+
+    Example:
+        ```python
+        with perfilar_rerun():
+            paginas.run()
+        ```
+    """
+    if not perfil_ativo() or not _LOCK_PERFIL.acquire(blocking=False):
+        yield None
+        return
+
+    try:
+        pasta = pasta_da_sessao(raiz) if pasta is None else pasta
+        destino = pasta / datetime.now().strftime('%Y%m%d-%H%M%S-%f.prof')
+        iniciou_tracemalloc = not tracemalloc.is_tracing()
+        if iniciou_tracemalloc:
+            tracemalloc.start()
+        perfil = cProfile.Profile()
+        perfil.enable()
+        try:
+            yield destino
+        finally:
+            perfil.disable()
+            snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+            ])
+            if iniciou_tracemalloc:
+                tracemalloc.stop()
+            _gravar_perfil(
+                destino, perfil, snapshot, maximo, raiz, maximo_total)
+    finally:
+        _LOCK_PERFIL.release()
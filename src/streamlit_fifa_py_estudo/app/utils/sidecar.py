@@ -0,0 +1,236 @@
+"""Cópia colunar dos datasets gravada ao lado de cada CSV.
+
+Ao salvar um dataset, a PlayerTable normalizada é gravada em formato Arrow
+IPC (Feather v2) sem compressão, com os tipos de cada coluna e o hash do CSV
+de origem nos metadados. A leitura usa essa cópia enquanto o hash coincidir
+com o do CSV, evitando o parse do texto. No modo ``memory_map`` o arquivo é
+mapeado em memória: as colunas numéricas são expostas sem cópia e as de texto
+só são copiadas quando lidas por inteiro.
+
+Functions:
+    caminho_sidecar(csv_path: Path) -> Path: Caminho da cópia colunar
+    escrever_sidecar(table: PlayerTable, csv_path: Path) -> Path: Grava a
+        cópia colunar de um CSV
+    ler_sidecar(csv_path: Path, memory_map: bool, colunas: Sequence[str])
+        -> Optional[PlayerTable]: Lê a cópia colunar se ela existir e
+        estiver atualizada
+"""
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    COLUNAS_PLAYER_TABLE,
+    ColunaPreguicosa,
+    PlayerTable,
+)
+from streamlit_fifa_py_estudo.app.utils.consts import EXTENSAO_SIDECAR
+from streamlit_fifa_py_estudo.app.utils.hashing import hash_arquivo
+
+VERSAO_SIDECAR = b'1'
+"""Versão do layout gravado; cópias de outras versões são ignoradas."""
+CHAVE_VERSAO = b'fifa.sidecar.versao'
+CHAVE_HASH_CSV = b'fifa.sidecar.hash_csv'
+
+LOGGER = logging.getLogger(__name__)
+
+
+def caminho_sidecar(csv_path: Path) -> Path:
+    """Retorna o caminho da cópia colunar de um CSV.
+
+    Args:
+        csv_path (Path): Caminho do arquivo CSV.
+
+    Returns:
+        Path: Mesmo caminho com a extensão EXTENSAO_SIDECAR.
+    """
+    return Path(csv_path).with_suffix(EXTENSAO_SIDECAR)
+
+
+def escrever_sidecar(table: PlayerTable, csv_path: Path) -> Path:
+    """Grava a cópia colunar de um CSV já salvo em disco.
+
+    A gravação é feita em um arquivo temporário e renomeada ao final, de
+    modo que leitores concorrentes nunca vejam uma cópia incompleta. A
+    tabela é gravada em um único record batch: colunas divididas em vários
+    batches seriam concatenadas, e copiadas, ao virarem arrays numpy.
+
+    Args:
+        table (PlayerTable): Tabela normalizada a partir do CSV.
+        csv_path (Path): Caminho do CSV de origem.
+
+    Returns:
+        Path: Caminho da cópia colunar gravada.
+
+    Example:
+        ```python
+        table = PlayerTable.from_csv_frame(pd.read_csv(path, index_col=0))
+        escrever_sidecar(table, path)
+        ```
+    """
+    colunas: Dict[str, pa.Array] = {}
+    for nome in table.colunas:
+        valores = table.coluna(nome)
+        colunas[nome] = pa.array(valores, from_pandas=valores.dtype == object)
+
+    arrow = pa.table(colunas).replace_schema_metadata({
+        CHAVE_VERSAO: VERSAO_SIDECAR,
+        CHAVE_HASH_CSV: hash_arquivo(csv_path).encode(),
+    })
+
+    destino = caminho_sidecar(csv_path)
+    temporario = destino.with_name(f'{destino.name}.tmp')
+    feather.write_feather(
+        arrow.combine_chunks(), temporario, compression='uncompressed',
+        chunksize=max(len(arrow), 1))
+    os.replace(temporario, destino)
+    return destino
+
+
+def _sidecar_atualizado(schema: pa.Schema, csv_path: Path) -> bool:
+    metadata = schema.metadata or {}
+    return (
+        metadata.get(CHAVE_VERSAO) == VERSAO_SIDECAR
+        and metadata.get(CHAVE_HASH_CSV) == hash_arquivo(csv_path).encode()
+        and tuple(schema.names) == COLUNAS_PLAYER_TABLE
+    )
+
+
+def _para_numpy(coluna: pa.ChunkedArray, nome: str) -> np.ndarray:
+    valores = coluna.to_numpy()
+    if valores.dtype == object and nome != 'joined':
+        # O CSV representa textos ausentes como NaN, e não como None
+        valores[pd.isna(valores)] = np.nan
+    return valores
+
+
+class ColunaArrow(ColunaPreguicosa):
+    """Coluna de texto lida de um arquivo Arrow mapeado em memória.
+
+    Mantém a referência ao ChunkedArray, cujos buffers apontam para o
+    arquivo mapeado, e só cria o array numpy quando a coluna é lida por
+    inteiro. Seleções de linhas são acumuladas e aplicadas nessa leitura.
+
+    Attributes:
+        _arrow (pa.ChunkedArray): Valores originais da coluna.
+        _nome (str): Nome da coluna na PlayerTable.
+        _posicoes (Optional[np.ndarray]): Linhas selecionadas, ou None para
+            todas.
+    """
+    __slots__ = ('_arrow', '_nome', '_posicoes')
+
+    def __init__(
+            self,
+            arrow: pa.ChunkedArray,
+            nome: str,
+            posicoes: Optional[np.ndarray] = None) -> None:
+        self._arrow = arrow
+        self._nome = nome
+        self._posicoes = posicoes
+
+    def __len__(self) -> int:
+        if self._posicoes is None:
+            return len(self._arrow)
+        return len(self._posicoes)
+
+    def materializar(self) -> np.ndarray:
+        arrow = self._arrow
+        if self._posicoes is not None:
+            arrow = arrow.take(pa.array(self._posicoes))
+        return _para_numpy(arrow, self._nome)
+
+    def valor(self, posicao: int) -> Any:
+        if self._posicoes is not None:
+            posicao = int(self._posicoes[posicao])
+        valor = self._arrow[posicao].as_py()
+        if valor is None and self._nome != 'joined':
+            return np.nan
+        return valor
+
+    def take(self, posicoes: np.ndarray) -> "ColunaArrow":
+        posicoes = np.asarray(posicoes, dtype='int64')
+        if self._posicoes is not None:
+            posicoes = self._posicoes[posicoes]
+        return ColunaArrow(self._arrow, self._nome, posicoes)
+
+    @property
+    def nbytes(self) -> int:
+        # Cada valor materializado vira um ponteiro e um str próprio, com o
+        # cabeçalho do objeto somado aos bytes do texto no arquivo
+        quantidade = len(self)
+        texto = self._arrow.nbytes * quantidade // max(len(self._arrow), 1)
+        return quantidade * (8 + sys.getsizeof('')) + texto
+
+
+def ler_sidecar(
+        csv_path: Path,
+        memory_map: bool = False,
+        colunas: Optional[Sequence[str]] = None) -> Optional[PlayerTable]:
+    """Lê a cópia colunar de um CSV, se ela existir e estiver atualizada.
+
+    Com ``memory_map`` o arquivo é mapeado em vez de copiado para a memória
+    do processo: as colunas numéricas viram arrays numpy apontando para o
+    mapeamento e as de texto viram ColunaArrow. Só as páginas do arquivo
+    efetivamente lidas passam a ocupar memória, e elas são compartilhadas
+    entre todos os leitores do mesmo arquivo.
+
+    Args:
+        csv_path (Path): Caminho do CSV de origem.
+        memory_map (bool): Se True, mapeia o arquivo em memória.
+        colunas (Optional[Sequence[str]]): Colunas da PlayerTable a ler;
+            None lê todas.
+
+    Returns:
+        Optional[PlayerTable]: Tabela igual à normalizada a partir do CSV,
+            ou None se a cópia não existir, não corresponder ao CSV atual ou
+            não puder ser lida.
+    """
+    # A cópia é só um cache: truncada ou corrompida, o CSV é lido no lugar
+    try:
+        return _ler_sidecar(csv_path, memory_map, colunas)
+    except (pa.ArrowException, OSError):
+        LOGGER.warning(
+            'Cópia colunar de %s ignorada', csv_path, exc_info=True)
+        return None
+
+
+def _ler_sidecar(
+        csv_path: Path,
+        memory_map: bool,
+        colunas: Optional[Sequence[str]]) -> Optional[PlayerTable]:
+    destino = caminho_sidecar(csv_path)
+    if not destino.exists() or not Path(csv_path).exists():
+        return None
+
+    with pa.OSFile(str(destino)) as arquivo:
+        if not _sidecar_atualizado(
+                pa.ipc.open_file(arquivo).schema, csv_path):
+            return None
+
+    if colunas is not None:
+        colunas = [nome for nome in COLUNAS_PLAYER_TABLE if nome in colunas]
+
+    if not memory_map:
+        arrow = feather.read_table(
+            destino, columns=colunas, memory_map=False)
+        return PlayerTable({
+            nome: _para_numpy(arrow.column(nome), nome)
+            for nome in arrow.column_names
+        })
+
+    arrow = pa.ipc.open_file(pa.memory_map(str(destino))).read_all()
+    mapeadas: Dict[str, Any] = {}
+    for nome in arrow.column_names if colunas is None else colunas:
+        coluna = arrow.column(nome)
+        if pa.types.is_string(coluna.type) or pa.types.is_null(coluna.type):
+            mapeadas[nome] = ColunaArrow(coluna, nome)
+        else:
+            mapeadas[nome] = coluna.to_numpy()
+    return PlayerTable(mapeadas)
@@ -0,0 +1,141 @@
+"""Spans de tempo das etapas da leitura, do salvamento e das páginas.
+
+Cada etapa instrumentada abre um span com ``span('etapa')``. Ao final, o span
+grava uma linha JSON com o início, a duração, a quantidade de linhas e de
+bytes processados, o resultado e atributos extras. As linhas vão para um
+arquivo com rotação por tamanho, de modo que o histórico ocupa no máximo
+``SPANS_MAX_BYTES * (SPANS_BACKUPS + 1)`` bytes. O arquivo pode ser resumido
+offline com ``analisar_spans``.
+
+A gravação usa o ``logging`` da biblioteca padrão, que é seguro entre
+threads. Com TRACING_ATIVO falso os spans ainda medem o tempo, mas nada é
+gravado.
+
+Attributes:
+    LOGGER_SPANS (logging.Logger): Logger que recebe os spans.
+"""
+import json
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    ARQUIVO_SPANS,
+    SPANS_BACKUPS,
+    SPANS_MAX_BYTES,
+    TRACING_ATIVO,
+)
+
+LOGGER_SPANS = logging.getLogger('streamlit_fifa_py_estudo.spans')
+LOGGER_SPANS.propagate = False
+LOGGER_SPANS.setLevel(logging.INFO)
+
+_configurado = False
+_lock_configuracao = threading.Lock()
+
+
+@dataclass
+class Span:
+    """Medida de uma etapa em andamento.
+
+    Attributes:
+        etapa (str): Nome da etapa, como ``'datasource.ler_csv'``.
+        inicio (float): Início da etapa, em segundos desde a época.
+        atributos (Dict[str, Any]): Linhas, bytes e demais dados da etapa.
+    """
+    etapa: str
+    inicio: float
+    atributos: Dict[str, Any] = field(default_factory=dict)
+
+    def registrar(self, **atributos: Any) -> None:
+        """Acrescenta atributos ao span, como ``rows`` e ``bytes``.
+
+        Args:
+            **atributos: Valores serializáveis em JSON.
+        """
+        self.atributos.update(atributos)
+
+
+def configurar_tracing(
+        arquivo: Optional[Path] = ARQUIVO_SPANS,
+        max_bytes: int = SPANS_MAX_BYTES,
+        backups: int = SPANS_BACKUPS) -> None:
+    """Define o arquivo que recebe os spans, substituindo o anterior.
+
+    É chamada automaticamente, com os valores de consts, no primeiro span
+    gravado.
+
+    Args:
+        arquivo (Optional[Path]): Arquivo JSONL de destino; None desliga a
+            gravação.
+        max_bytes (int): Tamanho a partir do qual o arquivo é rotacionado.
+        backups (int): Quantidade de arquivos rotacionados mantidos.
+    """
+    global _configurado
+    with _lock_configuracao:
+        for handler in list(LOGGER_SPANS.handlers):
+            LOGGER_SPANS.removeHandler(handler)
+            handler.close()
+        if arquivo is not None:
+            Path(arquivo).parent.mkdir(parents=True, exist_ok=True)
+            handler = RotatingFileHandler(
+                arquivo, maxBytes=max_bytes, backupCount=backups,
+                encoding='utf-8', delay=True)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            LOGGER_SPANS.addHandler(handler)
+        _configurado = True
+
+
+def _gravar(registro: Dict[str, Any]) -> None:
+    if not _configurado:
+        configurar_tracing()
+    if LOGGER_SPANS.handlers:
+        LOGGER_SPANS.info(json.dumps(registro, default=str))
+
+
+@contextmanager
+def span(etapa: str, **atributos: Any) -> Iterator[Span]:
+    """Mede a duração de uma etapa e grava o span ao final.
+
+    Exceções são repassadas sem alteração; o span é gravado com ``status``
+    ``'erro'`` e o tipo da exceção.
+
+    Args:
+        etapa (str): Nome da etapa.
+        **atributos: Atributos iniciais do span.
+
+    Yields:
+        Span: Span em andamento, para registrar linhas e bytes.
+
+    Example:
+        ```python
+        with span('datasource.ler_csv', engine='c') as atual:
+            table = ler(path)
+            atual.registrar(rows=len(table), bytes=table.nbytes)
+        ```
+    """
+    atual = Span(etapa=etapa, inicio=time.time(), atributos=dict(atributos))
+    relogio = time.perf_counter()
+    status = 'ok'
+    try:
+        yield atual
+    except BaseException as e:
+        status = 'erro'
+        atual.registrar(erro=type(e).__name__)
+        raise
+    finally:
+        if TRACING_ATIVO:
+            _gravar({
+                'etapa': etapa,
+                'inicio': round(atual.inicio, 6),
+                'duracao_ms': round(
+                    (time.perf_counter() - relogio) * 1000, 3),
+                'status': status,
+                'thread': threading.current_thread().name,
+                **atual.atributos,
+            })
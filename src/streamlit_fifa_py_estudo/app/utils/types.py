@@ -8,16 +8,17 @@ TypeAliases:
     LCFData: Tipo para fonte de dados de leitura de CSV FIFA 
     SCFUsecase: Tipo para caso de uso de salvamento de CSV FIFA
 """
-from pathlib import Path
-from typing import List, TypeAlias
+from typing import TypeAlias
 
 from py_return_success_or_error import (
     Datasource,
     UsecaseBaseCallData,
 )
 
-from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.fifa_player import (
-    FifaPlayer, )
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.domain.models.save_csv_result import (
+    SaveCsvResult, )
 from streamlit_fifa_py_estudo.app.utils.parameters import (
     LoadCsvParameters,
     SaveCsvParameters,
@@ -25,47 +26,47 @@ from streamlit_fifa_py_estudo.app.utils.parameters import (
 
 # Type aliases
 LCFUsecase: TypeAlias = UsecaseBaseCallData[
-    List[dict],
-    List[FifaPlayer],
+    PlayerTable,
+    PlayerTable,
     LoadCsvParameters
 ]
 """Tipo para caso de uso de leitura de CSV FIFA.
 
 TypeAlias que representa um caso de uso que:
 - Recebe parâmetros do tipo LoadCsvParameters
-- Processa uma lista de FifaPlayer
-- Retorna uma lista de dicionários
+- Processa a PlayerTable normalizada pela fonte de dados
+- Retorna uma PlayerTable colunar e imutável
 """
-LCFData: TypeAlias = Datasource[List[FifaPlayer], LoadCsvParameters]
+LCFData: TypeAlias = Datasource[PlayerTable, LoadCsvParameters]
 """Tipo para fonte de dados de leitura de CSV FIFA.
 
 TypeAlias que representa uma fonte de dados que:
 - Recebe parâmetros do tipo LoadCsvParameters  
-- Retorna uma lista de FifaPlayer
+- Retorna uma PlayerTable com todos os jogadores do arquivo
 """
 SCFUsecase: TypeAlias = UsecaseBaseCallData[
-    Path,
-    Path,
+    SaveCsvResult,
+    SaveCsvResult,
     SaveCsvParameters
 ]
 """Tipo para caso de uso de salvamento de CSV FIFA.
 
 TypeAlias que representa um caso de uso que:
 - Recebe parâmetros do tipo SaveCsvParameters
-- Processa e retorna um Path do arquivo salvo
+- Processa e retorna um SaveCsvResult com o arquivo salvo
 """
-SCFData: TypeAlias = Datasource[Path, SaveCsvParameters]
+SCFData: TypeAlias = Datasource[SaveCsvResult, SaveCsvParameters]
 """Tipo para fonte de dados de salvamento de CSV FIFA.
 
 TypeAlias que representa uma fonte de dados que:
 - Recebe parâmetros do tipo SaveCsvParameters
-- Retorna um Path do arquivo salvo
+- Retorna um SaveCsvResult com o caminho do arquivo e se ele mudou
 
 Example:
     ```python
     class SalvarCSVDataSource(SCFData):
-        def __call__(self, parameters: SaveCsvParameters) -> Path:
+        def __call__(self, parameters: SaveCsvParameters) -> SaveCsvResult:
             # implementação
-            return path
+            return SaveCsvResult(path=path, changed=True)
     ```
 """
\ No newline at end of file
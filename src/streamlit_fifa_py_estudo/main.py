@@ -6,14 +6,16 @@ de dados do FIFA, definindo a estrutura de navegação e páginas disponíveis.
 
 import streamlit as st
 from streamlit_fifa_py_estudo.app.inicializacao import inicializacao
+from streamlit_fifa_py_estudo.app.utils.profiling import perfilar_rerun
 
 # Configuração das páginas de navegação
+home = st.Page(
+    "app/ui/pages/home.py",
+    title="Home",
+    icon=":material/home:")
 paginas = st.navigation(
     [
-        st.Page(
-            "app/ui/pages/home.py",
-            title="Home",
-            icon=":material/home:"),
+        home,
         st.Page(
             "app/ui/pages/players.py",
             title="Players",
@@ -22,6 +24,14 @@ paginas = st.navigation(
             "app/ui/pages/teams.py",
             title="Teams",
             icon=":material/sports_and_outdoors:"),
+        st.Page(
+            "app/ui/pages/all_players.py",
+            title="All players",
+            icon=":material/table_rows:"),
+        st.Page(
+            "app/ui/pages/leaderboard.py",
+            title="Leaderboard",
+            icon=":material/leaderboard:"),
     ])
 
 
@@ -29,14 +39,17 @@ def main() -> None:
     """Inicializa e executa a aplicação Streamlit.
     
     Configura o layout da página para wide, inicializa as configurações
-    necessárias e executa o sistema de navegação entre páginas.
+    necessárias e executa o sistema de navegação entre páginas. A home não
+    usa dados, então nela nenhum dataset é lido. Com
+    ``FIFA_PROFILING=1`` ou ``?profile=1`` o rerun é perfilado.
     
     Returns:
         None
     """
     st.set_page_config(layout="wide")
-    inicializacao()
-    paginas.run()
+    with perfilar_rerun():
+        inicializacao(carregar_dados=paginas is not home)
+        paginas.run()
 
 
 if __name__ == '__main__':
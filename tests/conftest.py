@@ -0,0 +1,12 @@
+import pytest
+
+from streamlit_fifa_py_estudo.app.utils.tracing import configurar_tracing
+
+
+@pytest.fixture(scope="session", autouse=True)
+def spans_em_pasta_temporaria(tmp_path_factory):
+    # Os spans dos testes não devem se misturar aos da aplicação
+    arquivo = tmp_path_factory.mktemp('spans') / 'spans.jsonl'
+    configurar_tracing(arquivo)
+    yield arquivo
+    configurar_tracing(None)
@@ -1,10 +1,21 @@
 
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
 import pandas as pd
 import pytest
 
+from streamlit_fifa_py_estudo.app.features import features_presenter
 from streamlit_fifa_py_estudo.app.features.features_presenter import FeaturesPresenter
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.usecase.ler_csv_fifa_usecase import (
+    LerCsvFifaUseCase, )
 from streamlit_fifa_py_estudo.app.utils.consts import PASTA_DATASETS
+from streamlit_fifa_py_estudo.app.utils.dataset_cache import DATASET_CACHE
 from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError, SaveCsvFifaError
+from streamlit_fifa_py_estudo.app.utils.sidecar import caminho_sidecar
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -13,6 +24,11 @@ def cleanup_fifa_mock():
     mock_file = PASTA_DATASETS / "fifa_mock.csv"
     if mock_file.exists():
         mock_file.unlink()
+    caminho_sidecar(mock_file).unlink(missing_ok=True)
+    DATASET_CACHE.clear()
+
+
+MOCK_DATA_CSV = Path(__file__).parent.parent / 'datasets' / 'mock_data.csv'
 
 
 def get_mock_bytes_fifa() -> bytes:
@@ -24,6 +40,10 @@ def get_mock_bytes_fifa() -> bytes:
     return mock_data.encode('utf-8')
 
 
+def variante_hoje() -> str:
+    return features_presenter._variante(None, None, date.today())
+
+
 def get_mock_invalid_bytes_fifa() -> bytes:
     # CSV inválido: colunas faltando e tipos errados
     mock_data = """,ID,Name
@@ -87,8 +107,9 @@ def test_features_presenter_salvar_csv_fifa():
         bytes_csv=get_mock_bytes_fifa())
 
     # Assert
-    assert result == PASTA_DATASETS / "fifa_mock.csv"
-    assert result.exists()
+    assert result.path == PASTA_DATASETS / "fifa_mock.csv"
+    assert result.path.exists()
+    assert result.changed
 
 
 def test_features_presenter_salvar_csv_fifa_invalid_data():
@@ -104,3 +125,317 @@ def test_features_presenter_salvar_csv_fifa_invalid_data():
     # Verifica mensagem de erro específica
     assert "SaveCsvFifaError - Erro ao salvar o arquivo CSV" in str(
         exc_info.value)
+
+
+def test_features_presenter_ler_csv_fifa_uses_shared_cache():
+    # Arrange
+    presenter = FeaturesPresenter()
+
+    # Act
+    primeira = presenter.ler_csv_fifa(str(MOCK_DATA_CSV))
+    segunda = FeaturesPresenter().ler_csv_fifa(str(MOCK_DATA_CSV))
+
+    # Assert
+    assert primeira is segunda
+    stats = DATASET_CACHE.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_features_presenter_salvar_csv_fifa_invalidates_cache():
+    # Arrange
+    presenter = FeaturesPresenter()
+    path = presenter.salvar_csv_fifa(
+        csv_name='fifa_mock',
+        bytes_csv=get_mock_bytes_fifa()).path
+    antes = presenter.ler_csv_fifa(str(path))
+
+    # Act
+    presenter.salvar_csv_fifa(
+        csv_name='fifa_mock',
+        bytes_csv=get_mock_bytes_fifa().replace(b'M. Acu', b'Marcos Acu'))
+
+    # Assert
+    assert DATASET_CACHE.stats().invalidations == 1
+    assert presenter.ler_csv_fifa(str(path)) is not antes
+
+
+def test_features_presenter_salvar_csv_fifa_same_content_is_noop():
+    # Arrange
+    presenter = FeaturesPresenter()
+    path = presenter.salvar_csv_fifa(
+        csv_name='fifa_mock',
+        bytes_csv=get_mock_bytes_fifa()).path
+    antes = presenter.ler_csv_fifa(str(path))
+
+    # Act
+    result = presenter.salvar_csv_fifa(
+        csv_name='fifa_mock',
+        bytes_csv=get_mock_bytes_fifa())
+
+    # Assert
+    assert result.path == path
+    assert not result.changed
+    assert DATASET_CACHE.stats().invalidations == 0
+    assert presenter.ler_csv_fifa(str(path)) is antes
+
+
+def test_features_presenter_ler_csv_fifa_projection_has_own_entry():
+    # Arrange
+    presenter = FeaturesPresenter()
+    completa = presenter.ler_csv_fifa(str(MOCK_DATA_CSV))
+
+    # Act
+    parcial = presenter.ler_csv_fifa(
+        str(MOCK_DATA_CSV), columns=['name'], club=completa[0]['club'])
+
+    # Assert
+    assert parcial is not completa
+    assert parcial.coluna('name').tolist() == [completa[0]['name']]
+    assert presenter.ler_csv_fifa(
+        str(MOCK_DATA_CSV), columns=('name',),
+        club=completa[0]['club']) is parcial
+    assert DATASET_CACHE.stats().entries == 2
+
+
+def test_features_presenter_ler_csv_fifa_async_matches_sync():
+    # Arrange
+    presenter = FeaturesPresenter()
+
+    # Act
+    future = presenter.ler_csv_fifa_async(str(MOCK_DATA_CSV))
+
+    # Assert
+    assert future.result(timeout=30) is presenter.ler_csv_fifa(
+        str(MOCK_DATA_CSV))
+
+
+def test_features_presenter_async_errors_raise_on_result():
+    # Arrange
+    presenter = FeaturesPresenter()
+
+    # Act
+    leitura = presenter.ler_csv_fifa_async("invalid/path/file.csv")
+    salvamento = presenter.salvar_csv_fifa_async(
+        csv_name='fifa_mock_invalid',
+        bytes_csv=get_mock_invalid_bytes_fifa())
+
+    # Assert
+    with pytest.raises(FileNotFoundError):
+        leitura.result(timeout=30)
+    with pytest.raises(SaveCsvFifaError):
+        salvamento.result(timeout=30)
+
+
+def test_features_presenter_salvar_csv_fifa_async():
+    # Arrange
+    presenter = FeaturesPresenter()
+
+    # Act
+    result = presenter.salvar_csv_fifa_async(
+        csv_name='fifa_mock',
+        bytes_csv=get_mock_bytes_fifa()).result(timeout=30)
+
+    # Assert
+    assert result.path == PASTA_DATASETS / 'fifa_mock.csv'
+    assert result.changed
+
+
+def test_features_presenter_prefetch_fills_cache():
+    # Arrange
+    presenter = FeaturesPresenter()
+
+    # Act
+    futures = presenter.prefetch_csv_fifa([MOCK_DATA_CSV, MOCK_DATA_CSV])
+    prefetched = futures[0].result(timeout=30)
+
+    # Assert
+    assert len(futures) == 1
+    assert presenter.ler_csv_fifa(str(MOCK_DATA_CSV)) is prefetched
+    assert presenter.prefetch_csv_fifa([MOCK_DATA_CSV]) == []
+    stats = DATASET_CACHE.stats()
+    assert (stats.hits, stats.misses) == (1, 1)
+
+
+def test_features_presenter_ler_temporadas(tmp_path):
+    # Arrange
+    presenter = FeaturesPresenter()
+    fifa22 = tmp_path / 'FIFA22.csv'
+    fifa22.write_bytes(MOCK_DATA_CSV.read_bytes())
+    fifa23 = tmp_path / 'FIFA23.csv'
+    fifa23.write_bytes(get_mock_bytes_fifa())
+
+    # Act
+    table = presenter.ler_temporadas([str(fifa23), str(fifa22)])
+
+    # Assert
+    temporada23 = presenter.ler_csv_fifa(str(fifa23))
+    temporada22 = presenter.ler_csv_fifa(str(fifa22))
+    assert len(table) == len(temporada23) + len(temporada22)
+    assert table.coluna('season').tolist() == (
+        ['FIFA23'] * len(temporada23) + ['FIFA22'] * len(temporada22))
+    assert presenter.ler_temporadas([str(fifa23), str(fifa22)]) is table
+    assert DATASET_CACHE.stats().entries == 2
+
+
+def test_features_presenter_ler_temporadas_file_not_found(tmp_path):
+    # Arrange
+    presenter = FeaturesPresenter()
+
+    # Act/Assert
+    with pytest.raises(FileNotFoundError):
+        presenter.ler_temporadas([str(MOCK_DATA_CSV), str(tmp_path / 'x.csv')])
+
+
+@pytest.fixture
+def executor_ocupado(monkeypatch):
+    """Executor de uma thread, ocupada até que o evento seja liberado."""
+    executor = ThreadPoolExecutor(max_workers=1)
+    liberar = threading.Event()
+    executor.submit(liberar.wait)
+    monkeypatch.setattr(features_presenter, '_EXECUTOR', executor)
+    yield liberar
+    liberar.set()
+    executor.shutdown(wait=True)
+
+
+def test_features_presenter_ler_csv_fifa_sem_thread_por_chamada():
+    # Arrange
+    presenter = FeaturesPresenter()
+
+    # Act
+    with patch.object(
+            LerCsvFifaUseCase, 'runNewThread', side_effect=AssertionError):
+        table = presenter.ler_csv_fifa(str(MOCK_DATA_CSV))
+
+    # Assert
+    assert len(table) == 2
+
+
+def test_features_presenter_pedido_novo_da_sessao_cancela_o_anterior(
+        tmp_path, executor_ocupado):
+    # Arrange
+    presenter = FeaturesPresenter()
+    fifa22 = tmp_path / 'FIFA22.csv'
+    fifa22.write_bytes(MOCK_DATA_CSV.read_bytes())
+
+    # Act
+    antiga = presenter.ler_csv_fifa_async(str(fifa22), sessao='a')
+    outra_sessao = presenter.ler_csv_fifa_async(str(fifa22), sessao='b')
+    nova = presenter.ler_csv_fifa_async(str(MOCK_DATA_CSV), sessao='a')
+    executor_ocupado.set()
+
+    # Assert
+    with pytest.raises(CancelledError):
+        antiga.result(timeout=30)
+    assert len(outra_sessao.result(timeout=30)) == 2
+    assert len(nova.result(timeout=30)) == 2
+    assert features_presenter._CARGAS_POR_SESSAO == {}
+
+
+def test_features_presenter_ler_temporadas_timeout_cancela_leituras(
+        tmp_path, executor_ocupado):
+    # Arrange
+    presenter = FeaturesPresenter()
+    fifa22 = tmp_path / 'FIFA22.csv'
+    fifa22.write_bytes(MOCK_DATA_CSV.read_bytes())
+
+    # Act
+    with pytest.raises(TimeoutError):
+        presenter.ler_temporadas(
+            [str(MOCK_DATA_CSV), str(fifa22)], sessao='a', timeout=0.05)
+    executor_ocupado.set()
+    features_presenter._EXECUTOR.submit(lambda: None).result(timeout=30)
+
+    # Assert
+    assert DATASET_CACHE.stats().entries == 0
+    assert features_presenter._CARGAS_POR_SESSAO == {}
+
+
+def test_features_presenter_prefetch_nao_ocupa_executor_das_leituras(
+        executor_ocupado):
+    # Arrange
+    presenter = FeaturesPresenter()
+
+    # Act
+    futures = presenter.prefetch_csv_fifa([MOCK_DATA_CSV])
+
+    # Assert
+    assert len(futures[0].result(timeout=30)) == 2
+
+
+def test_features_presenter_prefetch_ignorado_com_leitura_pendente(
+        tmp_path, executor_ocupado):
+    # Arrange
+    presenter = FeaturesPresenter()
+    fifa22 = tmp_path / 'FIFA22.csv'
+    fifa22.write_bytes(MOCK_DATA_CSV.read_bytes())
+    pendente = presenter.ler_csv_fifa_async(str(MOCK_DATA_CSV), sessao='a')
+
+    # Act
+    futures = presenter.prefetch_csv_fifa([fifa22])
+    executor_ocupado.set()
+
+    # Assert
+    assert futures == []
+    assert len(pendente.result(timeout=30)) == 2
+    assert not DATASET_CACHE.contains(fifa22, variante_hoje())
+
+
+def test_features_presenter_ler_temporadas_async_cancelada_pela_sessao(
+        tmp_path, executor_ocupado):
+    # Arrange
+    presenter = FeaturesPresenter()
+    fifa22 = tmp_path / 'FIFA22.csv'
+    fifa22.write_bytes(MOCK_DATA_CSV.read_bytes())
+
+    # Act
+    antiga = presenter.ler_temporadas_async(
+        [str(MOCK_DATA_CSV), str(fifa22)], sessao='a')
+    nova = presenter.ler_csv_fifa_async(str(fifa22), sessao='a')
+    executor_ocupado.set()
+
+    # Assert
+    with pytest.raises(CancelledError):
+        antiga.result(timeout=30)
+    assert len(nova.result(timeout=30)) == 2
+    assert not DATASET_CACHE.contains(MOCK_DATA_CSV, variante_hoje())
+
+
+def test_features_presenter_aguardar_segundo_plano_apos_salvar():
+    # Arrange
+    presenter = FeaturesPresenter()
+    path = presenter.salvar_csv_fifa(
+        csv_name='fifa_mock',
+        bytes_csv=get_mock_bytes_fifa()).path
+
+    # Act
+    presenter.aguardar_segundo_plano(timeout=30)
+
+    # Assert
+    assert not features_presenter._LEITURAS_EM_ANDAMENTO
+    assert not features_presenter._AGREGADOS_EM_ANDAMENTO
+    table = presenter.ler_csv_fifa(str(path))
+    assert set(table._agregados) == set(features_presenter.GRUPOS_RANKING)
+
+
+def test_features_presenter_cache_entry_follows_reference_date():
+    # Arrange
+    presenter = FeaturesPresenter()
+    ontem = date(2024, 12, 31)
+    hoje = date(2025, 1, 1)
+    with patch.object(features_presenter, 'date') as data:
+        data.today.return_value = ontem
+        antes = presenter.ler_csv_fifa(str(MOCK_DATA_CSV))
+
+        # Act
+        data.today.return_value = hoje
+        depois = presenter.ler_csv_fifa(str(MOCK_DATA_CSV))
+
+    # Assert
+    assert depois is not antes
+    assert DATASET_CACHE.contains(
+        MOCK_DATA_CSV, features_presenter._variante(None, None, ontem))
+    assert DATASET_CACHE.contains(
+        MOCK_DATA_CSV, features_presenter._variante(None, None, hoje))
+    assert [player['id'] for player in antes] != [
+        player['id'] for player in depois]
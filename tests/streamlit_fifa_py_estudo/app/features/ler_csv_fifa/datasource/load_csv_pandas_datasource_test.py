@@ -1,21 +1,27 @@
 
 
+import shutil
+from pathlib import Path
 from unittest.mock import patch
 
 import pandas as pd
 import pytest
 
+import streamlit_fifa_py_estudo.app.features.ler_csv_fifa.datasource.load_csv_pandas_datasource as datasource_module
 from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.datasource.load_csv_pandas_datasource import (
     LoadCsvPandasDatasource, )
 from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError
 from streamlit_fifa_py_estudo.app.utils.parameters import LoadCsvParameters
+from streamlit_fifa_py_estudo.app.utils.sidecar import caminho_sidecar, escrever_sidecar
+
+MOCK_DATA_CSV = Path(__file__).parents[3] / 'datasets' / 'mock_data.csv'
 
 
 def test_load_csv_pandas_datasource_with_mock_data():
     # Arrange
     error = LoadCsvFifaError()
     parameters = LoadCsvParameters(
-        file_path='C:/PROJETOS/PYTHON/APPS/streamlit-fifa-py-estudo/tests/streamlit_fifa_py_estudo/app/datasets/mock_data.csv',
+        file_path=str(MOCK_DATA_CSV),
         error=error)
 
     # Act
@@ -24,11 +30,14 @@ def test_load_csv_pandas_datasource_with_mock_data():
 
     # Assert
     assert len(result) == 3
-    assert result[0].name == 'L. Goretzka'
-    assert result[0].age == 27
-    assert result[0].overall == 87
-    assert result[1].name == 'Bruno Fernandes'
-    assert result[2].name == 'M. Acuña'
+    assert result[0]['name'] == 'L. Goretzka'
+    assert result[0]['age'] == 27
+    assert result[0]['overall'] == 87
+    assert result[0]['height_m'] == 1.89
+    assert result[0]['weight_kg'] == 81.91
+    assert result[0]['joined'] == '2018-07-01'
+    assert result[1]['name'] == 'Bruno Fernandes'
+    assert result[2]['name'] == 'M. Acuña'
 
 
 def test_load_csv_pandas_datasource_with_empty_data():
@@ -56,3 +65,203 @@ def test_load_csv_pandas_datasource_file_not_found():
     with pytest.raises(FileNotFoundError):
         datasource = LoadCsvPandasDatasource()
         datasource(parameters)
+
+
+def test_load_csv_pandas_datasource_prefers_fresh_sidecar(tmp_path):
+    # Arrange
+    csv = tmp_path / 'fifa.csv'
+    shutil.copy(MOCK_DATA_CSV, csv)
+    parameters = LoadCsvParameters(
+        file_path=str(csv), error=LoadCsvFifaError())
+    datasource = LoadCsvPandasDatasource()
+    escrever_sidecar(datasource(parameters), csv)
+
+    # Act
+    with patch('pandas.read_csv', side_effect=AssertionError):
+        result = datasource(parameters)
+
+    # Assert
+    assert len(result) == 3
+    assert result[2]['name'] == 'M. Acuña'
+
+
+def test_load_csv_pandas_datasource_ignores_stale_sidecar(tmp_path):
+    # Arrange
+    csv = tmp_path / 'fifa.csv'
+    shutil.copy(MOCK_DATA_CSV, csv)
+    parameters = LoadCsvParameters(
+        file_path=str(csv), error=LoadCsvFifaError())
+    datasource = LoadCsvPandasDatasource()
+    escrever_sidecar(datasource(parameters), csv)
+    df = pd.read_csv(csv, index_col=0)
+    df.loc[0, 'Name'] = 'Leon Goretzka'
+    df.to_csv(csv)
+
+    # Act
+    result = datasource(parameters)
+
+    # Assert
+    assert result[0]['name'] == 'Leon Goretzka'
+
+
+@pytest.mark.parametrize('memory_map', [False, True])
+def test_load_csv_pandas_datasource_ignores_corrupt_sidecar(
+        tmp_path, memory_map):
+    # Arrange
+    csv = tmp_path / 'fifa.csv'
+    shutil.copy(MOCK_DATA_CSV, csv)
+    parameters = LoadCsvParameters(
+        file_path=str(csv), error=LoadCsvFifaError())
+    esperado = LoadCsvPandasDatasource()(parameters)
+    caminho_sidecar(csv).write_bytes(b'ARROW1\x00\x00lixo')
+
+    # Act
+    result = LoadCsvPandasDatasource(memory_map=memory_map)(parameters)
+
+    # Assert
+    assert result.to_dicts() == esperado.to_dicts()
+
+
+def test_load_csv_pandas_datasource_memory_map(tmp_path):
+    # Arrange
+    csv = tmp_path / 'fifa.csv'
+    shutil.copy(MOCK_DATA_CSV, csv)
+    parameters = LoadCsvParameters(
+        file_path=str(csv), error=LoadCsvFifaError())
+    esperado = LoadCsvPandasDatasource()(parameters)
+    escrever_sidecar(esperado, csv)
+
+    # Act
+    with patch('pandas.read_csv', side_effect=AssertionError):
+        result = LoadCsvPandasDatasource(memory_map=True)(parameters)
+
+    # Assert
+    assert result.to_dicts() == esperado.to_dicts()
+
+
+def test_load_csv_pandas_datasource_memory_map_without_sidecar():
+    # Arrange
+    parameters = LoadCsvParameters(
+        file_path=str(MOCK_DATA_CSV), error=LoadCsvFifaError())
+
+    # Act
+    result = LoadCsvPandasDatasource(memory_map=True)(parameters)
+
+    # Assert
+    assert len(result) == 3
+
+
+def test_load_csv_pandas_datasource_projection_reads_only_needed_columns():
+    # Arrange
+    parameters = LoadCsvParameters(
+        file_path=str(MOCK_DATA_CSV),
+        error=LoadCsvFifaError(),
+        columns=('name', 'club'))
+
+    # Act
+    with patch('pandas.read_csv', wraps=pd.read_csv) as read_csv:
+        result = LoadCsvPandasDatasource()(parameters)
+
+    # Assert
+    assert read_csv.call_args.kwargs['usecols'] == [
+        'Name', 'Overall', 'Club', 'Contract Valid Until']
+    assert result.colunas == (
+        'name', 'overall', 'club', 'contract_valid_until')
+    assert result[1] == {
+        'name': 'Bruno Fernandes',
+        'overall': 86,
+        'club': 'Manchester United',
+        'contract_valid_until': 2026.0,
+    }
+
+
+def test_load_csv_pandas_datasource_club_predicate_by_chunks(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(datasource_module, 'LINHAS_POR_CHUNK_LEITURA', 1)
+    parameters = LoadCsvParameters(
+        file_path=str(MOCK_DATA_CSV),
+        error=LoadCsvFifaError(),
+        club='Manchester United')
+    completa = LoadCsvPandasDatasource()(LoadCsvParameters(
+        file_path=str(MOCK_DATA_CSV), error=LoadCsvFifaError()))
+
+    # Act
+    result = LoadCsvPandasDatasource()(parameters)
+
+    # Assert
+    assert result.to_dicts() == [completa[1]]
+
+
+def test_load_csv_pandas_datasource_predicates_without_matches():
+    # Arrange
+    parameters = LoadCsvParameters(
+        file_path=str(MOCK_DATA_CSV),
+        error=LoadCsvFifaError(),
+        columns=('name',),
+        club='Sevilla FC',
+        min_overall=86)
+
+    # Act
+    result = LoadCsvPandasDatasource()(parameters)
+
+    # Assert
+    assert len(result) == 0
+    assert 'name' in result.colunas
+
+
+@pytest.mark.parametrize('memory_map', [False, True])
+def test_load_csv_pandas_datasource_pushdown_on_sidecar(tmp_path, memory_map):
+    # Arrange
+    csv = tmp_path / 'fifa.csv'
+    shutil.copy(MOCK_DATA_CSV, csv)
+    completa = LoadCsvPandasDatasource()(LoadCsvParameters(
+        file_path=str(csv), error=LoadCsvFifaError()))
+    escrever_sidecar(completa, csv)
+    parameters = LoadCsvParameters(
+        file_path=str(csv),
+        error=LoadCsvFifaError(),
+        columns=('id', 'name'),
+        min_overall=86)
+
+    # Act
+    with patch('pandas.read_csv', side_effect=AssertionError):
+        result = LoadCsvPandasDatasource(memory_map)(parameters)
+
+    # Assert
+    assert result.colunas == (
+        'id', 'name', 'overall', 'contract_valid_until')
+    assert result.coluna('name').tolist() == [
+        'L. Goretzka', 'Bruno Fernandes']
+
+
+@pytest.mark.parametrize('extras', [
+    {},
+    {'columns': ('name', 'club', 'joined')},
+    {'club': 'Sevilla FC', 'min_overall': 80},
+])
+def test_load_csv_pandas_datasource_pyarrow_matches_default(tmp_path, extras):
+    # Arrange
+    df = pd.read_csv(MOCK_DATA_CSV, index_col=0)
+    df.loc[1, ['Club', 'Joined']] = None
+    csv = tmp_path / 'fifa.csv'
+    df.to_csv(csv)
+
+    def ler(engine: str):
+        return LoadCsvPandasDatasource()(LoadCsvParameters(
+            file_path=str(csv),
+            error=LoadCsvFifaError(),
+            engine=engine,
+            **extras))
+
+    # Act
+    padrao = ler('c')
+    with patch('pandas.read_csv', wraps=pd.read_csv) as read_csv:
+        pyarrow = ler('pyarrow')
+
+    # Assert
+    assert read_csv.call_args.kwargs['engine'] == 'pyarrow'
+    assert read_csv.call_args.kwargs['dtype']['Overall'] == 'int64'
+    assert pyarrow.colunas == padrao.colunas
+    assert pyarrow.to_dicts() == padrao.to_dicts()
+    for nome in padrao.colunas:
+        assert pyarrow.coluna(nome).dtype == padrao.coluna(nome).dtype
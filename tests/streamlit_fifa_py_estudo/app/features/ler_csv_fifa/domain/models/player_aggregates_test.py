@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_aggregates import (
+    METRICAS_RANKING,
+    Agregados,
+)
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import PlayerTable
+
+
+def criar_table(jogadores):
+    colunas = ('club', 'value', 'wage', 'overall', 'age')
+    return PlayerTable({
+        nome: np.array(valores, dtype=object if nome == 'club' else None)
+        for nome, valores in zip(colunas, zip(*jogadores))
+    })
+
+
+@pytest.fixture
+def fifa23():
+    return criar_table([
+        ('Real Madrid CF', 100.0, 10.0, 90, 30),
+        ('Arsenal', 50.0, 4.0, 80, 22),
+        ('Real Madrid CF', 60.0, 6.0, 84, 24),
+        (np.nan, 1.0, 1.0, 60, 18),
+    ])
+
+
+@pytest.fixture
+def fifa22():
+    return criar_table([
+        ('Arsenal', 200.0, 8.0, 86, 26),
+    ])
+
+
+def test_agregados_ranking_sums_and_averages(fifa23):
+    # Act
+    ranking = fifa23.agregados('club').ranking('squad_value')
+
+    # Assert
+    assert list(ranking.columns) == ['club', *METRICAS_RANKING]
+    assert ranking.to_dict('records') == [
+        {'club': 'Real Madrid CF', 'players': 2, 'squad_value': 160.0,
+         'wage_bill': 16.0, 'avg_overall': 87.0, 'avg_age': 27.0},
+        {'club': 'Arsenal', 'players': 1, 'squad_value': 50.0,
+         'wage_bill': 4.0, 'avg_overall': 80.0, 'avg_age': 22.0},
+    ]
+
+
+def test_agregados_ranking_ascending_and_unknown_metric(fifa23):
+    # Arrange
+    agregados = fifa23.agregados('club')
+
+    # Act
+    ranking = agregados.ranking('avg_age', descending=False)
+
+    # Assert
+    assert ranking['club'].tolist() == ['Arsenal', 'Real Madrid CF']
+    with pytest.raises(KeyError):
+        agregados.ranking('value')
+
+
+def test_player_table_agregados_of_union_reuses_parts(
+        fifa23, fifa22, monkeypatch):
+    # Arrange
+    uniao = PlayerTable.concatenar({'FIFA23': fifa23, 'FIFA22': fifa22})
+    esperado = Agregados.from_table(uniao.take(np.arange(len(uniao))), 'club')
+    fifa23.agregados('club')
+    fifa22.agregados('club')
+    monkeypatch.setattr(Agregados, 'from_table', None)
+
+    # Act
+    agregados = uniao.agregados('club')
+
+    # Assert
+    assert agregados.grupos.tolist() == esperado.grupos.tolist()
+    assert agregados.origens.tolist() == esperado.origens.tolist()
+    assert agregados.jogadores.tolist() == esperado.jogadores.tolist()
+    pd.testing.assert_frame_equal(
+        agregados.ranking(), esperado.ranking())
+
+
+def test_agregados_ranking_filters_origens(fifa23, fifa22):
+    # Arrange
+    agregados = PlayerTable.concatenar(
+        {'FIFA23': fifa23, 'FIFA22': fifa22}).agregados('club')
+
+    # Act
+    todas = agregados.ranking('squad_value')
+    fifa22_apenas = agregados.ranking('squad_value', origens=['FIFA22'])
+
+    # Assert
+    assert todas[['club', 'players', 'squad_value']].values.tolist() == [
+        ['Arsenal', 2, 250.0], ['Real Madrid CF', 2, 160.0]]
+    assert fifa22_apenas['club'].tolist() == ['Arsenal']
+
+
+def test_player_table_agregados_is_cached(fifa23):
+    # Act
+    primeiro = fifa23.agregados('club')
+    segundo = fifa23.agregados('club')
+
+    # Assert
+    assert primeiro is segundo
@@ -0,0 +1,128 @@
+from dataclasses import replace
+from datetime import date
+
+import numpy as np
+import pytest
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.fifa_player import FifaPlayer
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import PlayerTable
+
+BASE_PLAYER = FifaPlayer(
+    id=0,
+    name="",
+    age=27,
+    photo="https://cdn.sofifa.net/players/212/198/23_60.png",
+    nationality="Portugal",
+    flag="https://cdn.sofifa.net/flags/pt.png",
+    overall=80,
+    club="",
+    club_logo="https://cdn.sofifa.net/teams/11/30.png",
+    value=1000000.0,
+    wage=10000.0,
+    position="LCM",
+    joined=date(2020, 1, 30),
+    contract_valid_until=2026.0,
+    height_m=1.79,
+    weight_kg=68.92,
+    release_clause=2000000.0,
+)
+
+
+@pytest.fixture
+def table():
+    jogadores = [
+        (1, 'Rodri', 'Manchester City'),
+        (2, 'Rodri', 'Real Betis'),
+        (3, 'Foden', 'Manchester City'),
+        (4, 'Isco', 'Real Betis'),
+        (5, 'Haaland', 'Manchester City'),
+        (6, 'Sem Clube', np.nan),
+    ]
+    return PlayerTable.from_players([
+        replace(BASE_PLAYER, id=player_id, name=name, club=club)
+        for player_id, name, club in jogadores
+    ])
+
+
+def test_player_index_resolves_same_name_by_club(table):
+    # Arrange
+    index = table.indices
+
+    # Act
+    rodri_city = index.jogador(index.id_por_nome('Manchester City', 'Rodri'))
+    rodri_betis = index.jogador(index.id_por_nome('Real Betis', 'Rodri'))
+
+    # Assert
+    assert (rodri_city['id'], rodri_city['club']) == (1, 'Manchester City')
+    assert (rodri_betis['id'], rodri_betis['club']) == (2, 'Real Betis')
+
+
+def test_player_index_elenco_keeps_table_order(table):
+    # Arrange
+    index = table.indices
+
+    # Act
+    elenco = index.elenco('Manchester City')
+
+    # Assert
+    assert index.clubes == ['Manchester City', 'Real Betis']
+    assert elenco.coluna('id').tolist() == [1, 3, 5]
+    assert index.elenco('Real Betis').coluna('name').tolist() == [
+        'Rodri', 'Isco']
+    assert len(index.elenco('Inexistente')) == 0
+
+
+def test_player_index_elenco_shares_memory(table):
+    # Act
+    elenco = table.indices.elenco('Real Betis')
+
+    # Assert
+    assert np.shares_memory(
+        elenco.coluna('overall'),
+        table.indices.elenco('Real Betis').coluna('overall'))
+    assert not elenco.coluna('overall').flags.writeable
+
+
+def test_player_index_lookup_by_id(table):
+    # Arrange
+    index = table.indices
+
+    # Act/Assert
+    assert index.posicao(6) == 5
+    assert index.posicao(99) is None
+    assert index.jogador(6)['name'] == 'Sem Clube'
+    with pytest.raises(KeyError):
+        index.jogador(99)
+
+
+def test_player_index_built_once(table):
+    # Act/Assert
+    assert table.indices is table.indices
+    assert table.take(np.array([0])).indices is not table.indices
+
+
+def test_player_index_resolves_player_in_two_seasons():
+    # Arrange
+    fifa23 = PlayerTable.from_players([
+        replace(BASE_PLAYER, id=158023, name='L. Messi', club='Inter Miami'),
+        replace(BASE_PLAYER, id=3, name='Foden', club='Manchester City'),
+    ])
+    fifa22 = PlayerTable.from_players([
+        replace(BASE_PLAYER, id=158023, name='L. Messi', club='Paris SG'),
+    ])
+    table = PlayerTable.concatenar({'FIFA23': fifa23, 'FIFA22': fifa22})
+    index = table.indices
+
+    # Act
+    posicao_psg = index.posicao_por_nome('Paris SG', 'L. Messi')
+    elenco_psg = index.posicoes_elenco('Paris SG')
+
+    # Assert
+    assert table.linha(posicao_psg)['club'] == 'Paris SG'
+    assert elenco_psg.tolist() == [posicao_psg]
+    assert index.jogador(158023)['season'] == 'FIFA23'
+    assert index.jogador(158023, season='FIFA22')['club'] == 'Paris SG'
+    assert index.posicao(158023, season='FIFA23') == 0
+    assert index.id_por_nome('Paris SG', 'L. Messi', season='FIFA22') == 158023
+    with pytest.raises(KeyError):
+        index.posicao_por_nome('Paris SG', 'L. Messi', season='FIFA23')
@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_search import (
+    normalizar,
+    trigramas,
+)
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import PlayerTable
+
+
+@pytest.fixture
+def table():
+    jogadores = [
+        ('K. Mbappé', 'Paris Saint-Germain', 'France', 'FIFA23'),
+        ('L. Messi', 'Paris Saint-Germain', 'Argentina', 'FIFA23'),
+        ('Vinícius Jr.', 'Real Madrid CF', 'Brazil', 'FIFA23'),
+        ('M. Ødegaard', 'Arsenal', 'Norway', 'FIFA23'),
+        ('K. Mbappé', 'Paris Saint-Germain', 'France', 'FIFA22'),
+        ('L. Messina', np.nan, 'Italy', 'FIFA22'),
+    ]
+    return PlayerTable({
+        nome: np.array(valores, dtype=object)
+        for nome, valores in zip(
+            ('name', 'club', 'nationality', 'season'), zip(*jogadores))
+    })
+
+
+def test_normalizar_removes_accents_case_and_punctuation():
+    # Act
+    normalizados = [normalizar(texto) for texto in (
+        'K. Mbappé', 'VINÍCIUS Jr.', 'M. Ødegaard', 'Saint-Germain')]
+
+    # Assert
+    assert normalizados == [
+        'k mbappe', 'vinicius jr', 'm ødegaard', 'saint germain']
+
+
+def test_trigramas_pads_each_word():
+    # Act
+    resultado = trigramas('l messi')
+
+    # Assert
+    assert resultado == {
+        '  l', ' l ', '  m', ' me', 'mes', 'ess', 'ssi', 'si '}
+
+
+def test_player_table_buscar_ignores_accents_and_typos(table):
+    # Act
+    mbappe = table.buscar('mbape')
+    vinicius = table.buscar('VINICIUS')
+
+    # Assert
+    assert mbappe.tolist() == [0, 4]
+    assert vinicius.tolist() == [2]
+
+
+def test_player_table_buscar_ranks_closest_name_first(table):
+    # Act
+    posicoes = table.buscar('messi')
+
+    # Assert
+    assert posicoes.tolist() == [1, 5]
+
+
+def test_player_table_buscar_respects_limite_and_minimo(table):
+    # Act
+    limitada = table.buscar('messi', limite=1)
+    exigente = table.buscar('mesi', minimo=0.9)
+    sem_texto = table.buscar(' .- ')
+
+    # Assert
+    assert limitada.tolist() == [1]
+    assert exigente.tolist() == []
+    assert sem_texto.tolist() == []
+
+
+def test_player_table_buscar_other_columns(table):
+    # Act
+    posicoes = table.buscar('norway', campos=('name', 'club', 'nationality'))
+    paris = table.buscar('paris', campos=('name', 'club'))
+
+    # Assert
+    assert posicoes.tolist() == [3]
+    assert paris.tolist() == [0, 1, 4]
+
+
+def test_player_table_indice_texto_is_cached(table):
+    # Act
+    primeiro = table.indice_texto('name')
+    segundo = table.indice_texto('name')
+
+    # Assert
+    assert primeiro is segundo
+    with pytest.raises(KeyError):
+        table.indice_texto('inexistente')
@@ -0,0 +1,357 @@
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import FrozenInstanceError
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.fifa_player import FifaPlayer
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_index import PlayerIndex
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    COLUNAS_PLAYER_TABLE,
+    PlayerTable,
+)
+
+MOCK_DATA_CSV = Path(__file__).parents[4] / 'datasets' / 'mock_data.csv'
+
+
+@pytest.fixture
+def mock_fifa_players():
+    return [
+        FifaPlayer(
+            id=212198,
+            name="Bruno Fernandes",
+            age=27,
+            photo="https://cdn.sofifa.net/players/212/198/23_60.png",
+            nationality="Portugal",
+            flag="https://cdn.sofifa.net/flags/pt.png",
+            overall=86,
+            club="Manchester United",
+            club_logo="https://cdn.sofifa.net/teams/11/30.png",
+            value=78500000.0,
+            wage=190000.0,
+            position="LCM",
+            joined=date(2020, 1, 30),
+            contract_valid_until=2026.0,
+            height_m=1.79,
+            weight_kg=68.92,
+            release_clause=155000000.0,
+        ),
+        FifaPlayer(
+            id=209658,
+            name="L. Goretzka",
+            age=27,
+            photo="https://cdn.sofifa.net/players/209/658/23_60.png",
+            nationality="Germany",
+            flag="https://cdn.sofifa.net/flags/de.png",
+            overall=87,
+            club="FC Bayern München",
+            club_logo="https://cdn.sofifa.net/teams/21/30.png",
+            value=91000000.0,
+            wage=115000.0,
+            position="SUB",
+            joined=None,
+            contract_valid_until=2026.0,
+            height_m=1.89,
+            weight_kg=81.91,
+            release_clause=157000000.0,
+        ),
+    ]
+
+
+def test_player_table_from_players_rows_match_to_dict(mock_fifa_players):
+    # Act
+    table = PlayerTable.from_players(mock_fifa_players)
+
+    # Assert
+    assert len(table) == 2
+    assert table.colunas == COLUNAS_PLAYER_TABLE
+    assert table.to_dicts() == [
+        player.to_dict() for player in mock_fifa_players]
+    assert type(table[0]['id']) is int
+    assert table[-1]['joined'] is None
+
+
+def test_player_table_columns_are_read_only(mock_fifa_players):
+    # Arrange
+    table = PlayerTable.from_players(mock_fifa_players)
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        table.coluna('overall')[0] = 99
+    with pytest.raises(ValueError):
+        table.frame.loc[0, 'overall'] = 99
+    assert table[0]['overall'] == 86
+
+
+def test_player_table_frame_is_built_once_and_shares_columns(
+        mock_fifa_players):
+    # Arrange
+    table = PlayerTable.from_players(mock_fifa_players)
+
+    # Act
+    frame = table.frame
+
+    # Assert
+    assert table.frame is frame
+    assert list(frame.columns) == list(COLUNAS_PLAYER_TABLE)
+    assert np.shares_memory(
+        frame['overall'].to_numpy(), table.coluna('overall'))
+    assert table.nbytes > 0
+
+
+def test_player_table_nbytes_counts_derived_structures(mock_fifa_players):
+    # Arrange
+    table = PlayerTable.from_players(mock_fifa_players)
+    colunas = table.nbytes
+
+    # Act
+    table.indices
+    com_indices = table.nbytes
+    table.ordem('overall', descending=True)
+    table.indice_texto('name')
+    table.agregados('club')
+
+    # Assert
+    assert com_indices > colunas
+    assert table.nbytes > com_indices
+
+
+def test_player_table_builds_index_once_under_concurrent_access(
+        mock_fifa_players):
+    # Arrange
+    table = PlayerTable.from_players(mock_fifa_players)
+    construidos = []
+
+    def construir_devagar(tabela):
+        construidos.append(tabela)
+        time.sleep(0.05)
+        return PlayerIndex(tabela)
+
+    # Act
+    with patch(
+            'streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.'
+            'models.player_table.PlayerIndex',
+            side_effect=construir_devagar), \
+            ThreadPoolExecutor(max_workers=8) as executor:
+        indices = list(executor.map(lambda _: table.indices, range(8)))
+
+    # Assert
+    assert len(construidos) == 1
+    assert all(indice is indices[0] for indice in indices)
+
+
+def test_player_table_empty():
+    # Act
+    table = PlayerTable.from_players([])
+
+    # Assert
+    assert len(table) == 0
+    assert table.to_dicts() == []
+    assert table.frame.empty
+    assert str(table.coluna('id').dtype) == 'int64'
+
+
+def test_player_table_rejects_columns_with_different_sizes():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        PlayerTable({'id': np.arange(2), 'name': np.array(['a'], dtype=object)})
+
+
+def per_row_dicts(df: pd.DataFrame) -> list:
+    return [
+        FifaPlayer.from_csv_row(row).to_dict()
+        for row in df.to_dict('records')
+    ]
+
+
+def test_player_table_from_csv_frame_matches_from_csv_row_on_mock_data():
+    # Arrange
+    df = pd.read_csv(MOCK_DATA_CSV, index_col=0)
+
+    # Act
+    table = PlayerTable.from_csv_frame(df)
+
+    # Assert
+    assert table.colunas == COLUNAS_PLAYER_TABLE
+    assert table.to_dicts() == per_row_dicts(df)
+
+
+def test_player_table_from_csv_frame_matches_from_csv_row_on_edge_cases():
+    # Arrange
+    df = pd.read_csv(MOCK_DATA_CSV, index_col=0)
+    df = pd.concat([df] * 4, ignore_index=True)
+    df['Value(£)'] = ['1,500,000', '0', '2,000.5', ''] * 3
+    df['Wage(£)'] = 0.0
+    df['Height(cm.)'] = [0.0, 172.5, 189.0, 180.25] * 3
+    # Pesos cujo produto por 0.453 cai perto da metade da segunda casa
+    df['Weight(lbs.)'] = [0.0, 152.145, 180.81, 165.5] * 3
+    df['Age'] = df['Age'].astype(float)
+
+    # Act
+    table = PlayerTable.from_csv_frame(df)
+
+    # Assert
+    assert table.to_dicts() == per_row_dicts(df)
+
+
+def test_player_table_from_csv_frame_rejects_blank_age(tmp_path):
+    # Arrange
+    df = pd.read_csv(MOCK_DATA_CSV, index_col=0)
+    df['Age'] = df['Age'].astype(object)
+    df.loc[df.index[0], 'Age'] = ''
+    csv = tmp_path / 'fifa_sem_idade.csv'
+    df.to_csv(csv)
+    df = pd.read_csv(csv, index_col=0)
+
+    # Act / Assert
+    with pytest.raises(ValueError, match='NaN'):
+        FifaPlayer.from_csv_row(df.iloc[0])
+    with pytest.raises(ValueError, match='NaN'):
+        PlayerTable.from_csv_frame(df)
+
+
+def test_player_table_from_csv_frame_rejects_fractional_overall():
+    # Arrange
+    df = pd.read_csv(MOCK_DATA_CSV, index_col=0)
+    df['Overall'] = df['Overall'] + 0.5
+
+    # Act / Assert
+    with pytest.raises(ValueError):
+        PlayerTable.from_csv_frame(df)
+
+
+def test_player_table_from_csv_frame_empty():
+    # Act
+    table = PlayerTable.from_csv_frame(pd.DataFrame())
+
+    # Assert
+    assert len(table) == 0
+    assert table.colunas == COLUNAS_PLAYER_TABLE
+
+
+def test_player_table_take(mock_fifa_players):
+    # Arrange
+    table = PlayerTable.from_players(mock_fifa_players)
+
+    # Act
+    invertida = table.take(np.array([1, 0]))
+
+    # Assert
+    assert [row['name'] for row in invertida] == [
+        "L. Goretzka", "Bruno Fernandes"]
+    assert not invertida.coluna('name').flags.writeable
+
+
+def test_fifa_player_is_frozen_and_slotted(mock_fifa_players):
+    # Arrange
+    player = mock_fifa_players[0]
+
+    # Act/Assert
+    assert not hasattr(player, '__dict__')
+    with pytest.raises(FrozenInstanceError):
+        player.overall = 99
+
+
+def test_player_table_linha_is_lazy_view(mock_fifa_players):
+    # Arrange
+    table = PlayerTable.from_players(mock_fifa_players)
+
+    # Act
+    row = table.linha(-1)
+
+    # Assert
+    assert row == mock_fifa_players[1].to_dict()
+    assert row.name == 'L. Goretzka'
+    assert row['joined'] is None
+    assert isinstance(row['overall'], int)
+    assert row.to_player() == mock_fifa_players[1]
+    assert table.linha(0).to_player() == mock_fifa_players[0]
+    with pytest.raises(KeyError):
+        row['inexistente']
+    with pytest.raises(AttributeError):
+        row.inexistente
+    with pytest.raises(IndexError):
+        table.linha(2)
+
+
+def test_player_table_linhas(mock_fifa_players):
+    # Arrange
+    table = PlayerTable.from_players(mock_fifa_players)
+
+    # Act
+    linhas = list(table.linhas())
+
+    # Assert
+    assert [row.to_dict() for row in linhas] == table.to_dicts()
+    assert [row.id for row in linhas] == [212198, 209658]
+
+
+def test_player_table_concatenar_adds_season(mock_fifa_players):
+    # Arrange
+    fifa23 = PlayerTable.from_players(mock_fifa_players)
+    fifa22 = PlayerTable.from_players(mock_fifa_players[:1])
+
+    # Act
+    table = PlayerTable.concatenar({'FIFA23': fifa23, 'FIFA22': fifa22})
+
+    # Assert
+    assert len(table) == len(fifa23) + len(fifa22)
+    assert table.colunas[-1] == 'season'
+    assert table.coluna('season').tolist() == (
+        ['FIFA23'] * len(fifa23) + ['FIFA22'])
+    assert table.coluna('id').tolist() == (
+        fifa23.coluna('id').tolist() + fifa22.coluna('id').tolist())
+    assert table.linha(-1).to_player() == mock_fifa_players[0]
+
+
+def test_player_table_concatenar_keeps_common_columns(mock_fifa_players):
+    # Arrange
+    completa = PlayerTable.from_players(mock_fifa_players)
+    parcial = completa.take(np.arange(1))
+    projetada = PlayerTable({
+        nome: parcial.coluna(nome) for nome in ('id', 'name')})
+
+    # Act
+    table = PlayerTable.concatenar({'a': completa, 'b': projetada})
+
+    # Assert
+    assert table.colunas == ('id', 'name', 'season')
+
+
+def test_player_table_ordem_is_stable_and_cached():
+    # Arrange
+    table = PlayerTable({
+        'overall': np.array([80, 90, 80, 70]),
+        'club': np.array(['B', np.nan, 'A', 'B'], dtype=object),
+    })
+
+    # Act
+    crescente = table.ordem('overall')
+    decrescente = table.ordem('overall', descending=True)
+
+    # Assert
+    assert crescente.tolist() == [3, 0, 2, 1]
+    assert decrescente.tolist() == [1, 0, 2, 3]
+    assert table.ordem('club').tolist() == [2, 0, 3, 1]
+    assert table.ordem('club', descending=True).tolist() == [0, 3, 2, 1]
+    assert table.ordem('overall') is crescente
+    assert not crescente.flags.writeable
+
+
+def test_player_table_nbytes_does_not_wait_for_table_lock(mock_fifa_players):
+    # Arrange
+    table = PlayerTable.from_players(mock_fifa_players)
+
+    # Act
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with table._lock:
+            nbytes = executor.submit(lambda: table.nbytes).result(timeout=30)
+
+    # Assert
+    assert nbytes == table.nbytes > 0
@@ -1,11 +1,13 @@
 
-from datetime import datetime
+from datetime import date, datetime
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 from py_return_success_or_error import ErrorReturn, SuccessReturn
 
 from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.fifa_player import FifaPlayer
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import PlayerTable
 from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.usecase.ler_csv_fifa_usecase import LerCsvFifaUseCase
 from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError
 from streamlit_fifa_py_estudo.app.utils.parameters import LoadCsvParameters
@@ -15,7 +17,7 @@ from streamlit_fifa_py_estudo.app.utils.parameters import LoadCsvParameters
 
 @pytest.fixture
 def mock_fifa_players():
-    return [
+    return PlayerTable.from_players([
         FifaPlayer(
             id=1,
             name="L. Goretzka",
@@ -73,7 +75,7 @@ def mock_fifa_players():
             weight_kg=(154.35 * 0.453),
             release_clause=198900000.0,
         )
-    ]
+    ])
 
 
 def test_ler_csv_fifa_usecase_success(mock_fifa_players):
@@ -169,3 +171,111 @@ def test_ler_csv_fifa_usecase_excecao(monkeypatch):
     assert isinstance(result, ErrorReturn)
     assert isinstance(result.result, LoadCsvFifaError)
     assert "Erro simulado" in str(result.result.message)
+
+
+def test_ler_csv_fifa_usecase_as_of(mock_fifa_players):
+    # Arrange
+    parameters = LoadCsvParameters(
+        file_path="test.csv",
+        error=LoadCsvFifaError(),
+        as_of=date(2026, 6, 30),
+    )
+    usecase = LerCsvFifaUseCase(
+        datasource=Mock(return_value=mock_fifa_players))
+
+    # Act
+    teste = usecase(parameters)
+
+    # Assert
+    assert isinstance(teste, SuccessReturn)
+    assert [player['name'] for player in teste.result] == [
+        "Bruno Fernandes", "L. Goretzka"]
+    assert str(parameters) == (
+        "LoadCsvParameters(error=LoadCsvFifaError(message='Erro ao carregar "
+        "o arquivo CSV'), file_path='test.csv', "
+        "as_of=datetime.date(2026, 6, 30))")
+
+
+def test_ler_csv_fifa_usecase_custom_filters_and_sort(mock_fifa_players):
+    # Arrange
+    parameters = LoadCsvParameters(
+        file_path="test.csv",
+        error=LoadCsvFifaError(),
+        as_of=date(2023, 1, 1),
+        min_overall=80,
+        sort_by='wage',
+        descending=False,
+        filters=(lambda table: table.coluna('club') != "Manchester City",),
+    )
+    usecase = LerCsvFifaUseCase(
+        datasource=Mock(return_value=mock_fifa_players))
+
+    # Act
+    teste = usecase(parameters)
+
+    # Assert
+    assert isinstance(teste, SuccessReturn)
+    assert [player['name'] for player in teste.result] == ["Bruno Fernandes"]
+
+
+def test_ler_csv_fifa_usecase_descending_keeps_file_order_on_ties(
+        mock_fifa_players):
+    # Arrange
+    parameters = LoadCsvParameters(
+        file_path="test.csv",
+        error=LoadCsvFifaError(),
+        as_of=date(2023, 1, 1),
+        sort_by='age',
+    )
+    usecase = LerCsvFifaUseCase(
+        datasource=Mock(return_value=mock_fifa_players))
+
+    # Act
+    teste = usecase(parameters)
+
+    # Assert
+    assert [player['id'] for player in teste.result] == [3, 1, 2]
+
+
+@pytest.mark.parametrize('descending', [True, False])
+def test_ler_csv_fifa_usecase_sorts_missing_values_last(
+        mock_fifa_players, descending):
+    # Arrange
+    colunas = {nome: mock_fifa_players.coluna(nome)
+               for nome in mock_fifa_players.colunas}
+    colunas['wage'] = np.array([np.nan, 190000.0, 350000.0])
+    parameters = LoadCsvParameters(
+        file_path="test.csv",
+        error=LoadCsvFifaError(),
+        as_of=date(2023, 1, 1),
+        min_overall=0,
+        sort_by='wage',
+        descending=descending,
+    )
+    usecase = LerCsvFifaUseCase(
+        datasource=Mock(return_value=PlayerTable(colunas)))
+
+    # Act
+    teste = usecase(parameters)
+
+    # Assert
+    ids = [player['id'] for player in teste.result]
+    assert ids == ([3, 2, 1] if descending else [2, 3, 1])
+
+
+def test_ler_csv_fifa_usecase_invalid_sort_column(mock_fifa_players):
+    # Arrange
+    parameters = LoadCsvParameters(
+        file_path="test.csv",
+        error=LoadCsvFifaError(),
+        sort_by='inexistente',
+    )
+    usecase = LerCsvFifaUseCase(
+        datasource=Mock(return_value=mock_fifa_players))
+
+    # Act
+    teste = usecase(parameters)
+
+    # Assert
+    assert isinstance(teste, ErrorReturn)
+    assert isinstance(teste.result, LoadCsvFifaError)
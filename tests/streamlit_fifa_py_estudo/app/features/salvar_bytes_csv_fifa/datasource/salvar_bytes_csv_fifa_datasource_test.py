@@ -1,11 +1,24 @@
 
+from unittest.mock import Mock
+
+import pandas as pd
 import pytest
 
+import streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.datasource.salvar_bytes_csv_fifa_datasource as datasource_module
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.datasource.load_csv_pandas_datasource import (
+    LoadCsvPandasDatasource, )
 from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.datasource.salvar_bytes_csv_fifa_datasource import (
-    SalvarBytesCsvFifaDatasource, )
+    SalvarBytesCsvFifaDatasource,
+    validate_fifa_csv,
+    validate_fifa_csv_memorizado,
+)
+from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.domain.models.save_csv_result import (
+    SaveCsvResult, )
 from streamlit_fifa_py_estudo.app.utils.consts import PASTA_DATASETS
-from streamlit_fifa_py_estudo.app.utils.erros import SaveCsvFifaError
-from streamlit_fifa_py_estudo.app.utils.parameters import SaveCsvParameters
+from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError, SaveCsvFifaError
+from streamlit_fifa_py_estudo.app.utils.hashing import hash_bytes
+from streamlit_fifa_py_estudo.app.utils.parameters import LoadCsvParameters, SaveCsvParameters
+from streamlit_fifa_py_estudo.app.utils.sidecar import caminho_sidecar, ler_sidecar
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -14,6 +27,7 @@ def cleanup_fifa_mock():
     mock_file = PASTA_DATASETS / "fifa_mock.csv"
     if mock_file.exists():
         mock_file.unlink()
+    caminho_sidecar(mock_file).unlink(missing_ok=True)
 
 
 def get_mock_bytes_fifa() -> bytes:
@@ -56,11 +70,77 @@ def test_salvar_bytes_csv_fifa_datasource_with_mock_data():
     datasource = SalvarBytesCsvFifaDatasource()
     result = datasource(parameters)
     print()
-    print(result.absolute())
-    print(str(result))
+    print(result.path.absolute())
+    print(str(result.path))
+    # Assert
+    assert result.changed
+    assert result.path.exists()
+    assert str(result.path).endswith('fifa_mock.csv')
+    assert caminho_sidecar(result.path).exists()
+
+
+@pytest.mark.parametrize('bytes_csv', [
+    get_mock_bytes_fifa(),
+    # Sem a coluna de índice sem nome no início
+    b'\n'.join(linha.split(b',', 1)[1]
+                for linha in get_mock_bytes_fifa().splitlines()),
+], ids=['com_indice', 'sem_indice'])
+@pytest.mark.parametrize('engine', ['c', 'pyarrow'])
+def test_salvar_bytes_csv_fifa_datasource_sidecar_matches_csv(
+        bytes_csv, engine):
+    # Arrange
+    path = SalvarBytesCsvFifaDatasource()(SaveCsvParameters(
+        csv_name='fifa_mock', bytes_csv=bytes_csv,
+        error=SaveCsvFifaError())).path
+    parameters = LoadCsvParameters(
+        error=LoadCsvFifaError(), file_path=str(path), engine=engine)
+
+    # Act
+    do_sidecar = LoadCsvPandasDatasource()(parameters)
+    caminho_sidecar(path).unlink()
+    do_csv = LoadCsvPandasDatasource()(parameters)
+
+    # Assert
+    assert ler_sidecar(path) is None
+    assert len(do_sidecar) == 3
+    pd.testing.assert_frame_equal(do_sidecar.frame, do_csv.frame)
+
+
+def test_salvar_bytes_csv_fifa_datasource_same_content_skips_write(
+        monkeypatch):
+    # Arrange
+    parameters = SaveCsvParameters(
+        csv_name='fifa_mock',
+        bytes_csv=get_mock_bytes_fifa(),
+        error=SaveCsvFifaError())
+    datasource = SalvarBytesCsvFifaDatasource()
+    path = datasource(parameters).path
+    mtime = path.stat().st_mtime_ns
+    monkeypatch.setattr(
+        datasource_module, 'validate_fifa_csv', Mock(side_effect=AssertionError))
+
+    # Act
+    result = datasource(parameters)
+
+    # Assert
+    assert result == SaveCsvResult(path=path, changed=False)
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_validate_fifa_csv_memorizado_reuses_result(monkeypatch):
+    # Arrange
+    bytes_csv = get_mock_invalid_types_fifa() + b' '
+    validate = Mock(wraps=validate_fifa_csv)
+    monkeypatch.setattr(datasource_module, 'validate_fifa_csv', validate)
+
+    # Act
+    primeira = validate_fifa_csv_memorizado(bytes_csv)
+    segunda = validate_fifa_csv_memorizado(bytes_csv, hash_bytes(bytes_csv))
+
     # Assert
-    assert result.exists()
-    assert str(result).endswith('fifa_mock.csv')
+    assert primeira == segunda
+    assert not primeira[0]
+    assert validate.call_count == 1
 
 
 def test_salvar_bytes_csv_fifa_datasource_with_invalid_data():
@@ -110,3 +190,66 @@ def test_salvar_bytes_csv_fifa_datasource_read_error():
         datasource(parameters)
 
     assert "Erro ao ler CSV" in str(exc_info.value)
+
+
+def get_mock_bytes_fifa_repetido(linhas: int) -> bytes:
+    cabecalho, *registros = get_mock_bytes_fifa().decode('utf-8').splitlines()
+    corpo = [registros[i % len(registros)] for i in range(linhas)]
+    return '\n'.join([cabecalho, *corpo]).encode('utf-8')
+
+
+def test_validate_fifa_csv_missing_columns_before_parsing_rows():
+    # Arrange
+    bytes_csv = b'ID,Name\n' + b'"linha sem fim\n' * 1000
+
+    # Act
+    is_valid, error = validate_fifa_csv(bytes_csv)
+
+    # Assert
+    assert not is_valid
+    assert error.startswith('Colunas ausentes: Age, Photo')
+
+
+def test_validate_fifa_csv_reports_row_and_column(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(datasource_module, 'LINHAS_POR_CHUNK_VALIDACAO', 2)
+    linhas = get_mock_bytes_fifa_repetido(6).decode('utf-8').splitlines()
+    linhas[5] = linhas[5].replace(',27,', ',27.5,', 1)
+
+    # Act
+    is_valid, error = validate_fifa_csv('\n'.join(linhas).encode('utf-8'))
+
+    # Assert
+    assert not is_valid
+    assert error == ("Coluna Age tem tipo float64, esperado int64 "
+                     "(linha 6, valor '27.5')")
+
+
+def test_validate_fifa_csv_stops_at_first_invalid_chunk(monkeypatch):
+    # Arrange
+    monkeypatch.setattr(datasource_module, 'LINHAS_POR_CHUNK_VALIDACAO', 2)
+    linhas = get_mock_bytes_fifa_repetido(6).decode('utf-8').splitlines()
+    linhas[1] = linhas[1].replace(',87,', ',,', 1)
+    # Linha malformada em um chunk que não deve ser lido
+    linhas[6] = linhas[6].replace('M. Acuña', '"M. Acuña', 1)
+
+    # Act
+    is_valid, error = validate_fifa_csv('\n'.join(linhas).encode('utf-8'))
+
+    # Assert
+    assert not is_valid
+    assert error == ("Coluna Overall tem tipo float64, esperado int64 "
+                     "(linha 2, valor nan)")
+
+
+def test_validate_fifa_csv_malformed_row():
+    # Arrange
+    linhas = get_mock_bytes_fifa().decode('utf-8').splitlines()
+    linhas[3] = linhas[3].replace('M. Acuña', '"M. Acuña', 1)
+
+    # Act
+    is_valid, error = validate_fifa_csv('\n'.join(linhas).encode('utf-8'))
+
+    # Assert
+    assert not is_valid
+    assert error.startswith('Erro ao ler CSV')
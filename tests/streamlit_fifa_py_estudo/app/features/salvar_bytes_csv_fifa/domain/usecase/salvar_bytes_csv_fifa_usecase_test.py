@@ -3,6 +3,8 @@ from unittest.mock import Mock
 import pytest
 from py_return_success_or_error import ErrorReturn, SuccessReturn
 
+from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.domain.models.save_csv_result import (
+    SaveCsvResult, )
 from streamlit_fifa_py_estudo.app.features.salvar_bytes_csv_fifa.domain.usecase.salvar_bytes_csv_fifa_usecase import (
     SalvarBytesCsvFifaUsecase, )
 from streamlit_fifa_py_estudo.app.utils.consts import PASTA_DATASETS
@@ -12,7 +14,7 @@ from streamlit_fifa_py_estudo.app.utils.parameters import SaveCsvParameters
 
 @pytest.fixture
 def mock_path_file():
-    return PASTA_DATASETS / "fifa_mock.csv"
+    return SaveCsvResult(path=PASTA_DATASETS / "fifa_mock.csv", changed=True)
 
 
 def get_mock_bytes_fifa() -> bytes:
@@ -0,0 +1,24 @@
+import subprocess
+import sys
+
+import pytest
+
+PILHA_DADOS = ('pandas', 'numpy', 'pyarrow', 'py_return_success_or_error')
+
+
+@pytest.mark.parametrize('modulo', [
+    'streamlit_fifa_py_estudo.app.inicializacao',
+    'streamlit_fifa_py_estudo.app.utils.profiling',
+])
+def test_modulos_da_partida_nao_carregam_pilha_de_dados(modulo):
+    # Arrange
+    codigo = f'import sys, {modulo}; print(",".join(sys.modules))'
+
+    # Act
+    processo = subprocess.run(
+        [sys.executable, '-c', codigo],
+        capture_output=True, text=True, check=True)
+
+    # Assert
+    carregados = set(processo.stdout.strip().split(','))
+    assert carregados.isdisjoint(PILHA_DADOS)
@@ -0,0 +1,49 @@
+import numpy as np
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import (
+    PlayerTable, )
+from streamlit_fifa_py_estudo.app.ui.components.tabela_paginada import paginar
+
+
+def criar_tabela(linhas: int) -> PlayerTable:
+    return PlayerTable({
+        'id': np.arange(linhas),
+        'overall': np.arange(linhas) % 7,
+    })
+
+
+def test_paginar_fatia_na_ordem_da_tabela():
+    # Arrange
+    table = criar_tabela(23)
+
+    # Act
+    pagina = paginar(table, numero=3, tamanho=10)
+
+    # Assert
+    assert pagina.linhas.coluna('id').tolist() == [20, 21, 22]
+    assert (pagina.numero, pagina.total_paginas) == (3, 3)
+    assert (pagina.inicio, pagina.total_linhas) == (20, 23)
+
+
+def test_paginar_ordenado():
+    # Arrange
+    table = criar_tabela(23)
+
+    # Act
+    pagina = paginar(table, numero=1, tamanho=4, ordenar_por='overall',
+                     descending=True)
+
+    # Assert
+    assert pagina.linhas.coluna('overall').tolist() == [6, 6, 6, 5]
+    assert pagina.linhas.coluna('id').tolist() == [6, 13, 20, 5]
+
+
+def test_paginar_limita_numero_da_pagina():
+    # Arrange
+    table = criar_tabela(23)
+
+    # Act/Assert
+    assert paginar(table, numero=99, tamanho=10).numero == 3
+    assert paginar(table, numero=0, tamanho=10).numero == 1
+    vazia = paginar(criar_tabela(0), numero=2, tamanho=10)
+    assert (vazia.numero, vazia.total_paginas, len(vazia.linhas)) == (1, 1, 0)
@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from streamlit_fifa_py_estudo.app.utils.analisar_spans import (
+    arquivos_spans,
+    ler_spans,
+    main,
+    resumir_spans,
+)
+
+
+def gravar(path, registros):
+    path.write_text(
+        ''.join(json.dumps(registro) + '\n' for registro in registros),
+        encoding='utf-8')
+
+
+@pytest.fixture
+def arquivo(tmp_path):
+    arquivo = tmp_path / 'spans.jsonl'
+    gravar(arquivo.with_name('spans.jsonl.1'), [
+        {'etapa': 'datasource.ler_csv', 'inicio': 1.0, 'duracao_ms': ms,
+         'status': 'ok', 'rows': 100, 'bytes': 2000}
+        for ms in range(1, 101)
+    ])
+    gravar(arquivo, [
+        {'etapa': 'pagina.teams', 'inicio': 2.0, 'duracao_ms': 5.0,
+         'status': 'ok'},
+        {'etapa': 'pagina.teams', 'inicio': 3.0, 'duracao_ms': 7.0,
+         'status': 'erro', 'erro': 'KeyError'},
+    ])
+    with open(arquivo, 'a', encoding='utf-8') as linhas:
+        linhas.write('{"etapa": "incompleto"')
+    return arquivo
+
+
+def test_arquivos_spans_do_mais_antigo_ao_atual(arquivo):
+    # Act/Assert
+    assert [path.name for path in arquivos_spans(arquivo)] == [
+        'spans.jsonl.1', 'spans.jsonl']
+
+
+def test_resumir_spans_percentis_por_etapa(arquivo):
+    # Act
+    resumo = resumir_spans(ler_spans(arquivo))
+
+    # Assert
+    assert list(resumo.index) == ['datasource.ler_csv', 'pagina.teams']
+    leitura = resumo.loc['datasource.ler_csv']
+    assert (leitura['spans'], leitura['erros']) == (100, 0)
+    assert leitura['p50_ms'] == pytest.approx(50.5)
+    assert leitura['p95_ms'] == pytest.approx(95.05)
+    assert leitura['p99_ms'] == pytest.approx(99.01)
+    assert (leitura['rows'], leitura['bytes']) == (100, 2000)
+    assert resumo.loc['pagina.teams', 'erros'] == 1
+
+
+def test_main_filtra_por_etapa(arquivo, capsys):
+    # Act
+    main([str(arquivo), '--etapa', 'pagina'])
+
+    # Assert
+    saida = capsys.readouterr().out
+    assert 'pagina.teams' in saida
+    assert 'datasource.ler_csv' not in saida
+
+
+def test_main_sem_spans(tmp_path, capsys):
+    # Act
+    main([str(tmp_path / 'spans.jsonl')])
+
+    # Assert
+    assert 'Nenhum span encontrado' in capsys.readouterr().out
@@ -0,0 +1,187 @@
+import base64
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from streamlit_fifa_py_estudo.app.utils.asset_cache import AssetCache, buscar_url
+
+PNG = b'\x89PNG\r\n\x1a\n' + b'\x00' * 100
+
+buscar_local = partial(buscar_url, hosts=('127.0.0.1',), esquemas=('http',))
+"""Fetcher que aceita apenas o servidor local dos testes."""
+
+
+class ServidorImagens(SimpleHTTPRequestHandler):
+    """Serve a pasta de imagens e conta as requisições por caminho.
+
+    ``/redireciona`` responde com um redirecionamento para a mesma imagem
+    em ``localhost``, um host diferente do pedido.
+    """
+    requisicoes: dict = {}
+
+    def do_GET(self):
+        self.requisicoes[self.path] = self.requisicoes.get(self.path, 0) + 1
+        if self.path == '/redireciona':
+            self.send_response(302)
+            self.send_header(
+                'Location', f'http://localhost:{self.server.server_port}/1.png')
+            self.end_headers()
+            return
+        super().do_GET()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def servidor(tmp_path):
+    pasta = tmp_path / 'cdn'
+    pasta.mkdir()
+    for nome in ('1.png', '2.png', '3.png'):
+        (pasta / nome).write_bytes(PNG)
+    ServidorImagens.requisicoes = {}
+    httpd = ThreadingHTTPServer(
+        ('127.0.0.1', 0), partial(ServidorImagens, directory=str(pasta)))
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_port}', ServidorImagens.requisicoes
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_asset_cache_busca_cada_url_uma_vez(tmp_path, servidor):
+    # Arrange
+    base, requisicoes = servidor
+    cache = AssetCache(tmp_path / 'assets', fetcher=buscar_local)
+    urls = [f'{base}/1.png', f'{base}/2.png', f'{base}/1.png', float('nan')]
+
+    # Act
+    primeira = cache.obter_varios(urls, aguardar=True)
+    segunda = cache.obter_varios(urls)
+
+    # Assert
+    assert list(primeira) == [f'{base}/1.png', f'{base}/2.png']
+    assert primeira == segunda
+    assert all(caminho.read_bytes() == PNG for caminho in primeira.values())
+    assert requisicoes == {'/1.png': 1, '/2.png': 1}
+
+
+def test_asset_cache_falha_devolve_url_original(tmp_path, servidor):
+    # Arrange
+    base, requisicoes = servidor
+    cache = AssetCache(tmp_path / 'assets', fetcher=buscar_local)
+    url = f'{base}/nao_existe.png'
+
+    # Act
+    caminho = cache.obter(url, aguardar=True)
+    data_url = cache.data_url(url, aguardar=True)
+
+    # Assert
+    assert caminho is None
+    assert data_url == url
+    assert requisicoes == {'/nao_existe.png': 1}
+
+
+def test_asset_cache_data_url(tmp_path):
+    # Arrange
+    cache = AssetCache(tmp_path / 'assets', fetcher=lambda url: PNG)
+
+    # Act
+    data_url = cache.data_url(
+        'https://cdn.sofifa.net/flags/pt.png', aguardar=True)
+
+    # Assert
+    tipo, conteudo = data_url.split(',', 1)
+    assert tipo == 'data:image/png;base64'
+    assert base64.b64decode(conteudo) == PNG
+
+
+def test_asset_cache_remove_menos_usadas(tmp_path):
+    # Arrange
+    cache = AssetCache(
+        tmp_path / 'assets', max_bytes=2 * len(PNG), fetcher=lambda url: PNG)
+    cache.obter('https://cdn/1.png', aguardar=True)
+    cache.obter('https://cdn/2.png', aguardar=True)
+    cache.obter('https://cdn/1.png', aguardar=True)
+
+    # Act
+    cache.obter('https://cdn/3.png', aguardar=True)
+
+    # Assert
+    assert cache.caminho('https://cdn/1.png').exists()
+    assert not cache.caminho('https://cdn/2.png').exists()
+    assert cache.caminho('https://cdn/3.png').exists()
+
+
+def test_asset_cache_reaproveita_pasta_existente(tmp_path):
+    # Arrange
+    AssetCache(tmp_path / 'assets', fetcher=lambda url: PNG).obter(
+        'https://cdn/1.png', aguardar=True)
+    cache = AssetCache(
+        tmp_path / 'assets', fetcher=lambda url: pytest.fail(url))
+
+    # Act
+    caminho = cache.obter('https://cdn/1.png')
+
+    # Assert
+    assert caminho.read_bytes() == PNG
+
+
+def test_asset_cache_nao_espera_a_busca(tmp_path):
+    # Arrange
+    liberar = threading.Event()
+
+    def buscar_devagar(url):
+        liberar.wait(timeout=30)
+        return PNG
+
+    cache = AssetCache(tmp_path / 'assets', fetcher=buscar_devagar)
+    url = 'https://cdn.sofifa.net/flags/pt.png'
+
+    # Act
+    pendente = cache.obter(url)
+    data_url = cache.data_url(url)
+    liberar.set()
+    caminho = cache.obter(url, aguardar=True)
+
+    # Assert
+    assert pendente is None
+    assert data_url == url
+    assert caminho.read_bytes() == PNG
+
+
+@pytest.mark.parametrize('url', [
+    'file:///etc/passwd',
+    'http://cdn.sofifa.net/flags/pt.png',
+    'https://169.254.169.254/latest/meta-data/',
+    'https://cdn.sofifa.net.exemplo.com/flags/pt.png',
+])
+def test_buscar_url_recusa_url_fora_da_cdn(url):
+    # Act/Assert
+    with pytest.raises(ValueError):
+        buscar_url(url)
+
+
+def test_buscar_url_recusa_redirecionamento_para_outro_host(servidor):
+    # Arrange
+    base, requisicoes = servidor
+
+    # Act/Assert
+    with pytest.raises(ValueError):
+        buscar_local(f'{base}/redireciona')
+    assert requisicoes == {'/redireciona': 1}
+
+
+def test_asset_cache_data_url_de_imagem_removida(tmp_path):
+    # Arrange
+    cache = AssetCache(tmp_path / 'assets', fetcher=lambda url: PNG)
+    url = 'https://cdn.sofifa.net/flags/pt.png'
+    cache.obter(url, aguardar=True).unlink()
+
+    # Act
+    data_url = cache.data_url(url)
+
+    # Assert
+    assert data_url == url
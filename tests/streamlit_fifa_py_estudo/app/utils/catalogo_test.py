@@ -0,0 +1,162 @@
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pandas as pd
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import PlayerTable
+from streamlit_fifa_py_estudo.app.utils.catalogo import CatalogoDatasets, DatasetInfo
+from streamlit_fifa_py_estudo.app.utils.hashing import hash_arquivo
+from streamlit_fifa_py_estudo.app.utils.sidecar import escrever_sidecar
+
+MOCK_DATA_CSV = Path(__file__).parents[1] / 'datasets' / 'mock_data.csv'
+
+
+def copiar_mock(pasta: Path, nome: str) -> Path:
+    destino = pasta / f'{nome}.csv'
+    shutil.copy(MOCK_DATA_CSV, destino)
+    return destino
+
+
+def avancar_mtime(path: Path):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_catalogo_lista_metadados(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path, 'fifa')
+    (tmp_path / 'notas.txt').write_text('ignorado')
+    catalogo = CatalogoDatasets(tmp_path)
+
+    # Act
+    datasets = catalogo.listar()
+
+    # Assert
+    assert [info.name for info in datasets] == ['fifa']
+    info = datasets[0]
+    assert info.size == csv.stat().st_size
+    assert info.content_hash == hash_arquivo(csv)
+    assert info.rows == 3
+    assert info.columns[:3] == ('Unnamed: 0', 'ID', 'Name')
+    assert (info.clubs, info.nationalities) == (3, 3)
+
+
+def test_catalogo_usa_sidecar_quando_atualizado(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path, 'fifa')
+    escrever_sidecar(
+        PlayerTable.from_csv_frame(pd.read_csv(csv, index_col=0)), csv)
+    catalogo = CatalogoDatasets(tmp_path)
+
+    # Act
+    with patch('pandas.read_csv', wraps=pd.read_csv) as read_csv:
+        info = catalogo.obter('fifa')
+
+    # Assert
+    assert info.rows == 3
+    assert (info.clubs, info.nationalities) == (3, 3)
+    read_csv.assert_called_once()
+    assert read_csv.call_args.kwargs == {'nrows': 0}
+
+
+def test_catalogo_nao_varre_pasta_inalterada(tmp_path):
+    # Arrange
+    copiar_mock(tmp_path, 'fifa')
+    catalogo = CatalogoDatasets(tmp_path)
+    catalogo.listar()
+
+    # Act
+    with patch('os.scandir', side_effect=AssertionError):
+        datasets = catalogo.listar()
+
+    # Assert
+    assert [info.name for info in datasets] == ['fifa']
+
+
+def test_catalogo_detecta_arquivos_novos_e_removidos(tmp_path):
+    # Arrange
+    antigo = copiar_mock(tmp_path, 'b')
+    catalogo = CatalogoDatasets(tmp_path)
+    catalogo.listar()
+
+    # Act
+    antigo.unlink()
+    copiar_mock(tmp_path, 'c')
+    copiar_mock(tmp_path, 'a')
+    avancar_mtime(tmp_path)
+
+    # Assert
+    assert [info.name for info in catalogo.listar()] == ['a', 'c']
+
+
+def test_catalogo_persiste_manifesto(tmp_path):
+    # Arrange
+    copiar_mock(tmp_path, 'fifa')
+    esperado = CatalogoDatasets(tmp_path).listar()
+
+    # Act
+    with patch.object(DatasetInfo, 'from_path', side_effect=AssertionError):
+        with patch('os.scandir', side_effect=AssertionError):
+            datasets = CatalogoDatasets(tmp_path).listar()
+
+    # Assert
+    assert datasets == esperado
+
+
+def test_catalogo_invalidar_reconfere_arquivos(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path, 'fifa')
+    catalogo = CatalogoDatasets(tmp_path)
+    antes = catalogo.obter('fifa')
+    linhas = csv.read_text(encoding='utf-8').splitlines()
+    csv.write_text('\n'.join(linhas[:-1]), encoding='utf-8')
+    avancar_mtime(csv)
+
+    # Act
+    catalogo.invalidar()
+    depois = catalogo.obter('fifa')
+
+    # Assert
+    assert antes.rows == 3
+    assert depois.rows == 2
+    assert depois.content_hash != antes.content_hash
+
+
+def test_catalogo_arquivo_invalido(tmp_path):
+    # Arrange
+    (tmp_path / 'vazio.csv').write_bytes(b'')
+
+    # Act
+    info = CatalogoDatasets(tmp_path).obter('vazio')
+
+    # Assert
+    assert (info.rows, info.columns, info.clubs) == (0, (), None)
+
+
+def test_catalogo_pasta_inexistente(tmp_path):
+    # Act/Assert
+    assert CatalogoDatasets(tmp_path / 'nao_existe').listar() == []
+
+
+def test_catalogo_ignora_arquivo_que_falha_na_leitura(tmp_path, caplog):
+    # Arrange
+    copiar_mock(tmp_path, 'fifa')
+    copiar_mock(tmp_path, 'corrompido')
+    catalogo = CatalogoDatasets(tmp_path)
+    from_path = DatasetInfo.from_path
+
+    def falhar_no_corrompido(path):
+        if path.stem == 'corrompido':
+            raise UnicodeDecodeError('utf-8', b'\xff', 0, 1, 'invalid')
+        return from_path(path)
+
+    # Act
+    with patch.object(DatasetInfo, 'from_path',
+                      side_effect=falhar_no_corrompido):
+        datasets = catalogo.listar()
+
+    # Assert
+    assert [info.name for info in datasets] == ['fifa']
+    assert 'corrompido.csv' in caplog.text
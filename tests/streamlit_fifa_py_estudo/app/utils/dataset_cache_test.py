@@ -0,0 +1,325 @@
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from streamlit_fifa_py_estudo.app.utils.dataset_cache import DatasetCache, DatasetKey
+from streamlit_fifa_py_estudo.app.utils.erros import LoadCsvFifaError
+
+
+def criar_arquivo(pasta, nome: str, conteudo: bytes = b"ID\n1\n"):
+    arquivo = pasta / nome
+    arquivo.write_bytes(conteudo)
+    return arquivo
+
+
+def reescrever(arquivo, conteudo: bytes):
+    arquivo.write_bytes(conteudo)
+    stat = os.stat(arquivo)
+    os.utime(arquivo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_dataset_cache_loads_once_and_counts_hits(tmp_path):
+    # Arrange
+    cache = DatasetCache(max_entries=2)
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+    loader = Mock(return_value=SimpleNamespace(nbytes=10))
+
+    # Act
+    primeiro = cache.get_or_load(arquivo, loader)
+    segundo = cache.get_or_load(arquivo, loader)
+
+    # Assert
+    assert primeiro is segundo
+    loader.assert_called_once()
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries, stats.bytes) == (1, 1, 1, 10)
+
+
+def test_dataset_cache_reloads_when_file_changes(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+    cache.get_or_load(arquivo, lambda: SimpleNamespace(nbytes=10))
+
+    # Act
+    reescrever(arquivo, b"ID\n2\n")
+    novo = cache.get_or_load(arquivo, lambda: SimpleNamespace(nbytes=20))
+
+    # Assert
+    assert novo.nbytes == 20
+    stats = cache.stats()
+    assert (stats.misses, stats.entries, stats.bytes) == (2, 1, 20)
+
+
+def test_dataset_cache_evicts_least_recently_used_entry(tmp_path):
+    # Arrange
+    cache = DatasetCache(max_entries=2)
+    a = criar_arquivo(tmp_path, "a.csv", b"a")
+    b = criar_arquivo(tmp_path, "b.csv", b"b")
+    c = criar_arquivo(tmp_path, "c.csv", b"c")
+    cache.get_or_load(a, lambda: "a")
+    cache.get_or_load(b, lambda: "b")
+    cache.get_or_load(a, lambda: "a")
+
+    # Act
+    cache.get_or_load(c, lambda: "c")
+    loader_b = Mock(return_value="b")
+    loader_a = Mock(return_value="a")
+    cache.get_or_load(a, loader_a)
+    cache.get_or_load(b, loader_b)
+
+    # Assert
+    loader_a.assert_not_called()
+    loader_b.assert_called_once()
+    assert cache.stats().evictions == 2
+
+
+def test_dataset_cache_respects_byte_budget(tmp_path):
+    # Arrange
+    cache = DatasetCache(max_entries=10, max_bytes=100)
+    a = criar_arquivo(tmp_path, "a.csv", b"a")
+    b = criar_arquivo(tmp_path, "b.csv", b"b")
+    grande = criar_arquivo(tmp_path, "grande.csv", b"g")
+
+    # Act
+    cache.get_or_load(a, lambda: SimpleNamespace(nbytes=60))
+    cache.get_or_load(b, lambda: SimpleNamespace(nbytes=60))
+    cache.get_or_load(grande, lambda: SimpleNamespace(nbytes=500))
+
+    # Assert
+    stats = cache.stats()
+    assert (stats.entries, stats.bytes, stats.evictions) == (1, 60, 1)
+
+
+def test_dataset_cache_counts_entries_that_grow_after_stored(tmp_path):
+    # Arrange
+    cache = DatasetCache(max_entries=10, max_bytes=100)
+    a = criar_arquivo(tmp_path, "a.csv", b"a")
+    b = criar_arquivo(tmp_path, "b.csv", b"b")
+    crescente = cache.get_or_load(a, lambda: SimpleNamespace(nbytes=30))
+
+    # Act
+    crescente.nbytes = 80
+    bytes_apos_crescer = cache.stats().bytes
+    cache.get_or_load(b, lambda: SimpleNamespace(nbytes=30))
+
+    # Assert
+    stats = cache.stats()
+    assert bytes_apos_crescer == 80
+    assert (stats.entries, stats.bytes, stats.evictions) == (1, 30, 1)
+    assert not cache.contains(a)
+
+
+def test_dataset_cache_invalidate(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+    cache.get_or_load(arquivo, lambda: "antigo")
+
+    # Act
+    removidas = cache.invalidate(arquivo)
+    loader = Mock(return_value="novo")
+    resultado = cache.get_or_load(arquivo, loader)
+
+    # Assert
+    assert removidas == 1
+    assert resultado == "novo"
+    assert cache.stats().invalidations == 1
+
+
+def test_dataset_cache_does_not_store_errors(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        cache.get_or_load(arquivo, Mock(side_effect=ValueError("falha")))
+    assert cache.get_or_load(arquivo, lambda: "ok") == "ok"
+    assert cache.stats().entries == 1
+
+
+def test_dataset_key_from_path(tmp_path):
+    # Arrange
+    arquivo = criar_arquivo(tmp_path, "a.csv", b"abc")
+
+    # Act
+    key = DatasetKey.from_path(arquivo)
+
+    # Assert
+    assert key.path == str(arquivo.resolve())
+    assert key.size == 3
+    assert key == DatasetKey.from_path(arquivo)
+
+
+def test_dataset_cache_keeps_variants_of_same_version(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+    completo = cache.get_or_load(arquivo, lambda: "completo")
+
+    # Act
+    parcial = cache.get_or_load(arquivo, lambda: "parcial", "club='X'")
+
+    # Assert
+    assert (completo, parcial) == ("completo", "parcial")
+    assert cache.get_or_load(arquivo, Mock()) == "completo"
+    assert cache.stats().entries == 2
+
+
+def test_dataset_cache_new_version_drops_all_variants(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+    cache.get_or_load(arquivo, lambda: "completo")
+    cache.get_or_load(arquivo, lambda: "parcial", "club='X'")
+
+    # Act
+    reescrever(arquivo, b"ID\n2\n")
+    cache.get_or_load(arquivo, lambda: "novo")
+
+    # Assert
+    assert cache.stats().entries == 1
+    assert cache.invalidate(arquivo) == 1
+
+
+def test_dataset_cache_slow_old_version_does_not_replace_new(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+
+    def carga_lenta():
+        # O arquivo é sobrescrito e a nova versão é lida antes desta terminar
+        reescrever(arquivo, b"ID\n2\n")
+        cache.get_or_load(arquivo, lambda: "novo")
+        return "antigo"
+
+    # Act
+    antigo = cache.get_or_load(arquivo, carga_lenta)
+
+    # Assert
+    assert antigo == "antigo"
+    assert cache.get_or_load(arquivo, Mock()) == "novo"
+    assert cache.stats().entries == 1
+
+
+def carregar_em_paralelo(cache, arquivo, loader, leituras: int):
+    """Dispara as leituras e libera o loader quando todas estão aguardando."""
+    liberar = threading.Event()
+
+    def bloqueado():
+        liberar.wait(timeout=30)
+        return loader()
+
+    def ler():
+        try:
+            return cache.get_or_load(arquivo, bloqueado)
+        except LoadCsvFifaError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=leituras) as executor:
+        futures = [executor.submit(ler) for _ in range(leituras)]
+        prazo = time.monotonic() + 30
+        while (cache.stats().coalesced < leituras - 1
+               and time.monotonic() < prazo):
+            time.sleep(0.01)
+        liberar.set()
+        return [future.result(timeout=30) for future in futures]
+
+
+def test_dataset_cache_coalesces_concurrent_loads(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+    loader = Mock(return_value=SimpleNamespace(nbytes=10))
+
+    # Act
+    resultados = carregar_em_paralelo(cache, arquivo, loader, leituras=8)
+
+    # Assert
+    loader.assert_called_once()
+    assert all(resultado is resultados[0] for resultado in resultados)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.coalesced) == (0, 1, 7)
+    assert cache.get_or_load(arquivo, loader) is resultados[0]
+
+
+def test_dataset_cache_coalesced_error_reaches_every_waiter(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+    erro = LoadCsvFifaError('CSV inválido')
+    loader = Mock(side_effect=erro)
+
+    # Act
+    resultados = carregar_em_paralelo(cache, arquivo, loader, leituras=8)
+
+    # Assert
+    loader.assert_called_once()
+    assert all(resultado is erro for resultado in resultados)
+    assert cache.stats().entries == 0
+    assert cache.get_or_load(arquivo, lambda: "ok") == "ok"
+
+
+def test_dataset_cache_measures_entries_outside_lock(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    a = criar_arquivo(tmp_path, "a.csv", b"a")
+    b = criar_arquivo(tmp_path, "b.csv", b"b")
+    medindo = threading.Event()
+    liberar = threading.Event()
+
+    class Lenta:
+        lenta = False
+
+        @property
+        def nbytes(self):
+            if self.lenta:
+                medindo.set()
+                liberar.wait(timeout=30)
+            return 10
+
+    lenta = cache.get_or_load(a, Lenta)
+    pronta = cache.get_or_load(b, lambda: SimpleNamespace(nbytes=5))
+    lenta.lenta = True
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        stats = executor.submit(cache.stats)
+        assert medindo.wait(timeout=30)
+        try:
+            encontrada = executor.submit(
+                cache.get_or_load, b, Mock()).result(timeout=5)
+        finally:
+            liberar.set()
+
+    # Assert
+    assert encontrada is pronta
+    assert stats.result(timeout=30).bytes == 15
+
+
+def test_dataset_cache_store_error_reaches_every_waiter(tmp_path):
+    # Arrange
+    cache = DatasetCache()
+    arquivo = criar_arquivo(tmp_path, "a.csv")
+    erro = LoadCsvFifaError('Tamanho indisponível')
+
+    class SemTamanho:
+        @property
+        def nbytes(self):
+            raise erro
+
+    # Act
+    resultados = carregar_em_paralelo(
+        cache, arquivo, SemTamanho, leituras=4)
+
+    # Assert
+    assert all(resultado is erro for resultado in resultados)
+    assert cache.stats().entries == 0
+    assert cache.get_or_load(arquivo, lambda: "ok") == "ok"
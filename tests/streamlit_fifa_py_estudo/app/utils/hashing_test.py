@@ -0,0 +1,34 @@
+
+import os
+
+from streamlit_fifa_py_estudo.app.utils.hashing import hash_arquivo, hash_bytes
+
+
+def test_hash_arquivo_matches_hash_bytes(tmp_path):
+    # Arrange
+    arquivo = tmp_path / "dados.csv"
+    arquivo.write_bytes(b"ID,Name\n1,Messi\n")
+
+    # Act
+    resultado = hash_arquivo(arquivo)
+
+    # Assert
+    assert resultado == hash_bytes(b"ID,Name\n1,Messi\n")
+    assert resultado != hash_bytes(b"ID,Name\n2,Messi\n")
+
+
+def test_hash_arquivo_detects_rewritten_content(tmp_path):
+    # Arrange
+    arquivo = tmp_path / "dados.csv"
+    arquivo.write_bytes(b"ID,Name\n1,Messi\n")
+    primeiro = hash_arquivo(arquivo)
+
+    # Act
+    arquivo.write_bytes(b"ID,Name\n1,Pele!\n")
+    stat = os.stat(arquivo)
+    os.utime(arquivo, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    segundo = hash_arquivo(arquivo)
+
+    # Assert
+    assert primeiro != segundo
+    assert segundo == hash_bytes(b"ID,Name\n1,Pele!\n")
@@ -0,0 +1,121 @@
+import pstats
+from types import SimpleNamespace
+
+import pytest
+
+from streamlit_fifa_py_estudo.app.utils import profiling
+from streamlit_fifa_py_estudo.app.utils.consts import (
+    PARAMETRO_PERFIL,
+    VARIAVEL_PERFIL,
+    VARIAVEL_PERFIL_URL,
+)
+from streamlit_fifa_py_estudo.app.utils.profiling import (
+    perfil_ativo,
+    perfilar_rerun,
+)
+
+
+def alocar_jogadores():
+    return [f'jogador {numero}' for numero in range(10_000)]
+
+
+def test_perfil_desligado_nao_grava(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.delenv(VARIAVEL_PERFIL, raising=False)
+
+    # Act
+    with perfilar_rerun(tmp_path) as destino:
+        alocar_jogadores()
+
+    # Assert
+    assert not perfil_ativo()
+    assert destino is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_perfil_grava_estatisticas_e_alocacoes(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.setenv(VARIAVEL_PERFIL, '1')
+
+    # Act
+    with perfilar_rerun(tmp_path) as destino:
+        alocar_jogadores()
+
+    # Assert
+    assert destino.exists()
+    funcoes = pstats.Stats(str(destino)).stats
+    assert any(nome == 'alocar_jogadores' for _, _, nome in funcoes)
+    resumo = destino.with_suffix('.txt').read_text(encoding='utf-8')
+    assert 'alocações de memória' in resumo
+    assert 'profiling_test.py' in resumo
+
+
+def test_perfil_grava_mesmo_com_erro(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.setenv(VARIAVEL_PERFIL, 'true')
+
+    # Act
+    with pytest.raises(KeyError):
+        with perfilar_rerun(tmp_path) as destino:
+            {}['club']
+
+    # Assert
+    assert destino.exists()
+
+
+def test_perfil_mantem_os_mais_recentes(tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.setenv(VARIAVEL_PERFIL, '1')
+
+    # Act
+    destinos = []
+    for _ in range(4):
+        with perfilar_rerun(tmp_path, maximo=2) as destino:
+            destinos.append(destino)
+
+    # Assert
+    assert sorted(tmp_path.glob('*.prof')) == destinos[-2:]
+    assert len(list(tmp_path.glob('*.txt'))) == 2
+
+
+@pytest.fixture
+def url_com_perfil(monkeypatch):
+    """Simula um rerun do Streamlit aberto com ``?profile=1``."""
+    monkeypatch.delenv(VARIAVEL_PERFIL, raising=False)
+    monkeypatch.setattr(
+        profiling, 'get_script_run_ctx', lambda **_: SimpleNamespace())
+    monkeypatch.setattr(profiling, 'st', SimpleNamespace(
+        query_params={PARAMETRO_PERFIL: '1'}))
+
+
+def test_perfil_pela_url_exige_permissao_do_servidor(
+        monkeypatch, url_com_perfil):
+    # Arrange
+    monkeypatch.delenv(VARIAVEL_PERFIL_URL, raising=False)
+
+    # Act
+    sem_permissao = perfil_ativo()
+    monkeypatch.setenv(VARIAVEL_PERFIL_URL, '1')
+    com_permissao = perfil_ativo()
+
+    # Assert
+    assert not sem_permissao
+    assert com_permissao
+
+
+def test_perfil_mantem_os_mais_recentes_de_todas_as_sessoes(
+        tmp_path, monkeypatch):
+    # Arrange
+    monkeypatch.setenv(VARIAVEL_PERFIL, '1')
+
+    # Act
+    destinos = []
+    for sessao in ('a', 'b', 'a', 'b'):
+        with perfilar_rerun(tmp_path / sessao, maximo=10, raiz=tmp_path,
+                            maximo_total=3) as destino:
+            destinos.append(destino)
+
+    # Assert
+    mantidos = sorted(tmp_path.glob('*/*.prof'), key=lambda p: p.name)
+    assert mantidos == destinos[-3:]
+    assert len(list(tmp_path.glob('*/*.txt'))) == 3
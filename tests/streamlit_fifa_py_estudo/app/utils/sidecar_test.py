@@ -0,0 +1,176 @@
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from streamlit_fifa_py_estudo.app.features.ler_csv_fifa.domain.models.player_table import PlayerTable
+from streamlit_fifa_py_estudo.app.utils.sidecar import (
+    ColunaArrow,
+    caminho_sidecar,
+    escrever_sidecar,
+    ler_sidecar,
+)
+
+MOCK_DATA_CSV = Path(__file__).parents[1] / 'datasets' / 'mock_data.csv'
+
+
+def copiar_mock(pasta: Path) -> Path:
+    destino = pasta / 'fifa.csv'
+    shutil.copy(MOCK_DATA_CSV, destino)
+    return destino
+
+
+def test_sidecar_round_trip(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+    table = PlayerTable.from_csv_frame(pd.read_csv(csv, index_col=0))
+
+    # Act
+    destino = escrever_sidecar(table, csv)
+    lida = ler_sidecar(csv)
+
+    # Assert
+    assert destino == tmp_path / 'fifa.feather'
+    assert lida is not None
+    assert lida.to_dicts() == table.to_dicts()
+    for nome in table.colunas:
+        assert lida.coluna(nome).dtype == table.coluna(nome).dtype
+
+
+def test_sidecar_keeps_missing_values(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+    df = pd.read_csv(csv, index_col=0)
+    df.loc[0, 'Club'] = np.nan
+    df.loc[1, 'Joined'] = np.nan
+    table = PlayerTable.from_csv_frame(df)
+
+    # Act
+    escrever_sidecar(table, csv)
+    lida = ler_sidecar(csv)
+
+    # Assert
+    assert pd.isna(lida.coluna('club')[0])
+    assert isinstance(lida.coluna('club')[0], float)
+    assert lida.coluna('joined')[1] is None
+
+
+def test_sidecar_is_ignored_when_csv_changes(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+    table = PlayerTable.from_csv_frame(pd.read_csv(csv, index_col=0))
+    escrever_sidecar(table, csv)
+
+    # Act
+    csv.write_bytes(csv.read_bytes() + b'\n')
+
+    # Assert
+    assert ler_sidecar(csv) is None
+
+
+def test_sidecar_missing(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+
+    # Act & Assert
+    assert not caminho_sidecar(csv).exists()
+    assert ler_sidecar(csv) is None
+
+
+def test_sidecar_memory_map_exposes_columns_without_copy(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+    table = PlayerTable.from_csv_frame(pd.read_csv(csv, index_col=0))
+    escrever_sidecar(table, csv)
+    alocado = pa.total_allocated_bytes()
+
+    # Act
+    mapeada = ler_sidecar(csv, memory_map=True)
+
+    # Assert
+    assert pa.total_allocated_bytes() == alocado
+    assert isinstance(mapeada._colunas['name'], ColunaArrow)
+    assert not mapeada.coluna('overall').flags.writeable
+    assert mapeada[1] == table[1]
+    assert isinstance(mapeada._colunas['name'], ColunaArrow)
+    assert mapeada.to_dicts() == table.to_dicts()
+    assert mapeada.frame.equals(table.frame)
+
+
+def test_sidecar_memory_map_large_table_without_copy(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+    table = PlayerTable.from_csv_frame(pd.read_csv(csv, index_col=0))
+    table = table.take(np.arange(70_000) % len(table))
+    destino = escrever_sidecar(table, csv)
+    alocado = pa.total_allocated_bytes()
+
+    # Act
+    mapeada = ler_sidecar(csv, memory_map=True)
+    idades = mapeada.coluna('age')
+
+    # Assert
+    with pa.OSFile(str(destino)) as arquivo:
+        assert pa.ipc.open_file(arquivo).num_record_batches == 1
+    assert pa.total_allocated_bytes() == alocado
+    assert not idades.flags.owndata
+    assert np.array_equal(idades, table.coluna('age'))
+
+
+def test_sidecar_memory_map_take_keeps_text_columns_lazy(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+    df = pd.read_csv(csv, index_col=0)
+    df.loc[2, 'Club'] = np.nan
+    table = PlayerTable.from_csv_frame(df)
+    escrever_sidecar(table, csv)
+    mapeada = ler_sidecar(csv, memory_map=True)
+    posicoes = np.array([2, 0])
+
+    # Act
+    selecionada = mapeada.take(posicoes).take(np.array([1, 0]))
+
+    # Assert
+    assert isinstance(selecionada._colunas['club'], ColunaArrow)
+    assert selecionada[1]['club'] != selecionada[1]['club']
+    esperada = table.take(posicoes).take(np.array([1, 0]))
+    assert selecionada.coluna('name').tolist() == esperada.coluna(
+        'name').tolist()
+    assert pd.isna(selecionada.coluna('club')[1])
+
+
+def test_sidecar_memory_map_take_slice(tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+    table = PlayerTable.from_csv_frame(pd.read_csv(csv, index_col=0))
+    escrever_sidecar(table, csv)
+    mapeada = ler_sidecar(csv, memory_map=True)
+
+    # Act
+    fatia = mapeada.take(slice(1, 3))
+
+    # Assert
+    assert isinstance(fatia._colunas['photo'], ColunaArrow)
+    assert fatia.to_dicts() == table.to_dicts()[1:3]
+
+
+def test_sidecar_memory_map_counts_text_columns_at_materialized_size(
+        tmp_path):
+    # Arrange
+    csv = copiar_mock(tmp_path)
+    table = PlayerTable.from_csv_frame(pd.read_csv(csv, index_col=0))
+    escrever_sidecar(table, csv)
+    mapeada = ler_sidecar(csv, memory_map=True)
+
+    # Act
+    antes = mapeada.nbytes
+    mapeada.frame
+
+    # Assert
+    assert isinstance(ler_sidecar(csv, memory_map=True)._colunas['name'],
+                      ColunaArrow)
+    assert 0.8 * table.nbytes <= antes <= 1.5 * table.nbytes
+    assert mapeada.nbytes == antes
@@ -0,0 +1,77 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from streamlit_fifa_py_estudo.app.features.features_presenter import FeaturesPresenter
+from streamlit_fifa_py_estudo.app.utils.dataset_cache import DATASET_CACHE
+from streamlit_fifa_py_estudo.app.utils.tracing import configurar_tracing, span
+
+MOCK_DATA_CSV = Path(__file__).parents[1] / 'datasets' / 'mock_data.csv'
+
+
+@pytest.fixture
+def arquivo_spans(tmp_path, spans_em_pasta_temporaria):
+    arquivo = tmp_path / 'spans.jsonl'
+    configurar_tracing(arquivo)
+    yield arquivo
+    configurar_tracing(spans_em_pasta_temporaria)
+    DATASET_CACHE.clear()
+
+
+def ler(arquivo):
+    return [json.loads(linha) for linha in arquivo.read_text().splitlines()]
+
+
+def test_span_grava_duracao_e_atributos(arquivo_spans):
+    # Act
+    with span('etapa.teste', engine='c') as atual:
+        atual.registrar(rows=3, bytes=10)
+
+    # Assert
+    [registro] = ler(arquivo_spans)
+    assert registro['etapa'] == 'etapa.teste'
+    assert registro['status'] == 'ok'
+    assert (registro['engine'], registro['rows'], registro['bytes']) == (
+        'c', 3, 10)
+    assert registro['duracao_ms'] >= 0
+
+
+def test_span_registra_erro_e_repassa_excecao(arquivo_spans):
+    # Act
+    with pytest.raises(KeyError):
+        with span('etapa.teste'):
+            raise KeyError('x')
+
+    # Assert
+    [registro] = ler(arquivo_spans)
+    assert (registro['status'], registro['erro']) == ('erro', 'KeyError')
+
+
+def test_span_rotaciona_arquivo(arquivo_spans):
+    # Arrange
+    configurar_tracing(arquivo_spans, max_bytes=300, backups=2)
+
+    # Act
+    for _ in range(20):
+        with span('etapa.teste'):
+            pass
+
+    # Assert
+    assert sorted(path.name for path in arquivo_spans.parent.iterdir()) == [
+        'spans.jsonl', 'spans.jsonl.1', 'spans.jsonl.2']
+
+
+def test_spans_da_leitura_pelo_presenter(arquivo_spans):
+    # Act
+    table = FeaturesPresenter().ler_csv_fifa(str(MOCK_DATA_CSV))
+
+    # Assert
+    registros = {registro['etapa']: registro for registro in ler(arquivo_spans)}
+    assert set(registros) == {
+        'presenter.ler_csv_fifa', 'usecase.filtrar', 'datasource.ler_csv'}
+    assert registros['presenter.ler_csv_fifa']['rows'] == len(table)
+    assert registros['datasource.ler_csv']['origem'] == 'csv'
+    assert registros['datasource.ler_csv']['rows'] == 3
+    assert registros['datasource.ler_csv']['bytes'] == (
+        MOCK_DATA_CSV.stat().st_size)